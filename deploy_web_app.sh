@@ -409,7 +409,9 @@ deploy_production() {
     print_status "WebSocket SSH server at: ws://localhost:8022"
     print_status "Virtual environment: $VIRTUAL_ENV"
     
-    gunicorn --bind 0.0.0.0:5000 --workers 4 --timeout 120 app:app
+    # /api/stream clients hold a thread each (STREAM_MAX_CLIENTS per worker), so use threaded workers
+    # /api/stream 클라이언트가 스레드를 점유하므로 스레드 워커 사용
+    gunicorn --bind 0.0.0.0:5000 --workers 4 --threads 16 --timeout 120 app:app
 }
 
 # Deploy using Docker / Docker를 사용하여 배포
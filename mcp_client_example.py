@@ -65,6 +65,10 @@ class IOCMonitorClient:
         """모든 IOC 상세 정보 조회"""
         return self._make_request("GET", "/api/alive/ioc_details")
     
+    def get_ioc_details_since(self, version: int) -> Dict[str, Any]:
+        """스냅샷 버전 이후 추가/변경/삭제된 IOC 상세 정보만 조회"""
+        return self._make_request("GET", "/api/alive/ioc_details", params={"since": version})
+    
     def get_ioc_detail(self, ioc_name: str) -> Dict[str, Any]:
         """특정 IOC 상세 정보 조회"""
         return self._make_request("GET", f"/api/alive/ioc/{ioc_name}")
@@ -110,6 +114,20 @@ class IOCMonitorClient:
         data = {"value": value}
         return self._make_request("POST", f"/api/pv/caput/{pv_name}", json=data)
     
+    def read_pvs(self, pv_names: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """여러 PV 값 한 번에 읽기 (서버에서 동시 처리)"""
+        data = {"pvs": pv_names}
+        if timeout is not None:
+            data["timeout"] = timeout
+        return self._make_request("POST", "/api/pv/batch_get", json=data)
+    
+    def write_pvs(self, pv_values: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """여러 PV 값 한 번에 설정 (서버에서 동시 처리)"""
+        data = {"values": pv_values}
+        if timeout is not None:
+            data["timeout"] = timeout
+        return self._make_request("POST", "/api/pv/batch_put", json=data)
+    
     def search_pv(self, query: str) -> Dict[str, Any]:
         """PV 검색"""
         params = {"query": query}
@@ -157,6 +175,22 @@ class IOCMonitorMCP:
     
     def __init__(self, client: IOCMonitorClient):
         self.client = client
+        self.ioc_details: Dict[str, Any] = {}
+        self.ioc_details_version = 0
+    
+    def sync_ioc_details(self) -> Dict[str, Any]:
+        """IOC 상세 정보 동기화 (마지막 버전 이후 변경분만 받아 로컬 테이블 갱신)"""
+        delta = self.client.get_ioc_details_since(self.ioc_details_version)
+        if "error" in delta:
+            return delta
+        if delta["full"]:
+            self.ioc_details = dict(delta["changed"])
+        else:
+            self.ioc_details.update(delta["changed"])
+            for name in delta["removed"]:
+                self.ioc_details.pop(name, None)
+        self.ioc_details_version = delta["version"]
+        return self.ioc_details
     
     def get_system_overview(self) -> Dict[str, Any]:
         """시스템 전체 개요 정보"""
@@ -184,8 +218,8 @@ class IOCMonitorMCP:
                     results[name] = self.client.get_ioc_detail(name)
                 return results
             else:
-                # 모든 IOC 모니터링
-                return self.client.get_ioc_details()
+                # 모든 IOC 모니터링 (변경분만 동기화)
+                return self.sync_ioc_details()
         except Exception as e:
             return {"error": f"Failed to monitor IOC status: {str(e)}"}
     
@@ -207,20 +241,20 @@ class IOCMonitorMCP:
     def read_multiple_pvs(self, pv_names: List[str]) -> Dict[str, Any]:
         """여러 PV 값 동시 읽기"""
         try:
-            results = {}
-            for pv_name in pv_names:
-                results[pv_name] = self.client.read_pv(pv_name)
-            return results
+            response = self.client.read_pvs(pv_names)
+            if not response.get("success"):
+                return response
+            return {pv_name: dict(result, pv=pv_name) for pv_name, result in response["results"].items()}
         except Exception as e:
             return {"error": f"Failed to read multiple PVs: {str(e)}"}
     
     def write_multiple_pvs(self, pv_values: Dict[str, Any]) -> Dict[str, Any]:
         """여러 PV 값 동시 설정"""
         try:
-            results = {}
-            for pv_name, value in pv_values.items():
-                results[pv_name] = self.client.write_pv(pv_name, value)
-            return results
+            response = self.client.write_pvs(pv_values)
+            if not response.get("success"):
+                return response
+            return {pv_name: dict(result, pv=pv_name) for pv_name, result in response["results"].items()}
         except Exception as e:
             return {"error": f"Failed to write multiple PVs: {str(e)}"}
     
@@ -10,15 +10,13 @@ IOC 모니터링을 위한 프로덕션 준비된 Flask 애플리케이션
 import os
 import sys
 import time
-import threading
 import subprocess
 import pandas as pd
 import signal
 import atexit
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, jsonify, render_template, request, flash, url_for, session, redirect, make_response
+from flask import Flask, Response, jsonify, render_template, request, flash, url_for, session, redirect
 from flask_cors import CORS
 
 # Load environment variables from .env file
@@ -69,15 +67,24 @@ from services.ioc_monitor import IOCMonitor
 from services.pv_service import PVService
 from services.log_service import LogService
 from services.alive_service import AliveService
-from utils.helpers import safe_str, format_uptime
+from services.ca_manager import CAError, CATimeoutError, get_ca_manager
+from services.event_store import DEFAULT_QUERY_LIMIT
+from services.snapshot import PROJECTIONS, parse_field_list, project
+from services.ioc_index import DEFAULT_PAGE_SIZE, resolve_field
+from services.ioc_record import as_dict
+from services.log_writer import flush_log_writers
+from services.rollups import DIMENSIONS as ROLLUP_DIMENSIONS
+from utils.helpers import safe_str, format_uptime, iter_file_blocks
 
 
 
 # Initialize services
+ca_manager = get_ca_manager()
 ioc_monitor = IOCMonitor()
 pv_service = PVService()
 log_service = LogService()
 alive_service = AliveService()
+pv_service.attach_alive_service(alive_service)
 
 @app.route("/")
 def index():
@@ -119,18 +126,58 @@ def api_alive_ioc_list():
     ioc_list = alive_service.get_ioc_list()
     return jsonify({"iocs": ioc_list})
 
+def snapshot_response(name: str):
+    """
+    Serve a pre-encoded snapshot view / 사전 인코딩된 스냅샷 뷰 응답
+    
+    The body is encoded once per IOC table change. A strong ETag over the
+    body lets unchanged polls end with 304 Not Modified.
+    """
+    snapshot = alive_service.get_snapshot(name)
+    response = Response(snapshot.body, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    response.headers["X-Snapshot-Version"] = str(snapshot.version)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+def projected_response(view: str, fields, exclude):
+    """
+    Serve a view limited by ?fields= / ?exclude= / ?fields= / ?exclude=로 제한된 뷰 응답
+    
+    A named projection alone (e.g. fields=dashboard) is served precomputed.
+    """
+    if fields is None and not exclude:
+        return snapshot_response(view)
+    projection = request.args.get("fields", "").strip()
+    if projection in PROJECTIONS and not exclude:
+        return snapshot_response(f"{view}:{projection}")
+    return jsonify(alive_service.get_projected_view(view, fields, exclude))
+
 @app.route("/api/alive/ioc_details")
 def api_alive_ioc_details():
-    """Get detailed IOC information from Alive server / Alive 서버에서 상세 IOC 정보 조회"""
-    ioc_details = alive_service.get_ioc_details()
-    return jsonify(ioc_details)
+    """
+    Get detailed IOC information from Alive server / Alive 서버에서 상세 IOC 정보 조회
+    
+    With since=<version> only the IOCs added, changed or removed after that
+    snapshot version are returned, with the new version to pass next time.
+    """
+    since = request.args.get("since")
+    fields = parse_field_list(request.args.get("fields"))
+    exclude = parse_field_list(request.args.get("exclude"))
+    if since is None:
+        return projected_response("ioc_details", fields, exclude)
+    try:
+        since = int(since)
+    except ValueError:
+        return jsonify({"error": f"invalid version '{since}'"}), 400
+    return jsonify(alive_service.get_ioc_details_since(since, fields, exclude))
 
 @app.route("/api/alive/ioc/<ioc_name>")
 def api_alive_ioc_detail(ioc_name):
     """Get specific IOC detail from Alive server / Alive 서버에서 특정 IOC 상세 정보 조회"""
     ioc_detail = alive_service.get_ioc_detail(ioc_name)
     if ioc_detail:
-        return jsonify(ioc_detail)
+        return jsonify(as_dict(ioc_detail))
     else:
         return jsonify({"error": f"IOC {ioc_name} not found"}), 404
 
@@ -139,6 +186,53 @@ def api_alive_status():
     """Get IOC status summary from Alive server / Alive 서버에서 IOC 상태 요약 조회"""
     return jsonify(alive_service.get_status_summary())
 
+@app.route("/api/alive/rollups")
+@app.route("/api/alive/rollups/<dimension>")
+def api_alive_rollups(dimension=None):
+    """
+    IOC status counts per group, location and host / 그룹, 위치, 호스트별 IOC 상태 집계
+    
+    Counts (total, online, offline, suspect, error, masked) are kept up to
+    date from IOC state transitions and served pre-encoded.
+    """
+    if dimension is None:
+        return snapshot_response("rollups")
+    if dimension not in ROLLUP_DIMENSIONS:
+        return jsonify({"error": f"Unknown rollup '{dimension}', expected one of {', '.join(ROLLUP_DIMENSIONS)}"}), 404
+    return snapshot_response(f"rollups:{dimension}")
+
+@app.route("/api/stream")
+def api_stream():
+    """
+    Server-Sent Events stream of IOC changes / IOC 변경 사항 Server-Sent Events 스트림
+    
+    "snapshot" carries {"version", "summary", "ioc_details"} once on connect;
+    "diff" carries {"version", "changed", "removed"[, "summary"]} afterwards.
+    Beyond STREAM_MAX_CLIENTS connections 503 is returned; poll
+    /api/alive/ioc_details?since=<version> instead.
+    """
+    client = alive_service.open_stream()
+    if client is None:
+        return jsonify({
+            "error": f"Too many stream clients (max {alive_service.stream.max_clients})",
+            "fallback": "/api/alive/ioc_details?since=<version>"
+        }), 503, {"Retry-After": "30"}
+    response = Response(alive_service.stream_updates(client), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Free the slot even if the body is never iterated
+    response.call_on_close(lambda: alive_service.stream.unsubscribe(client))
+    return response
+
+@app.route("/api/alive/fetch_stats")
+def api_alive_fetch_stats():
+    """Get Alive refresh cycle statistics / Alive 갱신 주기 통계 조회"""
+    return jsonify(alive_service.get_fetch_stats())
+
+@app.route("/api/alive/heartbeats")
+def api_alive_heartbeats():
+    """Get passive heartbeat statistics / 수동 하트비트 통계 조회"""
+    return jsonify(alive_service.get_heartbeat_stats())
+
 @app.route("/api/alive/faulted")
 def api_alive_faulted():
     """Get current faulted IOCs information / 현재 장애 IOC 정보"""
@@ -186,39 +280,25 @@ def api_ioc_monitor_ready_set():
 
 @app.route("/api/pv/caget/<pvname>")
 def api_pv_caget(pvname):
-    """Get PV value using caget / caget을 사용하여 PV 값 읽기"""
+    """Get PV value over a pooled CA channel / 풀링된 CA 채널로 PV 값 읽기"""
     try:
-        import subprocess
-        result = subprocess.run(['caget', pvname], 
-                              capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            # caget 출력 파싱: "PV_NAME value"
-            output = result.stdout.strip()
-            if ' ' in output:
-                pv_name, value = output.split(' ', 1)
-                return jsonify({
-                    "success": True,
-                    "pv": pvname,
-                    "value": value,
-                    "raw_output": output
-                })
-            else:
-                return jsonify({
-                    "success": False,
-                    "error": f"Unexpected caget output format: {output}"
-                }), 500
-        else:
-            return jsonify({
-                "success": False,
-                "error": f"caget failed: {result.stderr}"
-            }), 500
-            
-    except subprocess.TimeoutExpired:
+        value = ca_manager.get(pvname)
+        return jsonify({
+            "success": True,
+            "pv": pvname,
+            "value": value,
+            "raw_output": f"{pvname} {value}"
+        })
+    except CATimeoutError:
         return jsonify({
             "success": False,
             "error": "caget timeout"
         }), 500
+    except CAError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
     except Exception as e:
         return jsonify({
             "success": False,
@@ -227,7 +307,7 @@ def api_pv_caget(pvname):
 
 @app.route("/api/pv/caput/<pvname>", methods=["POST"])
 def api_pv_caput(pvname):
-    """Set PV value using caput / caput을 사용하여 PV 값 설정"""
+    """Set PV value over a pooled CA channel / 풀링된 CA 채널로 PV 값 설정"""
     try:
         data = request.get_json()
         value = data.get("value")
@@ -238,100 +318,204 @@ def api_pv_caput(pvname):
                 "error": "Value is required"
             }), 400
         
-        import subprocess
-        result = subprocess.run(['caput', pvname, str(value)], 
-                              capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            return jsonify({
-                "success": True,
-                "pv": pvname,
-                "value": value,
-                "message": f"PV {pvname} set to {value}",
-                "raw_output": result.stdout.strip()
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": f"caput failed: {result.stderr}"
-            }), 500
+        ca_manager.put(pvname, value)
+        return jsonify({
+            "success": True,
+            "pv": pvname,
+            "value": value,
+            "message": f"PV {pvname} set to {value}",
+            "raw_output": f"{pvname} {value}"
+        })
             
-    except subprocess.TimeoutExpired:
+    except CATimeoutError:
         return jsonify({
             "success": False,
             "error": "caput timeout"
         }), 500
+    except CAError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
     except Exception as e:
         return jsonify({
             "success": False,
             "error": f"Failed to set PV value: {str(e)}"
         }), 500
 
+def _batch_timeout(data):
+    """Batch deadline from the request, capped by CA_BATCH_TIMEOUT / 요청의 배치 기한 (CA_BATCH_TIMEOUT 이하)"""
+    limit = app.config.get('CA_BATCH_TIMEOUT', 5.0)
+    timeout = data.get("timeout")
+    if timeout is None:
+        return limit
+    return min(max(float(timeout), 0.1), limit)
+
+def _batch_response(results, started):
+    """Summarize per-PV batch results / PV별 배치 결과 요약"""
+    succeeded = sum(1 for result in results.values() if result["success"])
+    return jsonify({
+        "success": True,
+        "count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "results": results
+    })
+
+@app.route("/api/pv/batch_get", methods=["POST"])
+def api_pv_batch_get():
+    """Read many PVs concurrently within one deadline / 하나의 기한 안에 여러 PV 동시 읽기"""
+    try:
+        data = request.get_json(silent=True) or {}
+        pvs = data.get("pvs")
+        if not isinstance(pvs, list) or not pvs or not all(isinstance(pv, str) and pv for pv in pvs):
+            return jsonify({
+                "success": False,
+                "error": "pvs must be a non-empty list of PV names"
+            }), 400
+        max_pvs = app.config.get('CA_BATCH_MAX_PVS', 1000)
+        if len(pvs) > max_pvs:
+            return jsonify({
+                "success": False,
+                "error": f"At most {max_pvs} PVs per batch"
+            }), 400
+        
+        started = time.monotonic()
+        results = ca_manager.get_many(pvs, timeout=_batch_timeout(data))
+        return _batch_response(results, started)
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": f"Invalid timeout: {str(e)}"
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": f"Failed to get PV values: {str(e)}"
+        }), 500
+
+@app.route("/api/pv/batch_put", methods=["POST"])
+def api_pv_batch_put():
+    """Write many PVs concurrently within one deadline / 하나의 기한 안에 여러 PV 동시 쓰기"""
+    try:
+        data = request.get_json(silent=True) or {}
+        values = data.get("values")
+        if not isinstance(values, dict) or not values or any(value is None for value in values.values()):
+            return jsonify({
+                "success": False,
+                "error": "values must be a non-empty object of PV name → value"
+            }), 400
+        max_pvs = app.config.get('CA_BATCH_MAX_PVS', 1000)
+        if len(values) > max_pvs:
+            return jsonify({
+                "success": False,
+                "error": f"At most {max_pvs} PVs per batch"
+            }), 400
+        
+        started = time.monotonic()
+        results = ca_manager.put_many(values, timeout=_batch_timeout(data))
+        return _batch_response(results, started)
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": f"Invalid timeout: {str(e)}"
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": f"Failed to set PV values: {str(e)}"
+        }), 500
+
+@app.route("/api/index/<field>")
+def api_index_counts(field):
+    """
+    IOC count per value of an indexed field / 인덱스 필드의 값별 IOC 수
+    
+    Fields: status, group, location, ip (ip_address), engineer, arch, epics_base.
+    """
+    try:
+        field = resolve_field(field)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    counts = alive_service.get_index().counts[field]
+    return jsonify({"field": field, "values": len(counts), "counts": counts})
+
+@app.route("/api/index/<field>/<path:value>")
+def api_index_lookup(field, value):
+    """
+    IOCs with one value of an indexed field / 인덱스 필드 값이 일치하는 IOC들
+    
+    Returns IOC names; with fields=/exclude= the matching records as well.
+    """
+    try:
+        field = resolve_field(field)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    index = alive_service.get_index()
+    names = index.names(field, value)
+    result = {"field": field, "value": value, "count": len(names), "iocs": names}
+    
+    fields = parse_field_list(request.args.get("fields"))
+    exclude = parse_field_list(request.args.get("exclude"))
+    if fields is not None or exclude:
+        result["data"] = [project(index.records[name], fields, exclude) for name in names]
+    return jsonify(result)
+
+DATA_QUERY_FILTERS = {"status": "status", "group": "GROUP", "location": "LOCATION"}
+DATA_QUERY_PARAMS = tuple(DATA_QUERY_FILTERS) + ("q", "sort", "order", "page", "page_size")
+
 @app.route("/api/data")
 def api_data():
-    """Get all IOC data / 모든 IOC 데이터 조회"""
-    ioc_details = alive_service.get_ioc_details()
-    records = []
+    """
+    Get all IOC data / 모든 IOC 데이터 조회
     
-    for ioc_name, info in ioc_details.items():
-        record = info.copy()
-        record["masked"] = ioc_name in alive_service.masked_iocs
-        records.append(record)
+    Without query parameters the full record array is returned. With any of
+    status/group/location (comma-separated values), q (name substring),
+    sort, order=asc|desc, page or page_size a page is returned:
+    {"total", "page", "page_size", "pages", "data"}. sort accepts the same
+    lowercase names as the filters (group, location, ...); unknown fields
+    are rejected with 400.
+    """
+    fields = parse_field_list(request.args.get("fields"))
+    exclude = parse_field_list(request.args.get("exclude"))
+    if not any(param in request.args for param in DATA_QUERY_PARAMS):
+        return projected_response("data", fields, exclude)
     
-    return jsonify(records)
+    filters = {}
+    for param, field in DATA_QUERY_FILTERS.items():
+        values = parse_field_list(request.args.get(param))
+        if values:
+            filters[field] = values
+    try:
+        result = alive_service.query_ioc_data(
+            filters=filters,
+            q=request.args.get("q"),
+            sort=request.args.get("sort", "name"),
+            descending=request.args.get("order", "asc") == "desc",
+            page=request.args.get("page", 1, type=int),
+            page_size=request.args.get("page_size", DEFAULT_PAGE_SIZE, type=int)
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if fields is not None or exclude:
+        result["data"] = [project(record, fields, exclude) for record in result["data"]]
+    return jsonify(result)
 
 @app.route("/api/ip_list")
 def api_ip_list():
     """Get IP list from IOC data / IOC 데이터에서 IP 목록 조회"""
-    ioc_details = alive_service.get_ioc_details()
-    ip_list = sorted({
-        info.get("ip_address", "N/A") 
-        for info in ioc_details.values() 
-        if info.get("ip_address") and info.get("ip_address") != "N/A"
-    })
-    return jsonify(ip_list)
+    return snapshot_response("ip_list")
 
 @app.route("/api/faulted_iocs")
 def get_faulted_iocs():
-    """Get faulted IOCs / 장애 IOC 조회"""
-    try:
-        ioc_details = alive_service.get_ioc_details()
-        faulted = []
-        
-        for ioc_name, info in ioc_details.items():
-            if info.get("status") == "OFFLINE":
-                faulted.append(info)
-        
-        # 마스크된 IOC 제외
-        filtered = [ioc for ioc in faulted if ioc.get("name") not in alive_service.masked_iocs]
-        
-        return jsonify({
-            "count": len(filtered),
-            "data": filtered
-        })
-        
-    except Exception as e:
-        print(f"[ERROR] /api/faulted_iocs: {e}")
-        return jsonify({"error": f"Faulted IOC 분석 실패: {str(e)}"}), 500
+    """Get faulted IOCs, masked IOCs excluded / 장애 IOC 조회 (마스크된 IOC 제외)"""
+    return snapshot_response("faulted_iocs")
 
 @app.route("/api/control_states")
 def get_control_states():
     """Get control states / 제어 상태 조회"""
-    # 간단한 모니터링 데이터 반환
-    ioc_details = alive_service.get_ioc_details()
-    online_count = sum(1 for info in ioc_details.values() if info.get("status") == "ONLINE")
-    offline_count = sum(1 for info in ioc_details.values() if info.get("status") == "OFFLINE")
-    
-    monitoring_data = {
-        "Online IOCs": online_count,
-        "Offline IOCs": offline_count,
-        "Total IOCs": len(ioc_details)
-    }
-    
-    return jsonify({
-        "monitoring_data": monitoring_data,
-        "control_pvs": {}  # 기존 제어 PV 기능은 비활성화
-    })
+    return snapshot_response("control_states")
 
 @app.route("/api/ioc_logs/<path:iocname>")
 def api_ioc_logs(iocname):
@@ -391,7 +575,7 @@ def api_list():
         "ioc_details": {
             "endpoint": "/api/alive/ioc_details",
             "method": "GET",
-            "description": "모든 IOC의 상세 정보 조회",
+            "description": "모든 IOC의 상세 정보 조회 (since=<version>이면 해당 버전 이후 변경분만, fields=/exclude=로 필드 선택, fields=dashboard는 대시보드 컬럼)",
             "response": "JSON",
             "mcp_usage": "IOC 상태, IP, 업타임 등 상세 정보"
         },
@@ -409,13 +593,34 @@ def api_list():
             "response": "JSON",
             "mcp_usage": "IOC 상태 통계 및 요약"
         },
+        "ioc_status_rollups": {
+            "endpoint": "/api/alive/rollups[/<group|location|host>]",
+            "method": "GET",
+            "description": "그룹/위치/호스트별 IOC 상태 집계 (total, online, offline, suspect, error, masked)",
+            "response": "JSON",
+            "mcp_usage": "대규모 사이트 개요 및 영역별 장애 현황"
+        },
         "faulted_iocs": {
             "endpoint": "/api/alive/faulted",
             "method": "GET",
-            "description": "현재 장애 상태인 IOC 정보",
+            "description": "현재 장애 상태인 IOC 정보 (하트비트 지연 SUSPECT IOC 포함)",
             "response": "JSON",
             "mcp_usage": "장애 IOC 모니터링 및 알림"
         },
+        "alive_fetch_stats": {
+            "endpoint": "/api/alive/fetch_stats",
+            "method": "GET",
+            "description": "Alive 갱신 주기 통계 (소요 시간, 타임아웃 IOC 수)",
+            "response": "JSON",
+            "mcp_usage": "IOC 데이터 갱신 지연 모니터링"
+        },
+        "alive_heartbeats": {
+            "endpoint": "/api/alive/heartbeats",
+            "method": "GET",
+            "description": "IOC별 하트비트 간격 통계 및 의심(SUSPECT) 상태",
+            "response": "JSON",
+            "mcp_usage": "하트비트 지연 IOC 조기 감지"
+        },
         "ioc_monitor_ready_status": {
             "endpoint": "/api/ioc_monitor_ready/status",
             "method": "GET",
@@ -433,21 +638,35 @@ def api_list():
         "pv_caget": {
             "endpoint": "/api/pv/caget/<pvname>",
             "method": "GET",
-            "description": "PV 값 읽기 (caget 사용)",
+            "description": "PV 값 읽기 (공유 CA 채널, pyepics 없으면 caget 사용)",
             "response": "JSON",
             "mcp_usage": "EPICS PV 값 읽기"
         },
         "pv_caput": {
             "endpoint": "/api/pv/caput/<pvname>",
             "method": "POST",
-            "description": "PV 값 설정 (caput 사용)",
+            "description": "PV 값 설정 (공유 CA 채널, pyepics 없으면 caput 사용)",
             "response": "JSON",
             "mcp_usage": "EPICS PV 값 설정"
         },
+        "pv_batch_get": {
+            "endpoint": "/api/pv/batch_get",
+            "method": "POST",
+            "description": "여러 PV 값 동시 읽기 (body: {\"pvs\": [...], \"timeout\": 초}, 전체 기한 내 PV별 status 반환)",
+            "response": "JSON",
+            "mcp_usage": "여러 EPICS PV 값을 한 번의 요청으로 읽기"
+        },
+        "pv_batch_put": {
+            "endpoint": "/api/pv/batch_put",
+            "method": "POST",
+            "description": "여러 PV 값 동시 설정 (body: {\"values\": {PV: 값}, \"timeout\": 초}, 전체 기한 내 PV별 status 반환)",
+            "response": "JSON",
+            "mcp_usage": "여러 EPICS PV 값을 한 번의 요청으로 설정"
+        },
         "all_ioc_data": {
             "endpoint": "/api/data",
             "method": "GET",
-            "description": "모든 IOC 데이터 (마스크 상태 포함)",
+            "description": "모든 IOC 데이터 (마스크 상태 포함, fields=/exclude=로 필드 선택, status/group/location/q/sort/order/page/page_size로 서버 측 필터 및 페이지)",
             "response": "JSON",
             "mcp_usage": "전체 IOC 데이터 및 마스크 상태"
         },
@@ -482,9 +701,9 @@ def api_list():
         "all_events": {
             "endpoint": "/api/events",
             "method": "GET",
-            "description": "모든 이벤트 캐시",
+            "description": "모든 이벤트 캐시 (since, until, event, limit, cursor, order 파라미터로 페이지 조회)",
             "response": "JSON",
-            "mcp_usage": "전체 이벤트 데이터"
+            "mcp_usage": "전체 이벤트 데이터, 기간/유형별 이벤트 조회"
         },
         "pv_search": {
             "endpoint": "/api/pv/search",
@@ -507,6 +726,27 @@ def api_list():
             "response": "JSON",
             "mcp_usage": "PV 이름 자동완성"
         },
+        "index_counts": {
+            "endpoint": "/api/index/<field>",
+            "method": "GET",
+            "description": "인덱스 필드(status, group, location, ip, engineer, arch, epics_base)의 값별 IOC 수",
+            "response": "JSON",
+            "mcp_usage": "그룹/위치/호스트별 IOC 분포"
+        },
+        "index_lookup": {
+            "endpoint": "/api/index/<field>/<value>",
+            "method": "GET",
+            "description": "인덱스 필드 값이 일치하는 IOC 목록 (fields=/exclude=로 레코드 포함)",
+            "response": "JSON",
+            "mcp_usage": "특정 호스트/그룹의 IOC 조회"
+        },
+        "stream": {
+            "endpoint": "/api/stream",
+            "method": "GET",
+            "description": "IOC 상태 변경 SSE 스트림 (접속 시 전체 snapshot, 이후 IOC별 diff와 요약 변경, 최대 접속 초과 시 503)",
+            "response": "text/event-stream",
+            "mcp_usage": "IOC 상태 변경 실시간 수신"
+        },
         "server_log_dates": {
             "endpoint": "/api/server_log_dates",
             "method": "GET",
@@ -517,7 +757,7 @@ def api_list():
         "server_log_by_date": {
             "endpoint": "/server_log/<date>",
             "method": "GET",
-            "description": "특정 날짜의 서버 로그",
+            "description": "특정 날짜의 서버 로그 (스트리밍, tail=N으로 최신 N줄, offset으로 이전 페이지)",
             "response": "Text",
             "mcp_usage": "날짜별 서버 로그 조회"
         }
@@ -536,9 +776,31 @@ def api_list():
 
 @app.route("/server_log/<date>")
 def server_log_by_date(date):
-    """Get server log by date / 날짜별 서버 로그 조회"""
-    content = alive_service.get_server_log_by_date(date)
-    return content, 200, {"Content-Type": "text/plain; charset=utf-8"}
+    """
+    Get server log by date / 날짜별 서버 로그 조회
+    
+    Streams the whole file by default. With tail=N only the latest N lines
+    are returned (offset=M skips the M newest lines first, for paging back),
+    read backwards from the end of the file. X-Log-Size carries the file size.
+    """
+    tail = request.args.get("tail", type=int)
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    log_path = alive_service.get_server_log_path(date)
+    try:
+        size = os.path.getsize(log_path)
+    except OSError as e:
+        print(f"[ERROR] Failed to read log for date {date}: {e}")
+        return f"로그 파일 읽기 실패: {e}", 200, {"Content-Type": "text/plain; charset=utf-8"}
+    
+    headers = {"X-Log-Size": str(size)}
+    if tail is not None:
+        content = alive_service.get_server_log_tail(date, tail, offset)
+        return content, 200, dict(headers, **{"Content-Type": "text/plain; charset=utf-8"})
+    
+    # Stream the bytes present when the request started / 요청 시작 시점까지의 내용을 스트리밍
+    headers["Content-Length"] = str(size)
+    return Response(iter_file_blocks(log_path, size), 200, headers,
+                    content_type="text/plain; charset=utf-8")
 
 @app.route("/server_log_dates")
 def server_log_dates():
@@ -546,14 +808,33 @@ def server_log_dates():
     dates = alive_service.get_server_log_dates()
     return jsonify(dates)
 
+EVENT_QUERY_PARAMS = ("since", "until", "event", "limit", "cursor", "order")
+
+
 @app.route("/api/events")
 def api_events():
-    """Get all events from cache / 캐시에서 모든 이벤트 조회"""
-    with alive_service._lock:
-        if alive_service._cache["all_events"] is not None:
-            return jsonify(alive_service._cache["all_events"])
-        else:
-            return jsonify([])
+    """
+    Get events from the event store / 이벤트 저장소에서 이벤트 조회
+
+    Without query parameters the full event array is returned as before.
+    With any of since/until/event/limit/cursor/order a page is returned:
+    {"events": [...], "count": n, "cursor": "...", "head_cursor": "...", "has_more": bool}.
+    Pass "cursor" back to get the next page; pass "head_cursor" later to
+    get only events logged after this response.
+    """
+    if not any(param in request.args for param in EVENT_QUERY_PARAMS):
+        return jsonify(alive_service.get_all_events())
+    try:
+        return jsonify(alive_service.query_events(
+            since=request.args.get("since"),
+            until=request.args.get("until"),
+            event=request.args.get("event"),
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", DEFAULT_QUERY_LIMIT, type=int),
+            order=request.args.get("order", "asc")
+        ))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
 @app.route("/api/pv/search")
 def api_pv_search():
@@ -640,14 +921,12 @@ def api_toggle_mask():
     if not ioc:
         return jsonify(status="error", message="ioc 파라미터가 없습니다."), 400
     
-    if ioc in alive_service.masked_iocs:
-        alive_service.masked_iocs.remove(ioc)
-        action = "unmasked"
-        alive_service._log_server_event("UNMASK", f"IOC {ioc} unmasked")
-    else:
-        alive_service.masked_iocs.add(ioc)
+    if alive_service.toggle_mask(ioc):
         action = "masked"
         alive_service._log_server_event("MASK", f"IOC {ioc} masked")
+    else:
+        action = "unmasked"
+        alive_service._log_server_event("UNMASK", f"IOC {ioc} unmasked")
     
     return jsonify(status="ok", action=action)
 
@@ -657,7 +936,7 @@ def api_unmask_all():
     if not session.get("logged_in"):
         return jsonify(status="error", message="권한이 없습니다."), 403
     
-    alive_service.masked_iocs.clear()
+    alive_service.unmask_all()
     return jsonify(status="ok")
 
 @app.route("/api/ssh/<ioc_name>")
@@ -741,7 +1020,7 @@ def check_ssh_server_status():
 def log_server_shutdown():
     """Log server shutdown message / 서버 종료 메시지 로그"""
     try:
-        log_file = "/home/ctrluser/Apps/IOC_Monitor/logs/events.txt"
+        log_file = app.config['ALIVE_EVENTS_LOG']
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         shutdown_message = f"{timestamp} IOC-MONITOR-SERVER SHUTDOWN 192.168.70.235 0\n"
         
@@ -759,6 +1038,7 @@ def signal_handler(signum, frame):
     alive_service.log_server_shutdown()
     alive_service.stop_monitoring()
     log_server_shutdown()
+    flush_log_writers()
     print("[INFO] Server shutdown complete.")
     sys.exit(0)
 
@@ -767,20 +1047,13 @@ def start_background_threads():
     print("Starting Alive service monitoring...")
     alive_service.start_monitoring()
     
-    # Start IOC Monitor Ready control logic thread only if PV Control is enabled
+    # Start IOC Monitor Ready control logic only if PV Control is enabled
     if app.config.get('FEATURE_PV_CONTROL', False):
-        def run_control_logic():
-            while True:
-                try:
-                    pv_service.apply_control_logic()
-                    time.sleep(0.1)  # 100ms 간격으로 체크
-                except Exception as e:
-                    print(f"[ERROR] Control logic error: {e}")
-                    time.sleep(1)
-        
-        control_thread = threading.Thread(target=run_control_logic, daemon=True)
-        control_thread.start()
-        print("Started IOC Monitor Ready control logic thread")
+        # Re-evaluated on IOC status/BPC, threshold PV and control PV changes
+        if pv_service.start_readiness_engine():
+            print("Started IOC Monitor Ready readiness engine")
+        else:
+            print("[WARNING] IOC Monitor Ready control PVs not connected, readiness engine not started")
     else:
         print("PV Control feature is disabled. Set IOC_MONITOR_PV_CONTROL_ENABLED=true to enable.")
 
@@ -791,10 +1064,11 @@ if __name__ == "__main__":
     
     # Register atexit handler as backup
     atexit.register(log_server_shutdown)
+    atexit.register(flush_log_writers)
     
     # Log server startup
     try:
-        log_file = "/home/ctrluser/Apps/IOC_Monitor/logs/events.txt"
+        log_file = app.config['ALIVE_EVENTS_LOG']
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         startup_message = f"{timestamp} IOC-MONITOR-SERVER STARTUP 192.168.70.235 0\n"
         
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+alivectl Parser Benchmark
+alivectl 파서 벤치마크
+Compares the table-driven alivectl -i parser with the previous if/elif parser
+테이블 기반 alivectl -i 파서와 이전 if/elif 파서 비교
+
+Usage / 사용법:
+    python benchmarks/bench_parser.py --iocs 1000
+    python benchmarks/bench_parser.py --outputs /path/to/recorded   # files with alivectl -i output
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_alived import make_records  # noqa: E402
+from services.alive_client import format_alivectl_info, parse_alivectl_info  # noqa: E402
+from services.alive_service import AliveService  # noqa: E402
+from services.ioc_record import IOCRecord  # noqa: E402
+
+
+def legacy_parse_ioc_info(info_text: str, ioc_name: str) -> IOCRecord:
+    """Previous AliveService._parse_ioc_info line loop, kept for comparison / 비교용 이전 파싱 루프"""
+    info = IOCRecord(ioc_name, info_text)
+
+    lines = info_text.split('\n')
+    in_env_vars = False
+    in_linux_info = False
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if 'IP address =' in line:
+            info["ip_address"] = line.split('IP address =')[1].strip()
+        elif 'incarnation =' in line:
+            inc_match = line.split('incarnation =')[1].strip()
+            if '[' in inc_match:
+                inc_match = inc_match.split('[')[1].split(']')[0]
+            info["incarnation"] = inc_match
+        elif 'ping time =' in line:
+            ping_match = line.split('ping time =')[1].strip()
+            if '[' in ping_match:
+                ping_match = ping_match.split('[')[1].split(']')[0]
+            info["last_seen"] = ping_match
+            try:
+                info["ping_time"] = int(ping_match.split('[')[0].strip())
+            except Exception:
+                try:
+                    original_ping = line.split('ping time =')[1].strip()
+                    info["ping_time"] = int(original_ping.split('[')[0].strip())
+                except Exception:
+                    pass
+        elif 'boot time =' in line:
+            boot_match = line.split('boot time =')[1].strip()
+            if '[' in boot_match:
+                boot_match = boot_match.split('[')[1].split(']')[0]
+            info["uptime"] = boot_match
+        elif 'user message =' in line:
+            info["message"] = line.split('user message =')[1].strip()
+        elif 'heartbeat =' in line:
+            try:
+                info["heartbeat"] = int(line.split('heartbeat =')[1].strip())
+            except Exception:
+                pass
+        elif 'overall status =' in line:
+            status_match = line.split('overall status =')[1].strip()
+            info["overall_status"] = status_match
+            if status_match == 'U':
+                info["status"] = "UP"
+            elif status_match == 'D':
+                info["status"] = "DOWN"
+            elif status_match == 'E':
+                info["status"] = "ERROR"
+            else:
+                info["status"] = status_match
+        elif 'environment variables =' in line:
+            in_env_vars = True
+            in_linux_info = False
+            continue
+        elif 'IOC type =' in line:
+            in_env_vars = False
+            in_linux_info = True
+            continue
+        elif (in_env_vars or in_linux_info) and '=' in line:
+            parts = line.split('=', 1)
+            if len(parts) == 2:
+                var_name = parts[0].strip()
+                if var_name in info:
+                    info[var_name] = parts[1].strip()
+    return info
+
+
+def table_parse_ioc_info(info_text: str, ioc_name: str) -> IOCRecord:
+    """Table-driven parser without the memo / 메모 없는 테이블 기반 파서"""
+    info = IOCRecord(ioc_name, info_text)
+    parse_alivectl_info(info_text, info)
+    return info
+
+
+def load_outputs(args) -> List[Tuple[str, str]]:
+    """Recorded (IOC name, alivectl -i output) pairs / 기록된 (IOC 이름, alivectl -i 출력) 쌍"""
+    if args.outputs:
+        outputs = []
+        for file_name in sorted(os.listdir(args.outputs)):
+            with open(os.path.join(args.outputs, file_name)) as f:
+                text = f.read()
+            outputs.append((text.split("\n", 1)[0].strip() or file_name, text))
+        return outputs
+    random.seed(args.seed)
+    return [(record["name"], format_alivectl_info(record)) for record in make_records(args.iocs)]
+
+
+def check_equal(outputs: List[Tuple[str, str]]) -> int:
+    """Count outputs where both parsers disagree (status excluded) / 두 파서 결과가 다른 출력 수 (status 제외)"""
+    mismatches = 0
+    for name, text in outputs:
+        legacy = legacy_parse_ioc_info(text, name).to_dict()
+        table = table_parse_ioc_info(text, name).to_dict()
+        legacy.pop("status")
+        table.pop("status")
+        if legacy != table:
+            mismatches += 1
+            if mismatches <= 3:
+                diff = {key: (legacy[key], table[key]) for key in legacy if legacy[key] != table[key]}
+                print(f"  mismatch {name}: {diff}")
+    return mismatches
+
+
+def bench(label: str, func, outputs: List[Tuple[str, str]], repeat: int):
+    """Print best time per IOC / IOC당 최소 시간 출력"""
+    timer = timeit.Timer(lambda: [func(text, name) for name, text in outputs])
+    best = min(timer.repeat(repeat=repeat, number=1))
+    print(f"{label:<28} {best * 1000:9.2f} ms/pass  {best / len(outputs) * 1e6:8.2f} us/IOC")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="alivectl -i parser microbenchmark")
+    parser.add_argument("--iocs", type=int, default=1000, help="synthetic outputs when --outputs is not given")
+    parser.add_argument("--outputs", help="directory of recorded alivectl -i outputs, one file per IOC")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    outputs = load_outputs(args)
+    print(f"{len(outputs)} alivectl outputs, {sum(len(text) for _, text in outputs)} bytes")
+    print(f"mismatches: {check_equal(outputs)}")
+
+    service = AliveService.__new__(AliveService)
+    service._parse_memo = {}
+    service._invalid_bpc = set()
+
+    bench("legacy if/elif", legacy_parse_ioc_info, outputs, args.repeat)
+    bench("table-driven", table_parse_ioc_info, outputs, args.repeat)
+    bench("table-driven + memo (hit)", service._parse_ioc_info, outputs, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Readiness Engine Check
+준비 상태 엔진 검증
+Compares ReadinessEngine with a full recount and checks that its heaps stay bounded
+ReadinessEngine을 전체 재계산과 비교하고 힙 크기가 제한되는지 확인
+
+Usage / 사용법:
+    python benchmarks/bench_readiness.py --iocs 600 --cycles 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.readiness import ReadinessEngine, is_inactive  # noqa: E402
+
+
+class Table:
+    """Minimal published table: details and numeric BPC / 최소 발행 테이블"""
+
+    def __init__(self):
+        self.details = {}
+        self.bpc = {}
+
+
+def brute_force_ready(state, threshold: float, now: float, stale_after: float) -> int:
+    """READY from a full scan of every IOC / 모든 IOC 전체 검사로 계산한 READY"""
+    for info, bpc in state.values():
+        if bpc < threshold:
+            continue
+        if is_inactive(info) or (info["ping_time"] > 0 and now - info["ping_time"] > stale_after):
+            return 0
+    return 1
+
+
+def check_random(iocs: int, steps: int) -> int:
+    """Random changes, removals and threshold moves / 무작위 변경, 삭제, 임계값 변경"""
+    engine = ReadinessEngine(lambda value: None)
+    names = [f"IOC{number}" for number in range(iocs)]
+    state = {}
+    threshold = 1.0
+    now = 10000.0
+    mismatches = 0
+    for _ in range(steps):
+        now += random.random() * 5
+        table = Table()
+        changed, removed = set(), set()
+        for _ in range(random.randint(0, 5)):
+            name = random.choice(names)
+            if name in state and random.random() < 0.1:
+                del state[name]
+                removed.add(name)
+                changed.discard(name)
+                continue
+            info = {"overall_status": random.choice(["U", "U", "U", "D", "DO"]),
+                    "status": random.choice(["ONLINE", "ONLINE", "SUSPECT"]),
+                    "ping_time": random.choice([0, int(now - random.random() * 90)])}
+            state[name] = (info, random.randint(0, 5))
+            changed.add(name)
+            removed.discard(name)
+        for name in changed:
+            table.details[name], table.bpc[name] = state[name]
+        engine.on_publish(table, changed, removed)
+        if random.random() < 0.2:
+            value = random.choice([None, -1, 0, 1, 2, 3, 4.5, 7])
+            engine.on_threshold(value)
+            threshold = 1.0 if value is None else value
+
+        ready, _ = engine.evaluate(now)
+        if ready != brute_force_ready(state, threshold, now, engine.stale_after):
+            mismatches += 1
+    return mismatches
+
+
+def check_heap_bound(iocs: int, cycles: int) -> int:
+    """Largest heap size while one high-BPC IOC stays down / 높은 BPC IOC 하나가 꺼진 동안 최대 힙 크기"""
+    engine = ReadinessEngine(lambda value: None)
+    names = [f"IOC{number}" for number in range(iocs)]
+    now = time.time()
+    largest = 0
+    for _ in range(cycles):
+        now += 5
+        table = Table()
+        for name in names:
+            table.details[name] = {"overall_status": "D" if name == names[0] else "U",
+                                   "status": "ONLINE", "ping_time": int(now)}
+            table.bpc[name] = 5
+        engine.on_publish(table, names, ())
+        engine.evaluate(now)
+        largest = max(largest, sum(len(heap) for heap in engine._ping_heaps.values()))
+    return largest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ReadinessEngine consistency and heap size check")
+    parser.add_argument("--iocs", type=int, default=600)
+    parser.add_argument("--cycles", type=int, default=200, help="full-table publishes for the heap check")
+    parser.add_argument("--steps", type=int, default=4000, help="random steps for the consistency check")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    mismatches = check_random(min(args.iocs, 300), args.steps)
+    print(f"mismatches against full recount: {mismatches} / {args.steps}")
+
+    largest = check_heap_bound(args.iocs, args.cycles)
+    limit = 2 * args.iocs + 64
+    print(f"largest heap size: {largest} entries for {args.iocs} IOCs over {args.cycles} cycles (limit {limit})")
+
+    if mismatches or largest > limit:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
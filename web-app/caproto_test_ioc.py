@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+caproto Test IOC
+caproto 테스트 IOC
+Serves the IOC Monitor control PVs and test PVs over Channel Access for offline testing
+오프라인 테스트를 위해 IOC Monitor 제어 PV와 테스트 PV를 Channel Access로 제공
+
+Usage / 사용법:
+    pip install caproto pyepics
+    python caproto_test_ioc.py --count 200
+    EPICS_CA_ADDR_LIST=127.0.0.1 EPICS_CA_AUTO_ADDR_LIST=NO IOC_MONITOR_PV_CONTROL_ENABLED=true python app.py
+    curl http://127.0.0.1:5000/api/pv/caget/TEST:CA:AI0
+"""
+
+import argparse
+from typing import Dict
+
+from caproto import ChannelDouble, ChannelEnum, ChannelInteger, ChannelString
+from caproto.server import run
+
+from config import Config
+
+
+def make_pvdb(prefix: str, count: int, threshold_pv: str, control_pv: str) -> Dict:
+    """
+    Build the test PV database / 테스트 PV 데이터베이스 생성
+
+    Args:
+        prefix: Prefix of the test PVs / 테스트 PV 접두사
+        count: Number of <prefix>AI<n> PVs / <prefix>AI<n> PV 개수
+        threshold_pv: BPC threshold PV name / BPC 임계값 PV 이름
+        control_pv: IOC Monitor READY PV name / IOC Monitor READY PV 이름
+
+    Returns:
+        Dict: PV name → caproto channel / PV 이름 → caproto 채널
+    """
+    pvdb = {
+        threshold_pv: ChannelDouble(value=1.0),
+        control_pv: ChannelInteger(value=1),
+        f"{prefix}MODE": ChannelEnum(value="OFF", enum_strings=["OFF", "BEAM", "STUDY"]),
+        f"{prefix}MSG": ChannelString(value="test"),
+    }
+    for number in range(count):
+        pvdb[f"{prefix}AI{number}"] = ChannelDouble(value=float(number), precision=3)
+    return pvdb
+
+
+def main():
+    config = Config()
+    parser = argparse.ArgumentParser(description="caproto test IOC for offline testing")
+    parser.add_argument("--prefix", default="TEST:CA:")
+    parser.add_argument("--count", type=int, default=100, help="number of <prefix>AI<n> PVs")
+    parser.add_argument("--threshold-pv", default=config.PV_CONTROL_THRESHOLD_PV)
+    parser.add_argument("--control-pv", default=config.PV_CONTROL_CONTROL_PV)
+    parser.add_argument("--interfaces", nargs="*", default=["0.0.0.0"])
+    parser.add_argument("--list-pvs", action="store_true", help="log PV names at startup")
+    args = parser.parse_args()
+
+    pvdb = make_pvdb(args.prefix, args.count, args.threshold_pv, args.control_pv)
+    print(f"[INFO] caproto test IOC serving {len(pvdb)} PVs "
+          f"({args.prefix}AI0..{args.prefix}AI{args.count - 1}, {args.threshold_pv}, {args.control_pv})")
+    run(pvdb, module_name="caproto.asyncio.server", interfaces=args.interfaces, log_pv_names=args.list_pvs)
+
+
+if __name__ == "__main__":
+    main()
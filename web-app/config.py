@@ -9,6 +9,19 @@ Flask 애플리케이션을 위한 설정
 import os
 from datetime import timedelta
 
+
+def _alived_setting(config_path: str, name: str, default: str) -> str:
+    """Read one setting from alived_config.txt / alived_config.txt에서 설정 하나 읽기"""
+    try:
+        with open(config_path, "r") as f:
+            for line in f:
+                parts = line.split(None, 1)
+                if len(parts) == 2 and parts[0] == name:
+                    return parts[1].strip().strip('"')
+    except OSError:
+        pass
+    return default
+
 class Config:
     """Base configuration / 기본 설정"""
     
@@ -42,7 +55,9 @@ class Config:
     
     # Log file paths / 로그 파일 경로
     FAULTED_LOG = os.path.join(LOG_DIR, "faulted_ioc.log")
-    ALIVE_EVENTS_LOG = os.path.join(BASE_DIR, "logs", "events.txt")
+    # alived event_file, shared by every service that reads events / 이벤트를 읽는 모든 서비스가 공유하는 alived event_file
+    ALIVE_EVENTS_LOG = os.environ.get("ALIVE_EVENTS_LOG") or _alived_setting(
+        ALIVED_CONFIG, "event_file", os.path.join(BASE_DIR, "logs", "events.txt"))
     
     # EPICS PVs - Configurable from environment / EPICS PV들 - 환경에서 설정 가능
     # Default monitoring PVs / 기본 모니터링 PV들 (비활성화됨)
@@ -143,6 +158,9 @@ class Config:
     FEATURE_CONTROL_PVS = os.environ.get("FEATURE_CONTROL_PVS", "true").lower() == "true"
     FEATURE_FAULTED_MONITORING = os.environ.get("FEATURE_FAULTED_MONITORING", "true").lower() == "true"
     FEATURE_PV_CACHE = os.environ.get("FEATURE_PV_CACHE", "false").lower() == "true"
+    # Experimental: the subscription and heartbeat wire formats are assumptions, unverified against alived / 실험적 기능
+    FEATURE_ALIVE_SUBSCRIPTION = os.environ.get("FEATURE_ALIVE_SUBSCRIPTION", "false").lower() == "true"
+    FEATURE_HEARTBEAT_LISTENER = os.environ.get("FEATURE_HEARTBEAT_LISTENER", "false").lower() == "true"
     
     # PV Control feature - BPC-based IOC monitoring control / PV 제어 기능 - BPC 기반 IOC 모니터링 제어
     FEATURE_PV_CONTROL = os.environ.get("IOC_MONITOR_PV_CONTROL_ENABLED", "false").lower() == "true"
@@ -156,6 +174,45 @@ class Config:
     FAULTED_MONITOR_INTERVAL = int(os.environ.get("FAULTED_MONITOR_INTERVAL", "5"))  # seconds
     PV_CACHE_UPDATE_INTERVAL = int(os.environ.get("PV_CACHE_UPDATE_INTERVAL", "30"))  # seconds
     
+    # Alive fetch engine settings / Alive 조회 엔진 설정
+    ALIVE_FETCH_WORKERS = int(os.environ.get("ALIVE_FETCH_WORKERS", "16"))  # concurrent alivectl calls
+    ALIVE_FETCH_DEADLINE = float(os.environ.get("ALIVE_FETCH_DEADLINE", "4"))  # seconds per refresh cycle
+    ALIVE_FETCH_TIMEOUT = float(os.environ.get("ALIVE_FETCH_TIMEOUT", "5"))  # seconds per alivectl call
+    # "tcp" is EXPERIMENTAL: its wire format is an assumption, unverified against a real alived / "tcp"는 실험적 기능
+    ALIVE_DATA_SOURCE = os.environ.get("ALIVE_DATA_SOURCE", "alivectl").lower()  # "alivectl" or "tcp"
+    ALIVED_HOST = os.environ.get("ALIVED_HOST", "127.0.0.1")  # host for alived TCP/UDP ports
+    ALIVE_SUBSCRIBER_PORT = int(os.environ.get("ALIVE_SUBSCRIBER_PORT", "0"))  # local UDP port, 0 = any
+    ALIVE_RECONCILE_INTERVAL = int(os.environ.get("ALIVE_RECONCILE_INTERVAL", "30"))  # seconds, with subscription; kept below half the 60 s READY staleness limit
+    
+    # Passive heartbeat listener / 수동 하트비트 리스너
+    # alived normally owns the heartbeat port; run the listener on a host or port that receives a copy
+    # of the heartbeats (alive record RHOST/RPORT or a mirrored port) / alived가 포트를 점유하므로 하트비트 사본을 받는 포트에서 실행
+    HEARTBEAT_LISTEN_HOST = os.environ.get("HEARTBEAT_LISTEN_HOST", "")
+    HEARTBEAT_LISTEN_PORT = int(os.environ.get("HEARTBEAT_LISTEN_PORT", "0"))  # 0 = heartbeat_udp_port
+    HEARTBEAT_SUSPECT_FACTOR = float(os.environ.get("HEARTBEAT_SUSPECT_FACTOR", "2.5"))  # x expected interval
+    HEARTBEAT_MAGIC = int(os.environ.get("HEARTBEAT_MAGIC", "0x4A4C4956"), 0)  # other magic numbers are rejected
+    HEARTBEAT_PROTOCOL_VERSION = int(os.environ.get("HEARTBEAT_PROTOCOL_VERSION", "5"))  # other versions are rejected
+    HEARTBEAT_FORGET_AFTER = float(os.environ.get("HEARTBEAT_FORGET_AFTER", "600"))  # seconds of silence before dropping an IOC
+    
+    # Pooled Channel Access client / 풀링된 Channel Access 클라이언트
+    CA_CONNECT_TIMEOUT = float(os.environ.get("CA_CONNECT_TIMEOUT", "2"))  # seconds to connect or get
+    CA_PUT_TIMEOUT = float(os.environ.get("CA_PUT_TIMEOUT", "10"))  # seconds for a put to complete
+    CA_IDLE_TIMEOUT = float(os.environ.get("CA_IDLE_TIMEOUT", "300"))  # seconds before an unused channel is dropped
+    CA_BATCH_TIMEOUT = float(os.environ.get("CA_BATCH_TIMEOUT", "5"))  # seconds for a whole batch get/put
+    CA_BATCH_MAX_PVS = int(os.environ.get("CA_BATCH_MAX_PVS", "1000"))  # PVs per batch request
+    
+    # Published IOC snapshots / 발행된 IOC 스냅샷
+    SNAPSHOT_DIFF_HISTORY = int(os.environ.get("SNAPSHOT_DIFF_HISTORY", "256"))  # versions kept for ?since=
+    SNAPSHOT_PUBLISH_DEBOUNCE = float(os.environ.get("SNAPSHOT_PUBLISH_DEBOUNCE", "0.2"))  # seconds to coalesce event bursts
+    # Each /api/stream client holds a server thread while connected, so run a threaded or async
+    # WSGI server (e.g. gunicorn --threads or gevent workers) with more threads than this cap.
+    # /api/stream 클라이언트마다 서버 스레드를 점유하므로 스레드/비동기 WSGI 서버 필요
+    STREAM_MAX_CLIENTS = int(os.environ.get("STREAM_MAX_CLIENTS", "8"))  # per process; more get 503
+    
+    # Event store / 이벤트 저장소
+    EVENT_STORE_BACKEND = os.environ.get("EVENT_STORE_BACKEND", "sqlite").lower()  # "sqlite" or "memory"
+    EVENT_STORE_PATH = os.environ.get("EVENT_STORE_PATH", os.path.join(CACHE_DIR, "events.db"))
+    
     # CORS settings / CORS 설정
     CORS_ORIGINS = [
         "http://192.168.60.150",
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fake alived Server
+가짜 alived 서버
+Serves a synthetic IOC instance database for offline testing
+오프라인 테스트를 위한 가상 IOC 인스턴스 데이터베이스 제공
+
+Usage / 사용법:
+    python fake_alived.py --iocs 600 --port 5679 --sub-port 5680 --flap 2 --heartbeat-port 15678
+    ALIVE_DATA_SOURCE=tcp FEATURE_ALIVE_SUBSCRIPTION=true ALIVED_HOST=127.0.0.1 \
+        FEATURE_HEARTBEAT_LISTENER=true HEARTBEAT_LISTEN_PORT=15678 python app.py
+"""
+
+import argparse
+import random
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, List
+
+from services.alive_client import (AliveProtocolError, decode_subscribe, encode_database,
+                                   encode_event, encode_heartbeat)
+
+SUBSCRIPTION_LIFETIME = 120  # seconds a subscribe request stays valid
+
+
+def make_records(count: int, down_ratio: float = 0.05) -> List[Dict]:
+    """
+    Build synthetic instance records / 가상 인스턴스 레코드 생성
+
+    Args:
+        count: Number of IOCs / IOC 개수
+        down_ratio: Fraction of IOCs reported down / 다운 상태 IOC 비율
+
+    Returns:
+        List[Dict]: Records in the decode_database() shape / decode_database() 형식의 레코드들
+    """
+    now = int(time.time())
+    records = []
+    for i in range(count):
+        is_down = random.random() < down_ratio
+        boot_time = now - random.randint(600, 86400 * 30)
+        records.append({
+            "name": f"FAKE-SYS:IOC-{i:04d}",
+            "status": "D" if is_down else "U",
+            "ip": f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            "incarnation": boot_time,
+            "boot_time": boot_time,
+            "ping_time": now - (random.randint(120, 3600) if is_down else random.randint(0, 5)),
+            "heartbeat": 0 if is_down else random.randint(1, 100000),
+            "period": 5,
+            "user_msg": 0,
+            "env": {
+                "ARCH": "linux-x86_64",
+                "TOP": f"/home/ctrluser/iocs/ioc{i:04d}",
+                "EPICS_BASE": "/opt/epics/base-7.0.8",
+                "ENGINEER": random.choice(["kim", "lee", "park"]),
+                "GROUP": f"GROUP-{i % 8}",
+                "LOCATION": f"RACK-{i % 24:02d}",
+                "PURPOSE": "synthetic",
+                "BPC": hex(i % 4)
+            },
+            "ioc_type": "linux",
+            "extra": {
+                "user": "ctrluser",
+                "group": "ctrl",
+                "host": f"ioc-host-{i % 50:02d}"
+            }
+        })
+    return records
+
+
+class _DatabaseHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.request.sendall(self.server.fake.encoded_database())
+
+
+class _DatabaseServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class FakeAlived:
+    """In-process fake alived / 프로세스 내 가짜 alived"""
+
+    def __init__(self, host: str = "127.0.0.1", db_port: int = 5679, sub_port: int = 5680,
+                 records: List[Dict] = None):
+        """
+        Initialize fake server / 가짜 서버 초기화
+
+        Args:
+            host: Bind address / 바인드 주소
+            db_port: Database TCP port, 0 for any free port / 데이터베이스 TCP 포트 (0이면 임의 포트)
+            sub_port: Subscription UDP port, 0 for any free port / 구독 UDP 포트 (0이면 임의 포트)
+            records: Initial records / 초기 레코드들
+        """
+        self.host = host
+        self.records = records if records is not None else make_records(50)
+        self._lock = threading.Lock()
+        self._running = False
+        self._db_server = _DatabaseServer((host, db_port), _DatabaseHandler)
+        self._db_server.fake = self
+        self.db_port = self._db_server.server_address[1]
+        
+        self._sub_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sub_sock.bind((host, sub_port))
+        self._sub_sock.settimeout(0.5)
+        self.sub_port = self._sub_sock.getsockname()[1]
+        self._subscribers = {}  # (ip, reply port) → expiry time
+
+    def encoded_database(self) -> bytes:
+        """Encode current records / 현재 레코드 인코딩"""
+        with self._lock:
+            return encode_database(self.records)
+
+    def set_status(self, ioc_name: str, status: str):
+        """Change an IOC's overall status and notify subscribers / IOC 상태 변경 및 구독자 알림"""
+        now = int(time.time())
+        event = None
+        with self._lock:
+            for rec in self.records:
+                if rec["name"] != ioc_name or rec["status"] == status:
+                    continue
+                if status == "U":
+                    rec["ping_time"] = now
+                    event = "RECOVER"
+                elif status == "D":
+                    event = "FAIL"
+                rec["status"] = status
+                if event:
+                    self.publish({"name": ioc_name, "event": event, "time": now, "ip": rec["ip"]})
+
+    def publish(self, event: Dict):
+        """Send an event to all live subscribers / 모든 구독자에게 이벤트 전송"""
+        data = encode_event(event)
+        now = time.time()
+        for (ip, port), expiry in list(self._subscribers.items()):
+            if expiry < now:
+                self._subscribers.pop((ip, port), None)
+                continue
+            try:
+                self._sub_sock.sendto(data, (ip, port))
+            except OSError as e:
+                print(f"[WARNING] Event delivery to {ip}:{port} failed: {e}")
+
+    def _subscription_loop(self):
+        while self._running:
+            try:
+                data, (ip, _) = self._sub_sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                reply_port = decode_subscribe(data)
+            except AliveProtocolError as e:
+                print(f"[WARNING] Bad subscribe request from {ip}: {e}")
+                continue
+            self._subscribers[(ip, reply_port)] = time.time() + SUBSCRIPTION_LIFETIME
+
+    def flap(self):
+        """Flip a random IOC up or down / 임의의 IOC 상태 전환"""
+        rec = random.choice(self.records)
+        self.set_status(rec["name"], "U" if rec["status"] == "D" else "D")
+
+    def send_heartbeats(self, target_host: str, target_port: int, period: float = 5.0):
+        """Send heartbeats for all up IOCs until stopped / 중지될 때까지 UP 상태 IOC의 하트비트 전송"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        counter = 0
+        while self._running:
+            counter += 1
+            with self._lock:
+                up = [rec for rec in self.records if rec["status"] == "U"]
+            for rec in up:
+                sock.sendto(encode_heartbeat({
+                    "name": rec["name"],
+                    "incarnation": rec["incarnation"],
+                    "time": int(time.time()),
+                    "heartbeat": counter,
+                    "period": int(period)
+                }), (target_host, target_port))
+            time.sleep(period)
+        sock.close()
+
+    def start(self, heartbeat_port: int = 0, heartbeat_period: float = 5.0):
+        """Start serving in background threads / 백그라운드 스레드에서 서비스 시작"""
+        self._running = True
+        threading.Thread(target=self._db_server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._subscription_loop, daemon=True).start()
+        if heartbeat_port:
+            threading.Thread(target=self.send_heartbeats, args=(self.host, heartbeat_port, heartbeat_period),
+                             daemon=True).start()
+
+    def stop(self):
+        """Stop serving / 서비스 중지"""
+        self._running = False
+        self._db_server.shutdown()
+        self._db_server.server_close()
+        self._sub_sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake alived server for offline testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5679, help="database TCP port")
+    parser.add_argument("--sub-port", type=int, default=5680, help="subscription UDP port")
+    parser.add_argument("--iocs", type=int, default=600)
+    parser.add_argument("--down-ratio", type=float, default=0.05)
+    parser.add_argument("--flap", type=float, default=0, help="seconds between random state changes")
+    parser.add_argument("--heartbeat-port", type=int, default=0, help="UDP port to send heartbeats to")
+    parser.add_argument("--heartbeat-period", type=float, default=5.0)
+    args = parser.parse_args()
+
+    fake = FakeAlived(args.host, args.port, args.sub_port, make_records(args.iocs, args.down_ratio))
+    fake.start(args.heartbeat_port, args.heartbeat_period)
+    print(f"[INFO] Fake alived serving {args.iocs} IOCs on {args.host} "
+          f"(database TCP {fake.db_port}, subscription UDP {fake.sub_port})")
+    try:
+        while True:
+            if args.flap > 0:
+                time.sleep(args.flap)
+                fake.flap()
+            else:
+                time.sleep(1)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+"""
+Alive Database Client
+Alive 데이터베이스 클라이언트
+Reads the whole alived instance database over its TCP port and encodes or
+decodes the event subscription and heartbeat datagrams
+alived의 TCP 포트로 전체 인스턴스 데이터베이스 조회 및 이벤트 구독/하트비트 데이터그램 처리
+"""
+
+import socket
+import struct
+import time
+from typing import Dict, List
+
+# EXPERIMENTAL: every wire format in this module is an assumption, not a
+# documented protocol: the TCP database dump, the UDP subscribe and event
+# datagrams, and the heartbeat layout including its magic 0x4A4C4956.
+# None has been checked against a real alived or alive record, so the
+# paths using them stay opt-in and off by default (ALIVE_DATA_SOURCE=alivectl,
+# FEATURE_ALIVE_SUBSCRIPTION=false, FEATURE_HEARTBEAT_LISTENER=false).
+# 실험적 기능: 이 모듈의 모든 전송 형식은 검증되지 않은 가정이므로 기본적으로 비활성화
+
+# Database dump wire format / 데이터베이스 덤프 전송 형식
+#
+# The server writes one dump per connection and closes it. All integers are
+# network byte order and strings are a uint16 length followed by UTF-8 bytes.
+#
+#   header    uint16 version, uint32 instance count
+#   instance  string name
+#             uint8  overall status ('U', 'D', 'E', ...)
+#             uint32 IPv4 address
+#             uint32 incarnation, uint32 boot time, uint32 ping time (epoch s)
+#             uint32 heartbeat, uint16 period, uint32 user message
+#             uint16 env count,   count x (string key, string value)
+#             string IOC type ("linux", "darwin", "windows", "vxworks", ...)
+#             uint16 extra count, count x (string key, string value)
+DB_PROTOCOL_VERSION = 1
+
+# Event subscription datagrams / 이벤트 구독 데이터그램
+#
+#   subscribe  uint16 version, uint16 reply port        client → subscription_udp_port
+#   event      uint16 version, uint8 event code,        alived → reply port
+#              uint32 time (epoch s), uint32 IPv4 address,
+#              uint32 user message, string IOC name
+#
+# Subscriptions expire, so clients re-send the subscribe datagram periodically.
+EVENT_PROTOCOL_VERSION = 1
+EVENT_NAMES = {
+    0: "FAIL",
+    1: "BOOT",
+    2: "RECOVER",
+    3: "MESSAGE",
+    4: "CONFLICT_START",
+    5: "CONFLICT_STOP"
+}
+EVENT_CODES = {name: code for code, name in EVENT_NAMES.items()}
+
+# Heartbeat datagrams sent by the IOC alive record / IOC alive 레코드가 보내는 하트비트
+#
+#   uint32 magic, uint16 protocol version, uint32 incarnation,
+#   uint32 current time, uint32 heartbeat counter, uint16 period (s),
+#   uint16 flags, uint16 reply port, uint32 user message,
+#   NUL-terminated IOC name
+#
+# Packets whose magic or version differ from the assumed values are
+# rejected rather than misparsed; both can be overridden with
+# HEARTBEAT_MAGIC and HEARTBEAT_PROTOCOL_VERSION.
+
+_HEADER = struct.Struct("!HI")
+_INSTANCE = struct.Struct("!cIIIIIHI")
+_COUNT = struct.Struct("!H")
+_STRLEN = struct.Struct("!H")
+_SUBSCRIBE = struct.Struct("!HH")
+_EVENT = struct.Struct("!HBIII")
+_HEARTBEAT = struct.Struct("!IHIIIHHHI")
+HEARTBEAT_MAGIC = 0x4A4C4956
+HEARTBEAT_PROTOCOL_VERSION = 5
+
+DEFAULT_PORTS = {
+    "heartbeat_udp_port": 5678,
+    "database_tcp_port": 5679,
+    "subscription_udp_port": 5680
+}
+
+
+class AliveProtocolError(Exception):
+    """Malformed data from alived / alived에서 받은 잘못된 데이터"""
+
+
+def load_alived_ports(config_path: str) -> Dict[str, int]:
+    """
+    Read port settings from alived_config.txt / alived_config.txt에서 포트 설정 읽기
+
+    Args:
+        config_path: Path to alived configuration / alived 설정 파일 경로
+
+    Returns:
+        Dict[str, int]: Port name → port number / 포트 이름 → 포트 번호
+    """
+    ports = DEFAULT_PORTS.copy()
+    try:
+        with open(config_path, "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith("_port"):
+                    try:
+                        ports[parts[0]] = int(parts[1])
+                    except ValueError:
+                        pass
+    except OSError:
+        pass
+    return ports
+
+
+def _pack_str(value: str) -> bytes:
+    data = str(value).encode("utf-8")
+    return _STRLEN.pack(len(data)) + data
+
+
+def _pack_pairs(pairs: Dict[str, str]) -> bytes:
+    return _COUNT.pack(len(pairs)) + b"".join(
+        _pack_str(key) + _pack_str(value) for key, value in pairs.items()
+    )
+
+
+def _unpack_str(buf: memoryview, offset: int):
+    (length,) = _STRLEN.unpack_from(buf, offset)
+    offset += _STRLEN.size
+    end = offset + length
+    if end > len(buf):
+        raise AliveProtocolError("string runs past end of data")
+    return bytes(buf[offset:end]).decode("utf-8", "replace"), end
+
+
+def _unpack_pairs(buf: memoryview, offset: int):
+    (count,) = _COUNT.unpack_from(buf, offset)
+    offset += _COUNT.size
+    pairs = {}
+    for _ in range(count):
+        key, offset = _unpack_str(buf, offset)
+        value, offset = _unpack_str(buf, offset)
+        pairs[key] = value
+    return pairs, offset
+
+
+def encode_database(records: List[Dict]) -> bytes:
+    """
+    Encode instance records as a database dump / 인스턴스 레코드를 데이터베이스 덤프로 인코딩
+
+    Args:
+        records: Records in the decode_database() shape / decode_database() 형식의 레코드들
+
+    Returns:
+        bytes: Encoded dump / 인코딩된 덤프
+    """
+    chunks = [_HEADER.pack(DB_PROTOCOL_VERSION, len(records))]
+    for rec in records:
+        chunks.append(_pack_str(rec["name"]))
+        chunks.append(_INSTANCE.pack(
+            rec.get("status", "U").encode("ascii")[:1] or b"U",
+            struct.unpack("!I", socket.inet_aton(rec.get("ip", "0.0.0.0")))[0],
+            rec.get("incarnation", 0),
+            rec.get("boot_time", 0),
+            rec.get("ping_time", 0),
+            rec.get("heartbeat", 0),
+            rec.get("period", 0),
+            rec.get("user_msg", 0)
+        ))
+        chunks.append(_pack_pairs(rec.get("env", {})))
+        chunks.append(_pack_str(rec.get("ioc_type", "")))
+        chunks.append(_pack_pairs(rec.get("extra", {})))
+    return b"".join(chunks)
+
+
+def decode_database(data: bytes) -> List[Dict]:
+    """
+    Decode a database dump / 데이터베이스 덤프 디코딩
+
+    Args:
+        data: Raw bytes read from the database port / 데이터베이스 포트에서 읽은 바이트
+
+    Returns:
+        List[Dict]: Instance records / 인스턴스 레코드들
+    """
+    buf = memoryview(data)
+    try:
+        version, count = _HEADER.unpack_from(buf, 0)
+        if version != DB_PROTOCOL_VERSION:
+            raise AliveProtocolError(f"unsupported database protocol version {version}")
+        offset = _HEADER.size
+
+        records = []
+        for _ in range(count):
+            name, offset = _unpack_str(buf, offset)
+            (status, ip, incarnation, boot_time, ping_time,
+             heartbeat, period, user_msg) = _INSTANCE.unpack_from(buf, offset)
+            offset += _INSTANCE.size
+            env, offset = _unpack_pairs(buf, offset)
+            ioc_type, offset = _unpack_str(buf, offset)
+            extra, offset = _unpack_pairs(buf, offset)
+            records.append({
+                "name": name,
+                "status": status.decode("ascii", "replace"),
+                "ip": socket.inet_ntoa(struct.pack("!I", ip)),
+                "incarnation": incarnation,
+                "boot_time": boot_time,
+                "ping_time": ping_time,
+                "heartbeat": heartbeat,
+                "period": period,
+                "user_msg": user_msg,
+                "env": env,
+                "ioc_type": ioc_type,
+                "extra": extra
+            })
+    except struct.error as e:
+        raise AliveProtocolError(f"truncated database dump: {e}")
+
+    return records
+
+
+def encode_subscribe(reply_port: int) -> bytes:
+    """Encode a subscribe request / 구독 요청 인코딩"""
+    return _SUBSCRIBE.pack(EVENT_PROTOCOL_VERSION, reply_port)
+
+
+def decode_subscribe(data: bytes) -> int:
+    """Decode a subscribe request into its reply port / 구독 요청에서 응답 포트 디코딩"""
+    try:
+        version, reply_port = _SUBSCRIBE.unpack_from(data, 0)
+    except struct.error as e:
+        raise AliveProtocolError(f"truncated subscribe request: {e}")
+    if version != EVENT_PROTOCOL_VERSION:
+        raise AliveProtocolError(f"unsupported event protocol version {version}")
+    return reply_port
+
+
+def encode_event(event: Dict) -> bytes:
+    """
+    Encode an event notification / 이벤트 알림 인코딩
+
+    Args:
+        event: Event in the decode_event() shape / decode_event() 형식의 이벤트
+
+    Returns:
+        bytes: Encoded datagram / 인코딩된 데이터그램
+    """
+    return _EVENT.pack(
+        EVENT_PROTOCOL_VERSION,
+        EVENT_CODES[event["event"]],
+        event.get("time", 0),
+        struct.unpack("!I", socket.inet_aton(event.get("ip", "0.0.0.0")))[0],
+        event.get("user_msg", 0)
+    ) + _pack_str(event["name"])
+
+
+def decode_event(data: bytes) -> Dict:
+    """
+    Decode an event notification / 이벤트 알림 디코딩
+
+    Args:
+        data: Datagram payload / 데이터그램 내용
+
+    Returns:
+        Dict: name, event, time, ip, user_msg / 이벤트 정보
+    """
+    buf = memoryview(data)
+    try:
+        version, code, event_time, ip, user_msg = _EVENT.unpack_from(buf, 0)
+        if version != EVENT_PROTOCOL_VERSION:
+            raise AliveProtocolError(f"unsupported event protocol version {version}")
+        name, _ = _unpack_str(buf, _EVENT.size)
+    except struct.error as e:
+        raise AliveProtocolError(f"truncated event datagram: {e}")
+
+    return {
+        "name": name,
+        "event": EVENT_NAMES.get(code, f"EVENT_{code}"),
+        "time": event_time,
+        "ip": socket.inet_ntoa(struct.pack("!I", ip)),
+        "user_msg": user_msg
+    }
+
+
+def encode_heartbeat(heartbeat: Dict) -> bytes:
+    """Encode a heartbeat datagram / 하트비트 데이터그램 인코딩"""
+    return _HEARTBEAT.pack(
+        HEARTBEAT_MAGIC,
+        heartbeat.get("version", HEARTBEAT_PROTOCOL_VERSION),
+        heartbeat.get("incarnation", 0),
+        heartbeat.get("time", 0),
+        heartbeat.get("heartbeat", 0),
+        heartbeat.get("period", 0),
+        heartbeat.get("flags", 0),
+        heartbeat.get("reply_port", 0),
+        heartbeat.get("user_msg", 0)
+    ) + heartbeat["name"].encode("utf-8") + b"\0"
+
+
+def decode_heartbeat(data: bytes, magic: int = HEARTBEAT_MAGIC,
+                     protocol_version: int = HEARTBEAT_PROTOCOL_VERSION) -> Dict:
+    """
+    Decode a heartbeat datagram / 하트비트 데이터그램 디코딩
+
+    Args:
+        data: Datagram payload / 데이터그램 내용
+        magic: Expected magic number / 예상 매직 번호
+        protocol_version: Expected protocol version / 예상 프로토콜 버전
+
+    Returns:
+        Dict: name, incarnation, time, heartbeat, period, flags, reply_port, user_msg
+    """
+    try:
+        (packet_magic, version, incarnation, sent_time, counter, period,
+         flags, reply_port, user_msg) = _HEARTBEAT.unpack_from(data, 0)
+    except struct.error as e:
+        raise AliveProtocolError(f"truncated heartbeat: {e}")
+    if packet_magic != magic:
+        raise AliveProtocolError(f"heartbeat magic 0x{packet_magic:08X}, expected 0x{magic:08X}")
+    if version != protocol_version:
+        raise AliveProtocolError(f"unsupported heartbeat protocol version {version}")
+    name = data[_HEARTBEAT.size:].split(b"\0", 1)[0].decode("utf-8", "replace")
+    if not name:
+        raise AliveProtocolError("heartbeat without IOC name")
+
+    return {
+        "name": name,
+        "version": version,
+        "incarnation": incarnation,
+        "time": sent_time,
+        "heartbeat": counter,
+        "period": period,
+        "flags": flags,
+        "reply_port": reply_port,
+        "user_msg": user_msg
+    }
+
+
+def format_alive_time(epoch: int) -> str:
+    """Format epoch seconds the way alivectl does / alivectl 형식으로 시간 포맷"""
+    if not epoch:
+        return "N/A"
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch))
+
+
+def format_alivectl_info(record: Dict) -> str:
+    """
+    Render a record as alivectl -i text / 레코드를 alivectl -i 텍스트로 변환
+
+    Keeps the raw_info field of TCP-sourced IOCs readable and in the same
+    format the alivectl parser understands.
+
+    Args:
+        record: Decoded instance record / 디코딩된 인스턴스 레코드
+
+    Returns:
+        str: alivectl-style text / alivectl 형식 텍스트
+    """
+    lines = [
+        record["name"],
+        f"  IP address = {record['ip']}",
+        f"  incarnation = {record['incarnation']} [{format_alive_time(record['incarnation'])}]",
+        f"  boot time = {record['boot_time']} [{format_alive_time(record['boot_time'])}]",
+        f"  ping time = {record['ping_time']} [{format_alive_time(record['ping_time'])}]",
+        f"  heartbeat = {record['heartbeat']}",
+        f"  period = {record['period']}",
+        f"  user message = {record['user_msg']}",
+        f"  overall status = {record['status']}",
+        "  environment variables ="
+    ]
+    lines.extend(f"    {key} = {value}" for key, value in record["env"].items())
+    lines.append(f"  IOC type = {record['ioc_type']}")
+    lines.extend(f"    {key} = {value}" for key, value in record["extra"].items())
+    return "\n".join(lines) + "\n"
+
+
+def _bracketed(value: str) -> str:
+    # "1700000000 [2023-11-14 22:13:20]" → "2023-11-14 22:13:20"
+    start = value.find("[")
+    if start < 0:
+        return value
+    end = value.find("]", start + 1)
+    return value[start + 1:end] if end >= 0 else value[start + 1:]
+
+
+def _leading_int(value: str) -> int:
+    # "1700000000 [2023-11-14 22:13:20]" → 1700000000
+    return int(value.partition("[")[0])
+
+
+# alivectl -i header line key → (IOC record field, converter) pairs / 헤더 키 → (레코드 필드, 변환 함수)
+ALIVECTL_FIELDS = {
+    "IP address": (("ip_address", str),),
+    "incarnation": (("incarnation", _bracketed),),
+    "ping time": (("last_seen", _bracketed), ("ping_time", _leading_int)),
+    "boot time": (("uptime", _bracketed),),
+    "user message": (("message", str),),
+    "heartbeat": (("heartbeat", int),),
+    "overall status": (("overall_status", str),),
+}
+
+# Lines that start a "KEY = value" section / "KEY = value" 섹션 시작 라인
+ALIVECTL_SECTIONS = ("environment variables", "IOC type")
+
+
+def parse_alivectl_info(info_text: str, info) -> None:
+    """
+    Fill an IOC record from alivectl -i text / alivectl -i 텍스트로 IOC 레코드 채우기
+
+    Each line is split once at the first "=" and dispatched on its key:
+    header fields through ALIVECTL_FIELDS, and "KEY = value" lines of the
+    environment and IOC type sections when the record has that key.
+    Values that fail to convert keep the record's default.
+
+    Args:
+        info_text: alivectl -i output / alivectl -i 출력
+        info: IOC record to update (supports "in" and item assignment) / 갱신할 IOC 레코드
+    """
+    fields = ALIVECTL_FIELDS
+    in_section = False
+    for line in info_text.splitlines():
+        key, separator, value = line.partition("=")
+        if not separator:
+            continue
+        key = key.strip()
+        value = value.strip()
+
+        targets = fields.get(key)
+        if targets is not None:
+            for field, convert in targets:
+                try:
+                    info[field] = convert(value)
+                except ValueError:
+                    pass
+        elif key in ALIVECTL_SECTIONS:
+            in_section = True
+        elif in_section and key in info:
+            info[key] = value
+
+
+class AliveDatabaseClient:
+    """Client for the alived database TCP port / alived 데이터베이스 TCP 포트 클라이언트"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 5679, timeout: float = 5.0):
+        """
+        Initialize client / 클라이언트 초기화
+
+        Args:
+            host: alived host / alived 호스트
+            port: database_tcp_port / 데이터베이스 TCP 포트
+            timeout: Connect and read timeout in seconds / 연결 및 읽기 타임아웃 (초)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    @classmethod
+    def from_config(cls, config) -> "AliveDatabaseClient":
+        """Create a client from application Config / 애플리케이션 설정으로 클라이언트 생성"""
+        ports = load_alived_ports(config.ALIVED_CONFIG)
+        return cls(config.ALIVED_HOST, ports["database_tcp_port"], config.ALIVE_FETCH_TIMEOUT)
+
+    def fetch_raw(self) -> bytes:
+        """Read one complete dump / 전체 덤프 한 번 읽기"""
+        chunks = []
+        with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+            sock.settimeout(self.timeout)
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    def fetch(self) -> List[Dict]:
+        """
+        Fetch all instance records / 모든 인스턴스 레코드 조회
+
+        Returns:
+            List[Dict]: Decoded records / 디코딩된 레코드들
+        """
+        return decode_database(self.fetch_raw())
@@ -4,9 +4,27 @@ import time
 import threading
 import re
 import os
-from typing import Dict, List, Optional
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Mapping, Optional
 from datetime import datetime
 
+from services.alive_client import (AliveDatabaseClient, format_alive_time, format_alivectl_info,
+                                   parse_alivectl_info)
+from services.alive_subscriber import AliveEventSubscriber
+from services.heartbeat_listener import HeartbeatListener
+from services.log_writer import get_log_writer
+from services.rollups import DIMENSIONS, StatusRollups
+from services.ioc_index import DEFAULT_PAGE_SIZE, IOCIndex
+from services.ioc_record import NA, IOCRecord, as_dict
+from services.readiness import STALE_AFTER
+from services.snapshot import (PROJECTIONS, EncodedSnapshot, IOCTableSnapshot, SnapshotPublisher,
+                               StreamBroadcaster, StreamClient, diff_details, encode_json, format_sse, project)
+from utils.helpers import read_last_lines
+from services.event_store import (DEFAULT_QUERY_LIMIT, normalize_time_param, open_event_store,
+                                  parse_cursor)
+
 class AliveService:
     """Alive 서버와 통신하는 서비스 / Service for communicating with Alive server"""
     
@@ -19,11 +37,60 @@ class AliveService:
         self._running = False
         self._lock = threading.Lock()
         
+        # Load configuration
+        from config import Config
+        self.config = Config()
+        
+        # Concurrent alivectl fetch engine / 동시 alivectl 조회 엔진
+        self.fetch_workers = max(1, self.config.ALIVE_FETCH_WORKERS)
+        self.fetch_deadline = self.config.ALIVE_FETCH_DEADLINE
+        self.fetch_timeout = self.config.ALIVE_FETCH_TIMEOUT
+        self._fetch_executor = None
+        self._pending_fetches = {}  # IOC name → in-flight future
+        self._parse_memo = {}  # IOC name → (hash of alivectl output, parsed record)
+        self._invalid_bpc = set()  # IOCs already warned about an unparseable BPC
+        
+        # Native alived database client (ALIVE_DATA_SOURCE=tcp) / alived 데이터베이스 클라이언트
+        self.db_client = None
+        if self.config.ALIVE_DATA_SOURCE == "tcp":
+            print("[WARNING] ALIVE_DATA_SOURCE=tcp is experimental; its wire format is an unverified assumption, "
+                  "falling back to alivectl on errors")
+            self.db_client = AliveDatabaseClient.from_config(self.config)
+        
+        # Event-driven updates from the alived subscription port / alived 구독 포트 기반 이벤트 갱신
+        self.subscriber = None
+        if self.config.FEATURE_ALIVE_SUBSCRIPTION:
+            print("[WARNING] FEATURE_ALIVE_SUBSCRIPTION is experimental; its datagram format is an unverified assumption")
+            self.subscriber = AliveEventSubscriber.from_config(self.config, self.apply_event)
+        # ping_time is refreshed by polls, so reconcile well within the readiness staleness limit
+        self.reconcile_interval = min(self.config.ALIVE_RECONCILE_INTERVAL, STALE_AFTER / 2)
+        if self.reconcile_interval < self.config.ALIVE_RECONCILE_INTERVAL:
+            print(f"[WARNING] ALIVE_RECONCILE_INTERVAL={self.config.ALIVE_RECONCILE_INTERVAL}s would let healthy IOCs "
+                  f"look stale after {STALE_AFTER:.0f}s, using {self.reconcile_interval:.0f}s")
+        self._reconcile_now = threading.Event()
+        self._state_changed = threading.Event()
+        
+        # Passive heartbeat listener for early fault detection / 조기 장애 감지를 위한 하트비트 리스너
+        self.heartbeat_listener = None
+        if self.config.FEATURE_HEARTBEAT_LISTENER:
+            print("[WARNING] FEATURE_HEARTBEAT_LISTENER is experimental; its packet format is an unverified assumption")
+            self.heartbeat_listener = HeartbeatListener.from_config(self.config, self.apply_heartbeat_state)
+        self.fetch_stats = {
+            "cycle_ms": None,
+            "ioc_count": 0,
+            "fetched": 0,
+            "timed_out": 0,
+            "errors": 0,
+            "workers": self.fetch_workers,
+            "deadline": self.fetch_deadline,
+            "source": self.config.ALIVE_DATA_SOURCE,
+            "timestamp": None
+        }
+        
         # Cache system
         self._cache = {
             "status_summary": None,
             "faulted_iocs_info": None,
-            "all_events": None,
             "last_cache_update": None
         }
         self.cache_interval = 5  # seconds
@@ -36,13 +103,46 @@ class AliveService:
         # 로그 디렉토리 생성
         self.log_dir = "/home/ctrluser/Apps/IOC_Monitor/logs"
         os.makedirs(self.log_dir, exist_ok=True)
+        self.log_writer = get_log_writer(self.log_dir)
+        
+        # alived event log, followed incrementally / alived 이벤트 로그 (증분 추적)
+        self.events_file = self.config.ALIVE_EVENTS_LOG
+        self.event_store, self.event_tailer = open_event_store(self.config, self.events_file)
+        
+        # Pre-encoded API responses, rebuilt whenever the IOC table changes / IOC 테이블 변경 시 재생성되는 사전 인코딩 응답
+        self.snapshots = SnapshotPublisher()
+        self._publish_lock = threading.Lock()
+        self._publish_requested = threading.Event()
+        self.publish_debounce = self.config.SNAPSHOT_PUBLISH_DEBOUNCE
+        self._table = IOCTableSnapshot(0, {}, frozenset(), IOCIndex([]), {})
+        self._published_summary = None
+        
+        # Called with (table, changed names, removed names) after each publish / 발행 후 호출되는 리스너
+        self._publish_listeners = []
+        
+        # Status counts per group, location and host / 그룹, 위치, 호스트별 상태 집계
+        self.rollups = StatusRollups()
+        
+        # Recent per-version changes for ?since=<version> / ?since=<version>용 최근 버전별 변경 내역
+        self._diff_ring = deque(maxlen=self.config.SNAPSHOT_DIFF_HISTORY)
+        self._diff_lock = threading.Lock()
+        
+        # Server-Sent Events clients of /api/stream / /api/stream SSE 클라이언트
+        self.stream = StreamBroadcaster(max_clients=self.config.STREAM_MAX_CLIENTS)
+        self.stream_keepalive = 15.0  # seconds
+        self._publish()
         
     def start_monitoring(self):
         """Start IOC monitoring thread / IOC 모니터링 스레드 시작"""
         if not self._running:
             self._running = True
+            if self.subscriber is not None:
+                self.subscriber.start()
+            if self.heartbeat_listener is not None:
+                self.heartbeat_listener.start()
             threading.Thread(target=self._monitor_loop, daemon=True).start()
             threading.Thread(target=self._monitor_faulted_iocs, daemon=True).start()
+            threading.Thread(target=self._publisher_loop, daemon=True).start()
             
             # Log server startup
             self._log_server_event("STARTUP", "Server started")
@@ -53,9 +153,7 @@ class AliveService:
         try:
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             log_entry = f"[{timestamp}] IOCMonitor : [{event_type}] {message}\n"
-            
-            with open(self.get_daily_log_path(), "a") as log:
-                log.write(log_entry)
+            self.log_writer.write(log_entry)
         except Exception as e:
             print(f"[ERROR] Failed to log server event: {e}")
     
@@ -66,6 +164,13 @@ class AliveService:
     def stop_monitoring(self):
         """Stop IOC monitoring / IOC 모니터링 중지"""
         self._running = False
+        if self.subscriber is not None:
+            self.subscriber.stop()
+        if self.heartbeat_listener is not None:
+            self.heartbeat_listener.stop()
+        if self._fetch_executor is not None:
+            self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._fetch_executor = None
         print("[INFO] Alive service monitoring stopped")
     
     def _monitor_loop(self):
@@ -73,8 +178,9 @@ class AliveService:
         print("[INFO] Starting main monitoring loop...")
         while self._running:
             try:
-                self._update_ioc_list()
-                self._update_ioc_details()
+                if not self._update_from_database():
+                    self._update_ioc_list()
+                    self._update_ioc_details()
                 self.last_update = datetime.now()
                 
                 # Update cache
@@ -86,88 +192,468 @@ class AliveService:
             except Exception as e:
                 print(f"[ERROR] Alive monitoring failed: {e}")
             
-            time.sleep(self.update_interval)
+            # With live event notifications polling is only a reconciliation pass
+            if self.subscriber is not None and self.subscriber.is_active():
+                interval = self.reconcile_interval
+            else:
+                interval = self.update_interval
+            self._reconcile_now.wait(interval)
+            self._reconcile_now.clear()
     
     def _update_cache(self):
         """Update cache with latest data / 최신 데이터로 캐시 업데이트"""
         try:
+            # Ingest newly appended events outside the lock
+            self.event_tailer.poll()
+            
             with self._lock:
-                # Update status summary cache
-                self._cache["status_summary"] = self._get_status_summary_internal()
+                # Re-apply heartbeat suspects on top of the fresh poll
+                self._apply_suspects()
                 
                 # Update faulted IOCs cache
                 self._cache["faulted_iocs_info"] = self._get_faulted_iocs_info_internal()
                 
-                # Update events cache
-                self._cache["all_events"] = self._get_all_events_internal()
-                
                 self._cache["last_cache_update"] = datetime.now()
+            
+            self._publish()
         except Exception as e:
             print(f"[ERROR] Cache update failed: {e}")
+        
+        self._state_changed.set()
+    
+    def _publish(self):
+        """Encode the API views of the current IOC table / 현재 IOC 테이블의 API 뷰 인코딩
+        
+        Entries of ioc_details are replaced, never mutated, so a shallow copy
+        taken under the lock can be encoded after releasing it. The publish
+        lock keeps snapshots in the order the states were read. The copy
+        becomes the immutable IOCTableSnapshot that readers share.
+        """
+        with self._publish_lock:
+            with self._lock:
+                details = dict(self.ioc_details)
+                masked = set(self.masked_iocs)
+            previous = self._table
+            changed, removed = diff_details(previous.details, details)
+            
+            # Move only the IOCs whose state or mask changed between rollup buckets
+            for ioc_name in removed:
+                self.rollups.remove(ioc_name)
+                if self.heartbeat_listener is not None:
+                    self.heartbeat_listener.forget(ioc_name)
+            remasked = masked.symmetric_difference(previous.masked)
+            for ioc_name in remasked.union(changed).intersection(details):
+                self.rollups.update(ioc_name, details[ioc_name], ioc_name in masked)
+            with self._lock:
+                summary = self._cache["status_summary"] = self._get_status_summary_internal()
+            
+            views = self._build_views(details, masked)
+            rollups = views["rollups"] = self.rollups.snapshot()
+            for dimension in DIMENSIONS:
+                views[f"rollups:{dimension}"] = rollups[dimension]
+            index = IOCIndex(views["data"])
+            views["ip_list"] = index.values("ip_address")
+            bpc = self._numeric_bpc(details, changed, previous.bpc)
+            version = self.snapshots.publish(views)
+            
+            if self.stream.client_count():
+                self._broadcast_diff(version, changed, removed, summary)
+            with self._diff_lock:
+                self._diff_ring.append((version, frozenset(changed), frozenset(removed)))
+                # One attribute swap; readers see either the old or the new table
+                table = self._table = IOCTableSnapshot(version, details, frozenset(masked), index, bpc)
+            self._published_summary = summary
+            
+            if changed or removed:
+                for listener in self._publish_listeners:
+                    try:
+                        listener(table, changed.keys(), removed)
+                    except Exception as e:
+                        print(f"[ERROR] Snapshot listener failed: {e}")
+    
+    def _request_publish(self):
+        """Schedule a coalesced publish for event-driven changes / 이벤트 기반 변경에 대한 병합 발행 예약
+        
+        An event burst becomes one publish per debounce period instead of
+        one full rebuild per event. Before monitoring starts there is no
+        publisher thread, so the table is published directly.
+        """
+        if self._running:
+            self._publish_requested.set()
+        else:
+            with self._lock:
+                self._cache["faulted_iocs_info"] = self._get_faulted_iocs_info_internal()
+            self._publish()
+            self._state_changed.set()
+    
+    def _publisher_loop(self):
+        """Publish requested changes at most once per debounce period / 요청된 변경을 디바운스 주기당 최대 한 번 발행"""
+        while self._running:
+            if not self._publish_requested.wait(1.0):
+                continue
+            # Let the rest of the burst arrive before rebuilding
+            time.sleep(self.publish_debounce)
+            self._publish_requested.clear()
+            try:
+                with self._lock:
+                    self._cache["faulted_iocs_info"] = self._get_faulted_iocs_info_internal()
+                self._publish()
+            except Exception as e:
+                print(f"[ERROR] Snapshot publish failed: {e}")
+            self._state_changed.set()
+    
+    def _numeric_bpc(self, details: Dict, changed: Dict, previous: Mapping[str, int]) -> Dict[str, int]:
+        """Numeric BPC per IOC, parsed at ingest; 0 if missing or invalid / IOC별 숫자 BPC (수집 시 파싱, 없거나 잘못되면 0)"""
+        bpc = {}
+        for ioc_name, info in details.items():
+            value = None if ioc_name in changed else previous.get(ioc_name)
+            if value is None:
+                value = info.bpc if type(info) is IOCRecord else None
+                if value is None:
+                    value = 0
+            bpc[ioc_name] = value
+        return bpc
+    
+    def _validate_bpc(self, info: IOCRecord):
+        """Warn once per IOC about a BPC that is not a number / 숫자가 아닌 BPC를 IOC당 한 번 경고"""
+        ioc_name = info.name
+        if info.bpc is not None or info["BPC"] == NA:
+            self._invalid_bpc.discard(ioc_name)
+        elif ioc_name not in self._invalid_bpc:
+            self._invalid_bpc.add(ioc_name)
+            print(f"[WARNING] Failed to parse BPC value of {ioc_name}: {info['BPC']}, using 0")
+    
+    def _broadcast_diff(self, version: int, changed: Dict, removed: List[str], summary: Dict):
+        """Push per-IOC changes and summary changes to stream clients / 스트림 클라이언트에 IOC별 변경 및 요약 변경 전송"""
+        if not changed and not removed and summary == self._published_summary:
+            return
+        payload = {"version": version, "changed": changed, "removed": removed}
+        if summary != self._published_summary:
+            payload["summary"] = summary
+        self.stream.broadcast(format_sse("diff", encode_json(payload), version))
+    
+    def query_ioc_data(self, filters: Optional[Dict] = None, q: Optional[str] = None,
+                       sort: str = "name", descending: bool = False, page: int = 1,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """Filter, sort and page IOC records through the snapshot indexes / 스냅샷 인덱스로 IOC 레코드 필터, 정렬, 페이지 처리
+        
+        Args:
+            filters: Indexed field (status, GROUP, LOCATION) → accepted values / 인덱스 필드 → 허용 값들
+            q: IOC name substring / IOC 이름 부분 문자열
+            sort: Sort field / 정렬 필드
+            descending: Reverse order / 역순 정렬
+            page: 1-based page / 페이지 번호
+            page_size: Records per page / 페이지 크기
+            
+        Returns:
+            Dict: total, page, page_size, pages, data
+        
+        Raises:
+            ValueError: Unknown filter or sort field / 알 수 없는 필터 또는 정렬 필드
+        """
+        return self._table.index.query(filters, q, sort, descending, page, page_size)
+    
+    def get_index(self) -> IOCIndex:
+        """Get the indexes of the published snapshot / 발행된 스냅샷의 인덱스 가져오기"""
+        return self._table.index
+    
+    def get_projected_view(self, view: str, fields: Optional[tuple] = None,
+                           exclude: Optional[tuple] = None):
+        """Get ioc_details or data with only some fields / 일부 필드만 포함한 ioc_details 또는 data 가져오기
+        
+        Args:
+            view: "ioc_details" (name → record) or "data" (records with masked) / 뷰 이름
+            fields: Fields to keep, all if None / 남길 필드
+            exclude: Fields to drop / 제외할 필드
+        """
+        table = self._table
+        details = table.details
+        masked = table.masked
+        if view == "data":
+            return [project(dict(as_dict(info), masked=name in masked), fields, exclude)
+                    for name, info in details.items()]
+        return {name: project(info, fields, exclude) for name, info in details.items()}
+    
+    def get_ioc_details_since(self, since: int, fields: Optional[tuple] = None,
+                              exclude: Optional[tuple] = None) -> Dict:
+        """Get IOC changes after a snapshot version / 스냅샷 버전 이후의 IOC 변경 사항 가져오기
+        
+        Changes are merged from the diff ring, so only IOCs added, changed or
+        removed after "since" are returned. A version older than the ring
+        (or from before a restart) gets the whole table with "full": true.
+        
+        Args:
+            since: Version from a previous response / 이전 응답의 버전
+            fields: Fields to keep, all if None / 남길 필드
+            exclude: Fields to drop / 제외할 필드
+            
+        Returns:
+            Dict: version, since, full, changed (name → info), removed (names)
+        """
+        with self._diff_lock:
+            details = self._table.details
+            ring = list(self._diff_ring)
+        version = ring[-1][0] if ring else 0
+        
+        # The oldest entry's changes are relative to the version before it
+        if not ring or since < ring[0][0] - 1 or since > version:
+            changed_names = details.keys()
+            removed_names = ()
+            full = True
+        else:
+            changed_names = set()
+            removed_names = set()
+            for entry_version, changed, removed in ring:
+                if entry_version > since:
+                    changed_names |= changed
+                    removed_names |= removed
+            full = False
+        
+        changed_details = {name: project(details[name], fields, exclude)
+                           for name in changed_names if name in details}
+        return {
+            "version": version,
+            "since": since,
+            "full": full,
+            "changed": changed_details,
+            "removed": sorted(name for name in removed_names if name not in details)
+        }
+    
+    def open_stream(self) -> Optional[StreamClient]:
+        """Register a stream client with the full table queued / 전체 테이블을 대기열에 넣은 스트림 클라이언트 등록
+        
+        The full IOC table and summary are queued first, then only diffs.
+        The client is registered under the publish lock, so no change falls
+        between the snapshot and the first diff.
+        
+        Returns:
+            Optional[StreamClient]: None when STREAM_MAX_CLIENTS are connected / 최대 클라이언트 수 도달 시 None
+        """
+        with self._publish_lock:
+            client = self.stream.subscribe()
+            if client is None:
+                return None
+            version = self.snapshots.version
+            client.queue.put_nowait(format_sse("snapshot", b'{"version":%d,"summary":%s,"ioc_details":%s}' % (
+                version, encode_json(self._published_summary), self.snapshots.get("ioc_details").body), version))
+        return client
+    
+    def stream_updates(self, client: StreamClient) -> Iterator[bytes]:
+        """Server-Sent Events for a client from open_stream() / open_stream() 클라이언트의 Server-Sent Events"""
+        try:
+            while not client.dropped:
+                try:
+                    yield client.queue.get(timeout=self.stream_keepalive)
+                except queue.Empty:
+                    # Comment line; also detects disconnected clients / 주석 라인 (끊어진 클라이언트 감지)
+                    yield b": keepalive\n\n"
+        finally:
+            self.stream.unsubscribe(client)
+    
+    def _build_views(self, details: Dict, masked: set) -> Dict:
+        """Build the JSON views served from snapshots / 스냅샷으로 제공되는 JSON 뷰 생성"""
+        plain = {}
+        records = []
+        faulted = []
+        online_count = 0
+        offline_count = 0
+        for ioc_name, info in details.items():
+            # Converted once; the record views share these dicts
+            plain[ioc_name] = as_dict(info)
+            record = dict(plain[ioc_name], masked=ioc_name in masked)
+            records.append(record)
+            status = info.get("status")
+            if status == "ONLINE":
+                online_count += 1
+            elif status == "OFFLINE":
+                offline_count += 1
+                if info.get("name") not in masked:
+                    faulted.append(plain[ioc_name])
+        
+        views = {
+            "ioc_details": plain,
+            "data": records,
+            "faulted_iocs": {
+                "count": len(faulted),
+                "data": faulted
+            },
+            "control_states": {
+                "monitoring_data": {
+                    "Online IOCs": online_count,
+                    "Offline IOCs": offline_count,
+                    "Total IOCs": len(details)
+                },
+                "control_pvs": {}  # 기존 제어 PV 기능은 비활성화
+            }
+        }
+        
+        # Precomputed field projections, served as "<view>:<projection>"
+        for projection, fields in PROJECTIONS.items():
+            views[f"ioc_details:{projection}"] = {
+                name: project(info, fields) for name, info in plain.items()
+            }
+            views[f"data:{projection}"] = [project(record, fields) for record in records]
+        return views
+    
+    def get_snapshot(self, name: str) -> EncodedSnapshot:
+        """Get a pre-encoded API view / 사전 인코딩된 API 뷰 가져오기
+        
+        Args:
+            name: ioc_details, data, ip_list, faulted_iocs, control_states,
+                rollups or rollups:<dimension> / 뷰 이름
+        """
+        return self.snapshots.get(name)
+    
+    def toggle_mask(self, ioc_name: str) -> bool:
+        """Toggle an IOC mask / IOC 마스크 토글
+        
+        Returns:
+            bool: True if the IOC is now masked / 마스크되었으면 True
+        """
+        with self._lock:
+            masked = ioc_name not in self.masked_iocs
+            if masked:
+                self.masked_iocs.add(ioc_name)
+            else:
+                self.masked_iocs.discard(ioc_name)
+            self._cache["faulted_iocs_info"] = self._get_faulted_iocs_info_internal()
+        self._publish()
+        self._state_changed.set()
+        return masked
+    
+    def unmask_all(self):
+        """Unmask all IOCs / 모든 IOC 마스크 해제"""
+        with self._lock:
+            self.masked_iocs.clear()
+            self._cache["faulted_iocs_info"] = self._get_faulted_iocs_info_internal()
+        self._publish()
+        self._state_changed.set()
+    
+    def _apply_suspects(self):
+        """Mark ONLINE IOCs with overdue heartbeats as SUSPECT (lock held) / 하트비트가 지연된 ONLINE IOC를 SUSPECT로 표시"""
+        if self.heartbeat_listener is None:
+            return
+        for ioc_name in self.heartbeat_listener.suspects():
+            info = self.ioc_details.get(ioc_name)
+            if info is not None and info.get("status") == "ONLINE":
+                info = info.copy()
+                info["status"] = "SUSPECT"
+                self.ioc_details[ioc_name] = info
+    
+    def apply_heartbeat_state(self, ioc_name: str, suspect: bool):
+        """Apply a heartbeat listener transition / 하트비트 리스너 상태 전이 반영
+        
+        Args:
+            ioc_name: IOC name / IOC 이름
+            suspect: True when heartbeats became overdue / 하트비트가 지연되면 True
+        """
+        with self._lock:
+            info = self.ioc_details.get(ioc_name)
+            if info is None:
+                return
+            if suspect and info.get("status") == "ONLINE":
+                new_status = "SUSPECT"
+            elif not suspect and info.get("status") == "SUSPECT":
+                new_status = self._determine_actual_status(info)
+            else:
+                return
+            info = info.copy()
+            info["status"] = new_status
+            self.ioc_details[ioc_name] = info
+        
+        self._request_publish()
+        print(f"[INFO] Heartbeat {'overdue' if suspect else 'resumed'}: {ioc_name} → {new_status}")
+    
+    def apply_event(self, event: Dict):
+        """Apply an alived event notification to the IOC table / alived 이벤트 알림을 IOC 테이블에 반영
+        
+        Args:
+            event: Decoded event (name, event, time, ip, user_msg) / 디코딩된 이벤트
+        """
+        event_type = event["event"]
+        ioc_name = event["name"]
+        event_time = format_alive_time(event["time"])
+        
+        with self._lock:
+            previous = self.ioc_details.get(ioc_name)
+            if previous is None:
+                if event_type != "BOOT":
+                    return
+                # New instance: show it now, fill in the details on the next pass
+                previous = self._new_ioc_info(ioc_name, "")
+                self.ioc_list = self.ioc_list + [ioc_name]
+                self._reconcile_now.set()
+            
+            info = previous.copy()
+            if event_type == "BOOT":
+                info["overall_status"] = "U"
+                info["incarnation"] = event_time
+                info["uptime"] = event_time
+            elif event_type == "RECOVER":
+                info["overall_status"] = "U"
+            elif event_type == "FAIL":
+                info["overall_status"] = "D"
+            elif event_type == "MESSAGE":
+                info["message"] = str(event["user_msg"])
+            else:
+                return
+            
+            # Any event but FAIL means alived just heard from the IOC
+            if event_type != "FAIL":
+                info["last_seen"] = event_time
+                info["ping_time"] = event["time"]
+            info["ip_address"] = event["ip"]
+            info["status"] = self._determine_actual_status(info)
+            
+            self.ioc_details[ioc_name] = info
+        
+        self._request_publish()
+        if info["status"] != previous.get("status"):
+            print(f"[INFO] Alive event {event_type}: {ioc_name} {previous.get('status')} → {info['status']}")
     
     def _get_status_summary_internal(self) -> Dict:
-        """Internal method to get status summary / 상태 요약 내부 메서드"""
-        total_count = len(self.ioc_list)
-        online_count = sum(1 for info in self.ioc_details.values() 
-                         if info.get("status") == "ONLINE")
-        offline_count = sum(1 for info in self.ioc_details.values() 
-                          if info.get("status") == "OFFLINE")
-        error_count = sum(1 for info in self.ioc_details.values() 
-                        if info.get("status") in ["ERROR", "UNKNOWN"])
+        """Internal method to get status summary from the global rollup / 전체 집계 기반 상태 요약 내부 메서드"""
+        totals = self.rollups.totals()
         
         return {
-            "total_iocs": total_count,
-            "online_iocs": online_count,
-            "error_iocs": offline_count + error_count,
+            "total_iocs": len(self.ioc_list),
+            "online_iocs": totals["online"],
+            "suspect_iocs": totals["suspect"],
+            "error_iocs": totals["offline"] + totals["error"],
             "last_update": self.last_update.isoformat() if self.last_update else None
         }
     
     def _get_faulted_iocs_info_internal(self) -> Dict:
         """Internal method to get faulted IOCs info / 장애 IOC 정보 내부 메서드"""
         faulted_iocs = []
+        suspect_iocs = []
+        overdue = self.heartbeat_listener.suspects() if self.heartbeat_listener is not None else {}
         for ioc_name, info in self.ioc_details.items():
-            if info.get("status") == "OFFLINE":
-                faulted_iocs.append({
-                    "name": ioc_name,
-                    "status": info.get("status", "OFFLINE"),
-                    "ip_address": info.get("ip_address", "N/A"),
-                    "last_seen": info.get("last_seen", "N/A"),
-                    "message": info.get("message", "N/A"),
-                    "masked": ioc_name in self.masked_iocs
-                })
+            status = info.get("status")
+            if status not in ("OFFLINE", "SUSPECT"):
+                continue
+            entry = {
+                "name": ioc_name,
+                "status": status,
+                "ip_address": info.get("ip_address", "N/A"),
+                "last_seen": info.get("last_seen", "N/A"),
+                "message": info.get("message", "N/A"),
+                "masked": ioc_name in self.masked_iocs
+            }
+            if status == "OFFLINE":
+                faulted_iocs.append(entry)
+            else:
+                entry["heartbeat_age"] = round(overdue.get(ioc_name, 0.0), 1)
+                suspect_iocs.append(entry)
         
         return {
             "faulted_count": len(faulted_iocs),
             "faulted_iocs": faulted_iocs,
+            "suspect_count": len(suspect_iocs),
+            "suspect_iocs": suspect_iocs,
             "timestamp": datetime.now().isoformat()
         }
     
-    def _get_all_events_internal(self) -> List[Dict]:
-        """Internal method to get all events / 모든 이벤트 내부 메서드"""
-        try:
-            log_file = "/home/ctrluser/Apps/IOC_Monitor/logs/events.txt"
-            events = []
-            
-            with open(log_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        events.append({
-                            "time": parts[0] + " " + parts[1],
-                            "event": parts[3],
-                            "ip": parts[4],
-                            "code": parts[5] if len(parts) > 5 else "0"
-                        })
-            
-            return events
-        except Exception as e:
-            print(f"[ERROR] Failed to read events: {e}")
-            return []
-    
     def _monitor_faulted_iocs(self):
         """Monitor faulted IOCs and log changes / 장애 IOC 모니터링 및 변경 로그"""
         # 초기 데이터 로드 대기
@@ -207,15 +693,14 @@ class AliveService:
 
                 # 상태 전이 로그 출력
                 timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-                with open(self.get_daily_log_path(), "a") as log:
-                    if up_to_down:
-                        masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in up_to_down]
-                        joined = ", ".join(masked)
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] 상태 전이 감지 (up → down), 대상: {joined}\n")
-                    if down_to_up:
-                        masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in down_to_up]
-                        joined = ", ".join(masked)
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] 상태 전이 감지 (down → up), 대상: {joined}\n")
+                if up_to_down:
+                    masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in up_to_down]
+                    joined = ", ".join(masked)
+                    self.log_writer.write(f"[{timestamp}] IOCMonitor : [LOG] 상태 전이 감지 (up → down), 대상: {joined}\n")
+                if down_to_up:
+                    masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in down_to_up]
+                    joined = ", ".join(masked)
+                    self.log_writer.write(f"[{timestamp}] IOCMonitor : [LOG] 상태 전이 감지 (down → up), 대상: {joined}\n")
 
                 current_faulted_names = set(ioc.get("name", "N/A") for ioc in faulted)
 
@@ -229,18 +714,21 @@ class AliveService:
                     prev_list = _annotate(self.previous_faulted_iocs)
                     curr_list = _annotate(current_faulted_names)
 
-                    with open(self.get_daily_log_path(), "a") as log:
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] Faulted IOC List 변경 감지,")
-                        log.write(f"    Unmasked Faulted IOC 수: {len(curr_list)}개 ")
-                        log.write(f"    이전: {prev_list}")
-                        log.write(f"    현재: {curr_list}\n")
+                    self.log_writer.write(
+                        f"[{timestamp}] IOCMonitor : [LOG] Faulted IOC List 변경 감지,"
+                        f"    Unmasked Faulted IOC 수: {len(curr_list)}개 "
+                        f"    이전: {prev_list}"
+                        f"    현재: {curr_list}\n"
+                    )
 
                     self.previous_faulted_iocs = current_faulted_names
 
             except Exception as e:
                 print(f"[ERROR] Faulted IOC monitoring failed: {e}")
 
-            time.sleep(5)
+            # Wake up early when a refresh or an alive event changed IOC states
+            self._state_changed.wait(5)
+            self._state_changed.clear()
     
     def get_daily_log_path(self):
         """Get daily log file path / 일일 로그 파일 경로 가져오기"""
@@ -269,180 +757,197 @@ class AliveService:
             print(f"[ERROR] IOC list update failed: {e}")
     
     def _update_ioc_details(self):
-        """Update detailed IOC information / 상세 IOC 정보 업데이트"""
+        """Update detailed IOC information / 상세 IOC 정보 업데이트
+        
+        alivectl -i calls are fanned out over a bounded worker pool and the
+        cycle waits at most fetch_deadline seconds. IOCs that miss the
+        deadline keep their previous details; a call still running is reused
+        by the next cycle and a call that finished late feeds that cycle's
+        fallback instead of being thrown away.
+        """
         with self._lock:
             current_iocs = self.ioc_list.copy()
+            previous_details = self.ioc_details
         
-        new_details = {}
+        if self._fetch_executor is None:
+            self._fetch_executor = ThreadPoolExecutor(
+                max_workers=self.fetch_workers, thread_name_prefix="alivectl"
+            )
         
+        cycle_start = time.monotonic()
+        futures = {}
+        late_results = {}
         for ioc_name in current_iocs:
-            try:
-                result = subprocess.run(
-                    [self.alivectl_path, '-i', ioc_name],
-                    capture_output=True, text=True, timeout=5
-                )
-                
-                if result.returncode == 0:
-                    info = self._parse_ioc_info(result.stdout, ioc_name)
-                    new_details[ioc_name] = info
-                else:
-                    new_details[ioc_name] = {
-                        "name": ioc_name,
-                        "status": "ERROR",
-                        "error": result.stderr.strip()
-                    }
-                    
-            except Exception as e:
-                new_details[ioc_name] = {
+            future = self._pending_fetches.get(ioc_name)
+            if future is None or future.done():
+                if future is not None and not future.cancelled():
+                    late_results[ioc_name] = future.result()
+                future = self._fetch_executor.submit(self._fetch_ioc_info, ioc_name)
+                self._pending_fetches[ioc_name] = future
+            futures[ioc_name] = future
+        
+        done, _ = wait(futures.values(), timeout=self.fetch_deadline)
+        
+        new_details = {}
+        timed_out = 0
+        errors = 0
+        for ioc_name in current_iocs:
+            future = futures[ioc_name]
+            if future in done:
+                info = future.result()
+                self._pending_fetches.pop(ioc_name, None)
+                if info.get("status") == "ERROR":
+                    errors += 1
+            else:
+                timed_out += 1
+                info = late_results.get(ioc_name) or previous_details.get(ioc_name) or {
                     "name": ioc_name,
-                    "status": "ERROR",
-                    "error": str(e)
+                    "status": "UNKNOWN",
+                    "error": f"alivectl did not answer within {self.fetch_deadline}s"
                 }
+            new_details[ioc_name] = info
+        
+        # Forget in-flight calls for IOCs that left the list
+        for ioc_name in list(self._pending_fetches):
+            if ioc_name not in futures:
+                self._pending_fetches.pop(ioc_name).cancel()
+        for ioc_name in list(self._parse_memo):
+            if ioc_name not in futures:
+                self._parse_memo.pop(ioc_name, None)
+        
+        cycle_ms = (time.monotonic() - cycle_start) * 1000
         
         with self._lock:
             self.ioc_details = new_details
+            self.fetch_stats = {
+                "cycle_ms": round(cycle_ms, 1),
+                "ioc_count": len(current_iocs),
+                "fetched": len(current_iocs) - timed_out,
+                "timed_out": timed_out,
+                "errors": errors,
+                "workers": self.fetch_workers,
+                "deadline": self.fetch_deadline,
+                "source": "alivectl",
+                "timestamp": datetime.now().isoformat()
+            }
             
-        print(f"[INFO] Loaded {len(new_details)} IOCs from Alive server")
-    
-    def _parse_ioc_info(self, info_text: str, ioc_name: str) -> Dict:
-        """Parse IOC information from alivectl output / alivectl 출력에서 IOC 정보 파싱"""
-        info = {
-            "name": ioc_name,
-            "status": "UNKNOWN",
-            "ip_address": "N/A",
-            "incarnation": "N/A",
-            "last_seen": "N/A",
-            "uptime": "N/A",
-            "message": "N/A",
-            "heartbeat": 0,
-            "ping_time": 0,
-            "overall_status": "UNKNOWN",
-            "raw_info": info_text,
-            # 기존 환경 변수들 추가
-            "ARCH": "N/A",
-            "TOP": "N/A",
-            "EPICS_BASE": "N/A",
-            "SUPPORT": "N/A",
-            "ENGINEER": "N/A",
-            "GROUP": "N/A",
-            "LOCATION": "N/A",
-            "DBLIST": "N/A",
-            "PURPOSE": "N/A",
-            "BPC": "N/A",
-            # ENV1-ENV16 추가
-            "ENV1": "N/A",
-            "ENV2": "N/A",
-            "ENV3": "N/A",
-            "ENV4": "N/A",
-            "ENV5": "N/A",
-            "ENV6": "N/A",
-            "ENV7": "N/A",
-            "ENV8": "N/A",
-            "ENV9": "N/A",
-            "ENV10": "N/A",
-            "ENV11": "N/A",
-            "ENV12": "N/A",
-            "ENV13": "N/A",
-            "ENV14": "N/A",
-            "ENV15": "N/A",
-            "ENV16": "N/A",
-            "user": "N/A",
-            "group": "N/A",
-            "host": "N/A"
-        }
+        print(f"[INFO] Loaded {len(new_details)} IOCs from Alive server in {cycle_ms:.0f} ms "
+              f"({timed_out} timed out, {errors} errors)")
+    
+    def _update_from_database(self) -> bool:
+        """Refresh IOC list and details from the alived database port / alived 데이터베이스 포트로 IOC 목록 및 상세 정보 갱신
         
-        lines = info_text.split('\n')
-        in_env_vars = False
-        in_linux_info = False
+        Returns False when the TCP source is disabled or unreachable so the
+        caller can fall back to alivectl for this cycle.
+        """
+        if self.db_client is None:
+            return False
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        cycle_start = time.monotonic()
+        try:
+            records = self.db_client.fetch()
+        except Exception as e:
+            print(f"[WARNING] alived database read failed, falling back to alivectl: {e}")
+            return False
+        
+        new_details = {}
+        for record in records:
+            new_details[record["name"]] = self._record_to_ioc_info(record)
+        
+        cycle_ms = (time.monotonic() - cycle_start) * 1000
+        
+        with self._lock:
+            self.ioc_list = list(new_details)
+            self.ioc_details = new_details
+            self.fetch_stats = {
+                "cycle_ms": round(cycle_ms, 1),
+                "ioc_count": len(new_details),
+                "fetched": len(new_details),
+                "timed_out": 0,
+                "errors": 0,
+                "workers": 1,
+                "deadline": self.db_client.timeout,
+                "source": "tcp",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        print(f"[INFO] Loaded {len(new_details)} IOCs from alived database in {cycle_ms:.0f} ms")
+        return True
+    
+    def _fetch_ioc_info(self, ioc_name: str) -> Dict:
+        """Fetch and parse one IOC via alivectl -i / alivectl -i로 IOC 하나 조회 및 파싱"""
+        try:
+            result = subprocess.run(
+                [self.alivectl_path, '-i', ioc_name],
+                capture_output=True, text=True, timeout=self.fetch_timeout
+            )
+            
+            if result.returncode == 0:
+                return self._parse_ioc_info(result.stdout, ioc_name)
+            return {
+                "name": ioc_name,
+                "status": "ERROR",
+                "error": result.stderr.strip()
+            }
                 
-            # Parse different fields based on actual alivectl output format
-            if 'IP address =' in line:
-                ip_match = line.split('IP address =')[1].strip()
-                info["ip_address"] = ip_match
-            elif 'incarnation =' in line:
-                inc_match = line.split('incarnation =')[1].strip()
-                # Extract timestamp from incarnation
-                if '[' in inc_match:
-                    inc_match = inc_match.split('[')[1].split(']')[0]
-                info["incarnation"] = inc_match
-            elif 'ping time =' in line:
-                ping_match = line.split('ping time =')[1].strip()
-                # Extract timestamp from ping time
-                if '[' in ping_match:
-                    ping_match = ping_match.split('[')[1].split(']')[0]
-                info["last_seen"] = ping_match
-                # Extract numeric ping time for status calculation
-                try:
-                    ping_numeric = int(ping_match.split('[')[0].strip())
-                    info["ping_time"] = ping_numeric
-                except Exception as e:
-                    # Try to extract from the original line
-                    try:
-                        original_ping = line.split('ping time =')[1].strip()
-                        ping_numeric = int(original_ping.split('[')[0].strip())
-                        info["ping_time"] = ping_numeric
-                    except Exception as e2:
-                        pass
-            elif 'boot time =' in line:
-                boot_match = line.split('boot time =')[1].strip()
-                # Extract timestamp from boot time
-                if '[' in boot_match:
-                    boot_match = boot_match.split('[')[1].split(']')[0]
-                info["uptime"] = boot_match
-            elif 'user message =' in line:
-                msg_match = line.split('user message =')[1].strip()
-                info["message"] = msg_match
-            elif 'heartbeat =' in line:
-                try:
-                    heartbeat = int(line.split('heartbeat =')[1].strip())
-                    info["heartbeat"] = heartbeat
-                except:
-                    pass
-            elif 'overall status =' in line:
-                status_match = line.split('overall status =')[1].strip()
-                info["overall_status"] = status_match
-                # Convert status codes to readable format
-                if status_match == 'U':
-                    info["status"] = "UP"
-                elif status_match == 'D':
-                    info["status"] = "DOWN"
-                elif status_match == 'E':
-                    info["status"] = "ERROR"
-                else:
-                    info["status"] = status_match
-            elif 'environment variables =' in line:
-                in_env_vars = True
-                in_linux_info = False
-                continue
-            elif 'IOC type =' in line:
-                in_env_vars = False
-                in_linux_info = True
-                continue
-            elif in_env_vars and '=' in line:
-                # 환경 변수 파싱
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    var_name = parts[0].strip()
-                    var_value = parts[1].strip()
-                    if var_name in info:
-                        info[var_name] = var_value
-            elif in_linux_info and '=' in line:
-                # Linux 정보 파싱
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    var_name = parts[0].strip()
-                    var_value = parts[1].strip()
-                    if var_name in info:
-                        info[var_name] = var_value
-        
-        # Determine actual online/offline status based on overall status and heartbeat
+        except Exception as e:
+            return {
+                "name": ioc_name,
+                "status": "ERROR",
+                "error": str(e)
+            }
+    
+    def _new_ioc_info(self, ioc_name: str, info_text: str) -> IOCRecord:
+        """Create an IOC record with default values / 기본값으로 IOC 레코드 생성"""
+        return IOCRecord(ioc_name, info_text)
+    
+    def _record_to_ioc_info(self, record: Dict) -> IOCRecord:
+        """Convert an alived database record to an IOC record / alived 데이터베이스 레코드를 IOC 레코드로 변환"""
+        info = self._new_ioc_info(record["name"], format_alivectl_info(record))
+        info["ip_address"] = record["ip"]
+        info["incarnation"] = format_alive_time(record["incarnation"])
+        info["uptime"] = format_alive_time(record["boot_time"])
+        info["last_seen"] = format_alive_time(record["ping_time"])
+        info["ping_time"] = record["ping_time"]
+        info["heartbeat"] = record["heartbeat"]
+        info["message"] = str(record["user_msg"])
+        info["overall_status"] = record["status"]
+        
+        for var_name, var_value in record["env"].items():
+            if var_name in info:
+                info[var_name] = var_value
+        for var_name, var_value in record["extra"].items():
+            if var_name in info:
+                info[var_name] = var_value
+        
+        self._validate_bpc(info)
         info["status"] = self._determine_actual_status(info)
+        return info
+    
+    def _parse_ioc_info(self, info_text: str, ioc_name: str) -> IOCRecord:
+        """Parse IOC information from alivectl output / alivectl 출력에서 IOC 정보 파싱
         
+        Output identical to the IOC's previous output (same hash, same text)
+        reuses the previous record, so only the time-dependent status is
+        re-evaluated for IOCs that did not change.
+        """
+        text_hash = hash(info_text)
+        memo = self._parse_memo.get(ioc_name)
+        if memo is not None and memo[0] == text_hash and memo[1]["raw_info"] == info_text:
+            info = memo[1]
+            status = self._determine_actual_status(info)
+            if status == info["status"]:
+                return info
+            info = info.copy()
+        else:
+            info = self._new_ioc_info(ioc_name, info_text)
+            parse_alivectl_info(info_text, info)
+            self._validate_bpc(info)
+            # Determine actual online/offline status based on overall status and heartbeat
+            status = self._determine_actual_status(info)
+        
+        info["status"] = status
+        self._parse_memo[ioc_name] = (text_hash, info)
         return info
     
     def _determine_actual_status(self, info: Dict) -> str:
@@ -489,15 +994,50 @@ class AliveService:
         with self._lock:
             return self.ioc_list.copy()
     
-    def get_ioc_details(self) -> Dict:
-        """Get detailed IOC information / 상세 IOC 정보 가져오기"""
-        with self._lock:
-            return self.ioc_details.copy()
+    def get_ioc_details(self) -> Mapping[str, Dict]:
+        """Get detailed IOC information / 상세 IOC 정보 가져오기
+        
+        Returns the read-only mapping of the published snapshot without
+        locking or copying; use dict() before modifying or jsonify().
+        """
+        return self._table.details
     
     def get_ioc_detail(self, ioc_name: str) -> Optional[Dict]:
-        """Get specific IOC detail / 특정 IOC 상세 정보 가져오기"""
+        """Get specific IOC detail (shared, do not modify) / 특정 IOC 상세 정보 가져오기 (공유 객체, 수정 금지)"""
+        return self._table.details.get(ioc_name)
+    
+    def add_publish_listener(self, listener):
+        """Call listener(table, changed names, removed names) after every publish that changed IOCs / IOC가 바뀐 발행마다 리스너 호출
+        
+        Listeners run on the publishing thread while the publish lock is
+        held, so they see every change in order and must only queue work.
+        The current table is passed once right away, with every IOC as changed.
+        """
+        with self._publish_lock:
+            self._publish_listeners.append(listener)
+            table = self._table
+            listener(table, table.details.keys(), ())
+    
+    def get_table(self) -> IOCTableSnapshot:
+        """Get the published IOC table snapshot / 발행된 IOC 테이블 스냅샷 가져오기"""
+        return self._table
+    
+    def get_fetch_stats(self) -> Dict:
+        """Get last refresh cycle statistics / 마지막 갱신 주기 통계 가져오기"""
         with self._lock:
-            return self.ioc_details.get(ioc_name)
+            return dict(self.fetch_stats)
+    
+    def get_heartbeat_stats(self) -> Dict:
+        """Get passive heartbeat statistics / 수동 하트비트 통계 가져오기"""
+        if self.heartbeat_listener is None:
+            return {"enabled": False, "iocs": {}}
+        return {
+            "enabled": True,
+            "port": self.heartbeat_listener.port,
+            "heartbeats_received": self.heartbeat_listener.heartbeats_received,
+            "heartbeats_rejected": self.heartbeat_listener.heartbeats_rejected,
+            "iocs": self.heartbeat_listener.get_stats()
+        }
     
     def get_status_summary(self) -> Dict:
         """Get IOC status summary / IOC 상태 요약 가져오기"""
@@ -515,35 +1055,47 @@ class AliveService:
             else:
                 return self._get_faulted_iocs_info_internal()
     
-    def get_ioc_logs(self, ioc_name: str) -> List[Dict]:
-        """Get IOC event logs / IOC 이벤트 로그 가져오기"""
-        logfile = "/home/ctrluser/Apps/IOC_Monitor/logs/events.txt"
-        logs = []
+    def get_all_events(self) -> List[Dict]:
+        """Get all alive events, oldest first / 모든 alive 이벤트 가져오기 (오래된 순)"""
+        self.event_tailer.poll()
+        return self.event_store.all()
+    
+    def query_events(self, since: Optional[str] = None, until: Optional[str] = None,
+                     event: Optional[str] = None, cursor: Optional[str] = None,
+                     limit: int = DEFAULT_QUERY_LIMIT, order: str = "asc") -> Dict:
+        """
+        Query alive events by time range and type / 시간 범위와 유형으로 alive 이벤트 조회
 
-        try:
-            with open(logfile, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # events.txt 형식: 2025-08-07 00:39:12 TEST-SYS:MCP-EXP001 FAIL 192.168.70.235 0
-                    if ioc_name in line:
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            logs.append({
-                                "time": parts[0] + " " + parts[1],  # ex. 2025-08-07 00:39:12
-                                "event": parts[3],                  # ex. BOOT, FAIL
-                                "ip": parts[4],                     # ex. 192.168.70.235
-                                "code": parts[5] if len(parts) > 5 else "0"  # ex. 0
-                            })
-        except FileNotFoundError:
-            print(f"[WARNING] Log file not found: {logfile}")
-        except Exception as e:
-            print(f"[ERROR] Failed to read log file: {e}")
+        Args:
+            since: Start time, "YYYY-MM-DD[ HH:MM:SS]" / 시작 시간
+            until: End time, a bare date covers the whole day / 종료 시간 (날짜만 주면 하루 전체)
+            event: Event type (FAIL, BOOT, RECOVER, ...) / 이벤트 유형
+            cursor: Opaque cursor from a previous response / 이전 응답의 커서
+            limit: Page size / 페이지 크기
+            order: "asc" or "desc" / 정렬 순서
+
+        Returns:
+            Dict: events, count, cursor, head_cursor, has_more
 
-        # 최신 순서로 역정렬
-        return logs[::-1]
+        Raises:
+            ValueError: Invalid parameter / 잘못된 파라미터
+        """
+        if order not in ("asc", "desc"):
+            raise ValueError(f"invalid order '{order}', expected asc or desc")
+        self.event_tailer.poll()
+        return self.event_store.query(
+            since=normalize_time_param(since),
+            until=normalize_time_param(until, end_of_range=True),
+            event=event.upper() if event else None,
+            cursor=parse_cursor(cursor),
+            limit=limit,
+            order=order
+        )
+    
+    def get_ioc_logs(self, ioc_name: str) -> List[Dict]:
+        """Get IOC event logs, newest first / IOC 이벤트 로그 가져오기 (최신 순)"""
+        self.event_tailer.poll()
+        return self.event_store.events_for_ioc(ioc_name)
     
     def get_server_log_dates(self) -> List[str]:
         """Get available server log dates / 사용 가능한 서버 로그 날짜 가져오기"""
@@ -560,17 +1112,38 @@ class AliveService:
             print(f"[ERROR] Failed to get log dates: {e}")
             return []
     
+    def get_server_log_path(self, date: str) -> str:
+        """Get server log file path by date / 날짜별 서버 로그 파일 경로 가져오기"""
+        return os.path.join(self.log_dir, f"faulted_ioc_{date}.log")
+    
     def get_server_log_by_date(self, date: str) -> str:
         """Get server log content by date / 날짜별 서버 로그 내용 가져오기"""
         try:
-            log_path = os.path.join(self.log_dir, f"faulted_ioc_{date}.log")
-            with open(log_path, "r") as f:
+            with open(self.get_server_log_path(date), "r") as f:
                 content = f.read()
             return content
         except Exception as e:
             print(f"[ERROR] Failed to read log for date {date}: {e}")
             return f"로그 파일 읽기 실패: {e}"
     
+    def get_server_log_tail(self, date: str, tail: int, offset: int = 0) -> str:
+        """
+        Get the last lines of a server log / 서버 로그의 마지막 라인들 가져오기
+        
+        Args:
+            date: Log date / 로그 날짜
+            tail: Number of lines / 라인 수
+            offset: Newest lines to skip, for paging backwards / 건너뛸 최신 라인 수
+            
+        Returns:
+            str: Lines in file order / 파일 순서의 라인들
+        """
+        try:
+            return "".join(read_last_lines(self.get_server_log_path(date), tail, offset))
+        except Exception as e:
+            print(f"[ERROR] Failed to read log for date {date}: {e}")
+            return f"로그 파일 읽기 실패: {e}"
+    
     def ping_alive_server(self) -> bool:
         """Ping alive server to check if it's running / Alive 서버가 실행 중인지 확인"""
         try:
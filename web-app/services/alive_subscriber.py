@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Alive Event Subscriber
+Alive 이벤트 구독자
+Receives BOOT/FAIL/RECOVER notifications from the alived subscription port
+alived 구독 포트에서 BOOT/FAIL/RECOVER 알림 수신
+"""
+
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from services.alive_client import AliveProtocolError, decode_event, encode_subscribe, load_alived_ports
+
+
+class AliveEventSubscriber:
+    """Subscriber for alived event notifications / alived 이벤트 알림 구독자
+
+    The subscription counts as active while subscribe renewals go out
+    without error, so a quiet site with no events stays on reconcile-only
+    polling. It drops to inactive when a renewal fails or the host reports
+    alived's subscription port unreachable. The subscribe exchange has no
+    acknowledgement, so the reconcile poll still corrects missed events.
+    """
+
+    def __init__(self, host: str, port: int, on_event: Callable[[Dict], None],
+                 listen_port: int = 0, renew_interval: float = 30.0):
+        """
+        Initialize subscriber / 구독자 초기화
+
+        Args:
+            host: alived host / alived 호스트
+            port: subscription_udp_port / 구독 UDP 포트
+            on_event: Called with each decoded event / 디코딩된 이벤트마다 호출되는 콜백
+            listen_port: Local UDP port for notifications, 0 for any / 알림 수신 로컬 UDP 포트 (0이면 임의)
+            renew_interval: Seconds between subscribe requests / 구독 요청 간격 (초)
+        """
+        self.host = host
+        self.port = port
+        self.on_event = on_event
+        self.listen_port = listen_port
+        self.renew_interval = renew_interval
+
+        self._sock: Optional[socket.socket] = None
+        self._running = False
+        self.events_received = 0
+        self.last_event_time: Optional[float] = None
+        self._subscribed_monotonic: Optional[float] = None  # last renewal sent without error
+
+    @classmethod
+    def from_config(cls, config, on_event: Callable[[Dict], None]) -> "AliveEventSubscriber":
+        """Create a subscriber from application Config / 애플리케이션 설정으로 구독자 생성"""
+        ports = load_alived_ports(config.ALIVED_CONFIG)
+        return cls(config.ALIVED_HOST, ports["subscription_udp_port"], on_event,
+                   config.ALIVE_SUBSCRIBER_PORT)
+
+    def start(self) -> bool:
+        """
+        Bind the notification socket and start receiving / 알림 소켓 바인드 및 수신 시작
+
+        Returns:
+            bool: True if the socket could be bound / 소켓 바인드 성공 여부
+        """
+        if self._running:
+            return True
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(("", self.listen_port))
+            sock.settimeout(1.0)
+        except OSError as e:
+            print(f"[ERROR] Alive event subscriber could not bind UDP port {self.listen_port}: {e}")
+            return False
+
+        self._sock = sock
+        self.listen_port = sock.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._receive_loop, daemon=True).start()
+        print(f"[INFO] Alive event subscriber listening on UDP {self.listen_port} "
+              f"(alived {self.host}:{self.port})")
+        return True
+
+    def stop(self):
+        """Stop receiving / 수신 중지"""
+        self._running = False
+
+    def is_active(self) -> bool:
+        """Check whether the subscription is being renewed / 구독이 정상적으로 갱신되고 있는지 확인"""
+        last = self._subscribed_monotonic
+        return self._running and last is not None and time.monotonic() - last < 2 * self.renew_interval
+
+    def _subscribe(self):
+        try:
+            self._sock.sendto(encode_subscribe(self.listen_port), (self.host, self.port))
+            self._subscribed_monotonic = time.monotonic()
+        except OSError as e:
+            self._subscribed_monotonic = None
+            print(f"[WARNING] Alive subscribe request failed: {e}")
+
+    def _receive_loop(self):
+        next_renew = 0.0
+        try:
+            while self._running:
+                now = time.monotonic()
+                if now >= next_renew:
+                    self._subscribe()
+                    next_renew = now + self.renew_interval
+
+                try:
+                    data, _ = self._sock.recvfrom(2048)
+                except socket.timeout:
+                    continue
+                except ConnectionRefusedError:
+                    # ICMP port unreachable for the subscribe request: alived is not listening
+                    if self._subscribed_monotonic is not None:
+                        print(f"[WARNING] Alive subscription port {self.host}:{self.port} unreachable")
+                    self._subscribed_monotonic = None
+                    continue
+                except OSError as e:
+                    print(f"[ERROR] Alive event receive failed: {e}")
+                    time.sleep(1)
+                    continue
+
+                try:
+                    event = decode_event(data)
+                except AliveProtocolError as e:
+                    print(f"[WARNING] Ignoring malformed alive event: {e}")
+                    continue
+
+                self.events_received += 1
+                self.last_event_time = time.time()
+                try:
+                    self.on_event(event)
+                except Exception as e:
+                    print(f"[ERROR] Alive event handling failed: {e}")
+        finally:
+            self._sock.close()
+            self._sock = None
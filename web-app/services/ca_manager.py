@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Channel Access Manager
+Channel Access 관리자
+Shared pool of persistent pyepics channels for PV reads and writes
+PV 읽기/쓰기를 위한 공유 영구 pyepics 채널 풀
+"""
+
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    from epics import PV
+    EPICS_AVAILABLE = True
+except ImportError:
+    EPICS_AVAILABLE = False
+
+
+BATCH_SUBPROCESS_WORKERS = 16  # concurrent caget/caput processes without pyepics
+
+
+class CAError(Exception):
+    """Channel Access read or write failed / Channel Access 읽기 또는 쓰기 실패"""
+
+
+class CATimeoutError(CAError):
+    """No connection or reply within the timeout / 제한 시간 내 연결 또는 응답 없음"""
+
+
+def _coerce(pv, value: Any) -> Any:
+    """Convert a string value for a numeric channel, as caput does / caput처럼 숫자 채널용 문자열 값 변환"""
+    if not isinstance(value, str):
+        return value
+    field_type = pv.type or ""
+    if "string" in field_type or "char" in field_type:
+        return value
+    text = value.strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    if "enum" in field_type:
+        return text  # pyepics maps state names to indexes
+    try:
+        return float(text)
+    except ValueError:
+        raise CAError(f"'{value}' is not a number")
+
+
+def _ok(value: Any) -> Dict:
+    return {"success": True, "status": "ok", "value": value}
+
+
+def _failed(error: Exception) -> Dict:
+    status = "timeout" if isinstance(error, CATimeoutError) else "error"
+    return {"success": False, "status": status, "error": str(error)}
+
+
+class _Channel:
+    """One pooled channel / 풀에 있는 채널 하나"""
+
+    __slots__ = ("pv", "last_used")
+
+    def __init__(self, pv):
+        self.pv = pv
+        self.last_used = time.monotonic()
+
+
+class ChannelManager:
+    """Persistent Channel Access channels shared by all callers / 모든 호출자가 공유하는 영구 CA 채널
+
+    The first access to a PV creates a monitored pyepics channel; later
+    reads return the monitored value without a network round trip. Channels
+    unused for idle_timeout seconds are disconnected by a reaper thread,
+    except pinned names: pyepics may share one underlying channel between
+    PV objects of the same name, so disconnecting could drop monitors that
+    other components (PVService control PVs) keep on it.
+    Without pyepics every call falls back to a caget/caput subprocess.
+    """
+
+    def __init__(self, connect_timeout: float = 2.0, put_timeout: float = 10.0, idle_timeout: float = 300.0):
+        """
+        Initialize manager / 관리자 초기화
+
+        Args:
+            connect_timeout: Seconds to wait for a connection or reply / 연결 또는 응답 대기 시간 (초)
+            put_timeout: Seconds to wait for a put to complete / put 완료 대기 시간 (초)
+            idle_timeout: Seconds before an unused channel is dropped / 미사용 채널 해제 시간 (초)
+        """
+        self.connect_timeout = connect_timeout
+        self.put_timeout = put_timeout
+        self.idle_timeout = idle_timeout
+        self._channels: Dict[str, _Channel] = {}
+        self._pinned: Set[str] = set()
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    @property
+    def pooled(self) -> bool:
+        """Whether channels are pooled with pyepics / pyepics 채널 풀 사용 여부"""
+        return EPICS_AVAILABLE
+
+    def _channel(self, pvname: str):
+        with self._lock:
+            channel = self._channels.get(pvname)
+            if channel is None:
+                channel = self._channels[pvname] = _Channel(PV(pvname, auto_monitor=True))
+                if self._reaper is None:
+                    self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+                    self._reaper.start()
+            channel.last_used = time.monotonic()
+            return channel.pv
+
+    def _connected(self, pvname: str, timeout: float):
+        pv = self._channel(pvname)
+        if not pv.wait_for_connection(timeout=timeout):
+            raise CATimeoutError(f"{pvname} not connected within {timeout}s")
+        return pv
+
+    def get(self, pvname: str, as_string: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Read a PV / PV 읽기
+
+        Args:
+            pvname: PV name / PV 이름
+            as_string: Return the value as caget -t prints it / caget -t 출력과 같은 문자열로 반환
+            timeout: Seconds to wait, connect_timeout by default / 대기 시간 (기본값 connect_timeout)
+
+        Raises:
+            CATimeoutError: Not connected or no reply in time / 제한 시간 내 연결 또는 응답 없음
+            CAError: Read failed / 읽기 실패
+        """
+        timeout = self.connect_timeout if timeout is None else timeout
+        if not EPICS_AVAILABLE:
+            return self._caget(pvname, timeout)
+
+        pv = self._connected(pvname, timeout)
+        value = pv.get(as_string=as_string, timeout=timeout, use_monitor=True)
+        if value is None:
+            raise CATimeoutError(f"{pvname} did not reply within {timeout}s")
+        return value
+
+    def put(self, pvname: str, value: Any, timeout: Optional[float] = None):
+        """
+        Write a PV and wait for completion / PV 쓰기 후 완료 대기
+
+        Args:
+            pvname: PV name / PV 이름
+            value: Value; strings are converted for numeric channels / 값 (숫자 채널이면 문자열 변환)
+            timeout: Seconds to wait, put_timeout by default / 대기 시간 (기본값 put_timeout)
+
+        Raises:
+            CATimeoutError: Not connected or not completed in time / 제한 시간 내 연결 또는 완료 안 됨
+            CAError: Write failed / 쓰기 실패
+        """
+        timeout = self.put_timeout if timeout is None else timeout
+        if not EPICS_AVAILABLE:
+            self._caput(pvname, value, timeout)
+            return
+
+        pv = self._connected(pvname, min(timeout, self.connect_timeout))
+        try:
+            result = pv.put(_coerce(pv, value), wait=True, timeout=timeout)
+        except CAError:
+            raise
+        except Exception as e:
+            raise CAError(f"{pvname} put failed: {e}")
+        if result is not None and result < 0:
+            raise CATimeoutError(f"{pvname} put did not complete within {timeout}s")
+
+    def get_many(self, pvnames: List[str], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Read many PVs within one deadline / 하나의 기한 안에 여러 PV 읽기
+
+        All channel searches go out together and each PV is read as soon as
+        it connects, so a dead PV cannot use up the deadline of the others.
+        A read waits at most an even share of the time left.
+
+        Args:
+            pvnames: PV names / PV 이름들
+            timeout: Seconds for the whole batch, connect_timeout by default / 전체 대기 시간
+
+        Returns:
+            Dict: PV name → {"success", "status": "ok"/"timeout"/"error", "value" or "error"}
+        """
+        timeout = self.connect_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        pvnames = list(dict.fromkeys(pvnames))
+        if not EPICS_AVAILABLE:
+            return self._run_batch([(name, self._caget, (name, timeout)) for name in pvnames], deadline)
+
+        unconnected = {name: self._channel(name) for name in pvnames}
+        results = {}
+        while unconnected:
+            ready = [name for name, pv in unconnected.items() if pv.connected]
+            for name in ready:
+                pv = unconnected.pop(name)
+                # Even share of the time left, so one slow read cannot starve the rest
+                share = max((deadline - time.monotonic()) / (len(unconnected) + 1), 0.001)
+                try:
+                    value = pv.get(as_string=True, timeout=share, use_monitor=True)
+                    if value is None:
+                        raise CATimeoutError(f"{name} did not reply within {timeout}s")
+                    results[name] = _ok(value)
+                except Exception as e:
+                    results[name] = _failed(e)
+            if not unconnected or time.monotonic() >= deadline:
+                break
+            if not ready:
+                time.sleep(0.005)
+        for name in unconnected:
+            results[name] = _failed(CATimeoutError(f"{name} not connected within {timeout}s"))
+        return {name: results[name] for name in pvnames}
+
+    def put_many(self, values: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Write many PVs within one deadline / 하나의 기한 안에 여러 PV 쓰기
+
+        Each put is issued as soon as its channel connects, without waiting
+        for earlier puts to complete.
+
+        Args:
+            values: PV name → value / PV 이름 → 값
+            timeout: Seconds for the whole batch, put_timeout by default / 전체 대기 시간
+
+        Returns:
+            Dict: PV name → {"success", "status": "ok"/"timeout"/"error", "value" or "error"}
+        """
+        timeout = self.put_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        if not EPICS_AVAILABLE:
+            return self._run_batch([(name, self._caput, (name, value, timeout)) for name, value in values.items()],
+                                   deadline, values)
+
+        unconnected = {name: self._channel(name) for name in values}
+        results = {}
+        pending = {}
+        while True:
+            for name in [name for name, pv in unconnected.items() if pv.connected]:
+                pv = unconnected.pop(name)
+                try:
+                    pv.put(_coerce(pv, values[name]), wait=False, use_complete=True)
+                    pending[name] = pv
+                except Exception as e:
+                    results[name] = _failed(e)
+            for name in [name for name, pv in pending.items() if pv.put_complete]:
+                pending.pop(name)
+                results[name] = _ok(values[name])
+            if not (unconnected or pending) or time.monotonic() >= deadline:
+                break
+            time.sleep(0.005)
+        for name in unconnected:
+            results[name] = _failed(CATimeoutError(f"{name} not connected within {timeout}s"))
+        for name in pending:
+            results[name] = _failed(CATimeoutError(f"{name} put did not complete within {timeout}s"))
+        return {name: results[name] for name in values}
+
+    def _run_batch(self, calls: List, deadline: float, values: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Run caget/caput subprocesses side by side until the deadline / 기한까지 caget/caput 병렬 실행"""
+        results = {}
+        if not calls:
+            return results
+        executor = ThreadPoolExecutor(max_workers=min(len(calls), BATCH_SUBPROCESS_WORKERS))
+        futures = {name: executor.submit(func, *args) for name, func, args in calls}
+        wait(futures.values(), timeout=max(deadline - time.monotonic(), 0))
+        executor.shutdown(wait=False, cancel_futures=True)
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = _failed(CATimeoutError(f"{name} did not finish before the deadline"))
+            elif future.exception() is not None:
+                results[name] = _failed(future.exception())
+            else:
+                results[name] = _ok(future.result() if values is None else values[name])
+        return results
+
+    def _caget(self, pvname: str, timeout: float) -> str:
+        try:
+            return subprocess.check_output(['caget', '-t', '-w', str(timeout), pvname], encoding='utf-8',
+                                           stderr=subprocess.PIPE, timeout=timeout + 5).strip()
+        except subprocess.TimeoutExpired:
+            raise CATimeoutError(f"caget {pvname} timeout")
+        except subprocess.CalledProcessError as e:
+            raise CAError(f"caget failed: {(e.stderr or e.stdout or '').strip()}")
+        except OSError as e:
+            raise CAError(f"caget failed: {e}")
+
+    def _caput(self, pvname: str, value: Any, timeout: float):
+        try:
+            subprocess.run(['caput', '-w', str(timeout), pvname, str(value)], check=True,
+                           capture_output=True, text=True, timeout=timeout + 5)
+        except subprocess.TimeoutExpired:
+            raise CATimeoutError(f"caput {pvname} timeout")
+        except subprocess.CalledProcessError as e:
+            raise CAError(f"caput failed: {(e.stderr or e.stdout or '').strip()}")
+        except OSError as e:
+            raise CAError(f"caput failed: {e}")
+
+    def pin(self, pvname: str):
+        """Never evict a PV name monitored elsewhere in the process / 다른 곳에서 모니터하는 PV 이름은 해제하지 않음"""
+        with self._lock:
+            self._pinned.add(pvname)
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(max(self.idle_timeout / 2, 1.0))
+            self.evict_idle()
+
+    def evict_idle(self) -> int:
+        """
+        Disconnect channels unused for idle_timeout seconds / idle_timeout 동안 사용되지 않은 채널 해제
+
+        Returns:
+            int: Number of channels dropped / 해제된 채널 수
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            idle = [name for name, channel in self._channels.items()
+                    if channel.last_used < cutoff and name not in self._pinned]
+            channels = [self._channels.pop(name) for name in idle]
+        for channel in channels:
+            try:
+                channel.pv.disconnect()
+            except Exception as e:
+                print(f"[WARNING] Failed to disconnect PV {channel.pv.pvname}: {e}")
+        return len(channels)
+
+    def get_stats(self) -> Dict:
+        """Pool state for status APIs / 상태 API용 풀 상태"""
+        with self._lock:
+            connected = sum(1 for channel in self._channels.values() if channel.pv.connected)
+            return {
+                "pooled": self.pooled,
+                "channels": len(self._channels),
+                "connected": connected,
+                "pinned": len(self._pinned),
+                "idle_timeout": self.idle_timeout
+            }
+
+
+_manager: Optional[ChannelManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_ca_manager() -> ChannelManager:
+    """
+    Get the shared channel manager / 공유 채널 관리자 조회
+
+    Returns:
+        ChannelManager: Manager configured from Config / Config로 설정된 관리자
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from config import Config
+            config = Config()
+            _manager = ChannelManager(config.CA_CONNECT_TIMEOUT, config.CA_PUT_TIMEOUT, config.CA_IDLE_TIMEOUT)
+        return _manager
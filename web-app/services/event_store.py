@@ -0,0 +1,545 @@
+# -*- coding: utf-8 -*-
+"""
+Alive Event Store
+Alive 이벤트 저장소
+Incremental events.txt tailer with in-memory and SQLite event stores
+events.txt 증분 tailer 및 메모리/SQLite 이벤트 저장소
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+READ_CHUNK_SIZE = 1 << 20  # bytes per read while catching up
+DEFAULT_QUERY_LIMIT = 500
+MAX_QUERY_LIMIT = 5000
+
+_TIME_PARAM = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2})?)?$")
+
+
+def normalize_time_param(value: Optional[str], end_of_range: bool = False) -> Optional[str]:
+    """
+    Normalize a since/until parameter to the events.txt time format / since/until 파라미터를 events.txt 시간 형식으로 정규화
+
+    Accepts "YYYY-MM-DD", "YYYY-MM-DD HH:MM[:SS]" and the ISO "T" separator.
+    A bare date used as the end of a range covers that whole day.
+
+    Args:
+        value: Raw parameter / 원본 파라미터
+        end_of_range: True for "until" / until 파라미터이면 True
+
+    Returns:
+        Optional[str]: "YYYY-MM-DD HH:MM:SS" prefix or None / 정규화된 시간 또는 None
+
+    Raises:
+        ValueError: Unrecognized format / 인식할 수 없는 형식
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if not _TIME_PARAM.match(value):
+        raise ValueError(f"invalid time '{value}', expected YYYY-MM-DD[ HH:MM:SS]")
+    value = value.replace("T", " ")
+    if end_of_range:
+        value += " 23:59:59"[len(value) - 10:] if len(value) < 19 else ""
+    return value
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode an opaque event cursor / 이벤트 커서 디코딩
+
+    Raises:
+        ValueError: Malformed cursor / 잘못된 커서
+    """
+    if cursor is None or cursor == "":
+        return None
+    try:
+        position = int(cursor)
+    except ValueError:
+        raise ValueError(f"invalid cursor '{cursor}'")
+    if position < -1:
+        raise ValueError(f"invalid cursor '{cursor}'")
+    return position
+
+
+def parse_event_line(line: str) -> Optional[Dict]:
+    """
+    Parse one events.txt line / events.txt 한 줄 파싱
+
+    Format: 2025-08-07 00:39:12 TEST-SYS:MCP-EXP001 FAIL 192.168.70.235 0
+
+    Args:
+        line: Raw line / 원본 라인
+
+    Returns:
+        Optional[Dict]: Event or None for blank/short lines / 이벤트 (빈 줄이나 짧은 줄이면 None)
+    """
+    parts = line.split()
+    if len(parts) < 5:
+        return None
+    return {
+        "time": parts[0] + " " + parts[1],       # ex. 2025-08-07 00:39:12
+        "ioc": parts[2],                         # ex. TEST-SYS:MCP-EXP001
+        "event": parts[3],                       # ex. BOOT, FAIL
+        "ip": parts[4],                          # ex. 192.168.70.235
+        "code": parts[5] if len(parts) > 5 else "0"
+    }
+
+
+class EventStore:
+    """Append-only in-memory event store / 추가 전용 메모리 이벤트 저장소
+
+    Keeps an inverted index from IOC name to the positions of its events so
+    per-IOC queries cost O(events for that IOC) and match names exactly.
+    Time-range queries binary-search a non-decreasing copy of the event
+    times; an event logged out of order is filed under its predecessor's
+    time so the sort key never goes backwards.
+    """
+
+    def __init__(self):
+        """Initialize event store / 이벤트 저장소 초기화"""
+        self._events: List[Dict] = []
+        self._times: List[str] = []
+        self._by_ioc: Dict[str, List[int]] = {}
+        self._by_event: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def load_position(self) -> Optional[Dict]:
+        """Saved tailer position; nothing survives a restart in memory / 저장된 tailer 위치 (메모리 저장소는 없음)"""
+        return None
+
+    def extend(self, events: List[Dict], position: Optional[Dict] = None,
+               sources: Optional[List[Tuple[int, int]]] = None):
+        """Append events in file order / 파일 순서대로 이벤트 추가"""
+        with self._lock:
+            position = len(self._events)
+            last_time = self._times[-1] if self._times else ""
+            self._events.extend(events)
+            for event in events:
+                last_time = max(last_time, event["time"])
+                self._times.append(last_time)
+                self._by_ioc.setdefault(event["ioc"], []).append(position)
+                self._by_event.setdefault(event["event"], []).append(position)
+                position += 1
+
+    def query(self, since: Optional[str] = None, until: Optional[str] = None,
+              event: Optional[str] = None, cursor: Optional[int] = None,
+              limit: int = DEFAULT_QUERY_LIMIT, order: str = "asc") -> Dict:
+        """
+        Query events by time range and type with cursor pagination / 시간 범위와 유형으로 이벤트 조회 (커서 페이지네이션)
+
+        Args:
+            since: Inclusive lower time bound / 시작 시간 (포함)
+            until: Inclusive upper time bound / 종료 시간 (포함)
+            event: Event type filter (FAIL, BOOT, ...) / 이벤트 유형 필터
+            cursor: Continue after this cursor in the given order / 이 커서 다음부터 조회
+            limit: Maximum events to return / 최대 반환 이벤트 수
+            order: "asc" (oldest first) or "desc" (newest first) / 정렬 순서
+
+        Returns:
+            Dict: events, count, cursor (resume point), head_cursor (newest event), has_more
+        """
+        limit = max(1, min(limit, MAX_QUERY_LIMIT))
+        with self._lock:
+            total = len(self._events)
+            start = bisect_left(self._times, since) if since else 0
+            end = bisect_right(self._times, until) if until else total
+            if cursor is not None and cursor < total:
+                if order == "desc":
+                    end = min(end, cursor)
+                else:
+                    start = max(start, cursor + 1)
+
+            if event:
+                positions = self._by_event.get(event, [])
+                lo = bisect_left(positions, start)
+                hi = bisect_left(positions, end)
+                if order == "desc":
+                    selected = positions[max(lo, hi - limit - 1):hi][::-1]
+                else:
+                    selected = positions[lo:min(hi, lo + limit + 1)]
+            else:
+                if order == "desc":
+                    selected = range(end - 1, max(start, end - limit - 1) - 1, -1)
+                else:
+                    selected = range(start, min(end, start + limit + 1))
+
+            selected = list(selected)
+            has_more = len(selected) > limit
+            selected = selected[:limit]
+            return {
+                "events": [self._events[i] for i in selected],
+                "count": len(selected),
+                "cursor": str(selected[-1]) if selected else (str(cursor) if cursor is not None else None),
+                "head_cursor": str(total - 1),
+                "has_more": has_more
+            }
+
+    def events_for_ioc(self, ioc_name: str) -> List[Dict]:
+        """
+        Get events of one IOC, newest first / 특정 IOC의 이벤트 조회 (최신 순)
+
+        Args:
+            ioc_name: Exact IOC name / 정확한 IOC 이름
+
+        Returns:
+            List[Dict]: Events / 이벤트들
+        """
+        with self._lock:
+            positions = self._by_ioc.get(ioc_name, ())
+            return [self._events[i] for i in reversed(positions)]
+
+    def all(self) -> List[Dict]:
+        """Get all events, oldest first / 모든 이벤트 조회 (오래된 순)"""
+        with self._lock:
+            return list(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class SQLiteEventStore:
+    """Append-only event store in an indexed SQLite database / 인덱스된 SQLite 데이터베이스 기반 추가 전용 이벤트 저장소
+
+    Same interface as EventStore, but history lives on disk: per-IOC and
+    per-type queries are lookups on the (ioc, time) and (event, time)
+    indexes, and process memory no longer grows with history length.
+    The tailer position is committed in the same transaction as the
+    events, so a restart resumes where it stopped without duplicates.
+
+    Every process (e.g. each gunicorn worker) tails events.txt into the
+    same database. Rows are keyed on the line's source (inode, byte
+    offset) plus its text fields and inserted with INSERT OR IGNORE, so a
+    line read by several processes is stored once.
+
+    The "time" column holds the same non-decreasing sort key as
+    EventStore; the logged text is kept in "logged" and returned as "time".
+    Cursors are row ids and stay valid across restarts.
+    """
+
+    _SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            time TEXT NOT NULL,
+            logged TEXT NOT NULL,
+            ioc TEXT NOT NULL,
+            event TEXT NOT NULL,
+            ip TEXT NOT NULL,
+            code TEXT NOT NULL,
+            src_inode INTEGER,
+            src_offset INTEGER
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_events_time ON events (time)",
+        "CREATE INDEX IF NOT EXISTS idx_events_ioc_time ON events (ioc, time)",
+        "CREATE INDEX IF NOT EXISTS idx_events_event_time ON events (event, time)",
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    )
+    # Created after older databases gain the src_inode/src_offset columns / 이전 DB에 컬럼 추가 후 생성
+    _SOURCE_INDEX = ("CREATE UNIQUE INDEX IF NOT EXISTS idx_events_source "
+                     "ON events (src_inode, src_offset, logged, ioc)")
+    _COLUMNS = "id, logged, ioc, event, ip, code"
+
+    def __init__(self, db_path: str):
+        """
+        Open or create the database / 데이터베이스 열기 또는 생성
+
+        Args:
+            db_path: SQLite file path / SQLite 파일 경로
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(events)")}
+            for column in ("src_inode", "src_offset"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE events ADD COLUMN {column} INTEGER")
+            self._conn.execute(self._SOURCE_INDEX)
+
+    @staticmethod
+    def _row_to_event(row: Tuple) -> Dict:
+        return {"time": row[1], "ioc": row[2], "event": row[3], "ip": row[4], "code": row[5]}
+
+    def load_position(self) -> Optional[Dict]:
+        """
+        Get the saved tailer position / 저장된 tailer 위치 조회
+
+        Returns:
+            Optional[Dict]: {"inode": int, "offset": int} or None / 저장된 위치 또는 None
+        """
+        with self._lock:
+            rows = dict(self._conn.execute(
+                "SELECT key, value FROM meta WHERE key IN ('inode', 'offset')").fetchall())
+        if len(rows) != 2:
+            return None
+        return {"inode": int(rows["inode"]), "offset": int(rows["offset"])}
+
+    def extend(self, events: List[Dict], position: Optional[Dict] = None,
+               sources: Optional[List[Tuple[int, int]]] = None):
+        """
+        Append events in file order / 파일 순서대로 이벤트 추가
+
+        Args:
+            events: Parsed events / 파싱된 이벤트들
+            position: Tailer position after these events, saved atomically / 이 이벤트들 이후의 tailer 위치
+            sources: (inode, byte offset) of each event's line; lines already stored are skipped
+                / 각 이벤트 라인의 (inode, 바이트 오프셋), 이미 저장된 라인은 건너뜀
+        """
+        if sources is None:
+            sources = [(None, None)] * len(events)
+        with self._lock:
+            with self._conn:
+                # Take the write lock first so the sort key continues from rows other processes added
+                self._conn.execute("BEGIN IMMEDIATE")
+                last_time = self._conn.execute("SELECT MAX(time) FROM events").fetchone()[0] or ""
+                rows = []
+                for event, (inode, offset) in zip(events, sources):
+                    last_time = max(last_time, event["time"])
+                    rows.append((last_time, event["time"], event["ioc"], event["event"],
+                                 event["ip"], event["code"], inode, offset))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO events (time, logged, ioc, event, ip, code, src_inode, src_offset) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                if position is not None:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        [("inode", str(position["inode"])), ("offset", str(position["offset"]))])
+
+    def query(self, since: Optional[str] = None, until: Optional[str] = None,
+              event: Optional[str] = None, cursor: Optional[int] = None,
+              limit: int = DEFAULT_QUERY_LIMIT, order: str = "asc") -> Dict:
+        """
+        Query events by time range and type with cursor pagination / 시간 범위와 유형으로 이벤트 조회 (커서 페이지네이션)
+
+        Arguments and result match EventStore.query / 인자와 결과는 EventStore.query와 동일
+        """
+        limit = max(1, min(limit, MAX_QUERY_LIMIT))
+        direction = "DESC" if order == "desc" else "ASC"
+        clauses, args = [], []
+        if event:
+            clauses.append("event = ?")
+            args.append(event)
+        if since:
+            clauses.append("time >= ?")
+            args.append(since)
+        if until:
+            clauses.append("time <= ?")
+            args.append(until)
+
+        with self._lock:
+            if cursor is not None:
+                row = self._conn.execute("SELECT time FROM events WHERE id = ?", (cursor,)).fetchone()
+                if row is not None:
+                    # Seek on the index instead of skipping rows / 행을 건너뛰지 않고 인덱스에서 탐색
+                    clauses.append("(time, id) < (?, ?)" if direction == "DESC" else "(time, id) > (?, ?)")
+                    args.extend((row[0], cursor))
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM events {where} "
+                f"ORDER BY time {direction}, id {direction} LIMIT ?", args + [limit + 1]).fetchall()
+            head = self._conn.execute("SELECT MAX(id) FROM events").fetchone()[0] or 0
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "events": [self._row_to_event(row) for row in rows],
+            "count": len(rows),
+            "cursor": str(rows[-1][0]) if rows else (str(cursor) if cursor is not None else None),
+            "head_cursor": str(head),
+            "has_more": has_more
+        }
+
+    def events_for_ioc(self, ioc_name: str) -> List[Dict]:
+        """
+        Get events of one IOC, newest first / 특정 IOC의 이벤트 조회 (최신 순)
+
+        Args:
+            ioc_name: Exact IOC name / 정확한 IOC 이름
+
+        Returns:
+            List[Dict]: Events / 이벤트들
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM events WHERE ioc = ? ORDER BY time DESC, id DESC",
+                (ioc_name,)).fetchall()
+        return [self._row_to_event(row) for row in rows]
+
+    def all(self) -> List[Dict]:
+        """Get all events, oldest first / 모든 이벤트 조회 (오래된 순)"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {self._COLUMNS} FROM events ORDER BY id").fetchall()
+        return [self._row_to_event(row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+_open_stores: Dict[str, Tuple[object, "EventTailer"]] = {}
+_open_stores_lock = threading.Lock()
+
+
+def open_event_store(config, events_path: str) -> Tuple[object, "EventTailer"]:
+    """
+    Get the shared event store and tailer for an events file / events 파일의 공유 이벤트 저장소와 tailer 조회
+
+    Services asking for the same store share one instance, so events.txt
+    is followed (and stored) once per process. They must agree on the
+    events file (Config.ALIVE_EVENTS_LOG); one SQLite database cannot
+    follow two files. EVENT_STORE_BACKEND selects
+    "sqlite" (default, at EVENT_STORE_PATH) or "memory"; if the database
+    cannot be opened the memory store is used instead.
+
+    Args:
+        config: Application Config / 애플리케이션 설정
+        events_path: events.txt path / events.txt 경로
+
+    Returns:
+        Tuple: (store, tailer) / (저장소, tailer)
+
+    Raises:
+        ValueError: The store already follows a different events file / 저장소가 이미 다른 events 파일을 추적 중
+    """
+    backend = getattr(config, "EVENT_STORE_BACKEND", "memory")
+    key = config.EVENT_STORE_PATH if backend == "sqlite" else events_path
+    with _open_stores_lock:
+        if key in _open_stores:
+            store, tailer = _open_stores[key]
+            if os.path.abspath(tailer.path) != os.path.abspath(events_path):
+                raise ValueError(f"Event store {key} already follows {tailer.path}, not {events_path}; "
+                                 f"set ALIVE_EVENTS_LOG so all services read the same events file")
+            return store, tailer
+
+        store = None
+        if backend == "sqlite":
+            try:
+                store = SQLiteEventStore(config.EVENT_STORE_PATH)
+                print(f"[INFO] Event store: SQLite {config.EVENT_STORE_PATH} ({len(store)} events)")
+            except (sqlite3.Error, OSError) as e:
+                print(f"[ERROR] Failed to open event database {config.EVENT_STORE_PATH}: {e}; using memory store")
+        if store is None:
+            store = EventStore()
+        tailer = EventTailer(events_path, store)
+        _open_stores[key] = (store, tailer)
+        return store, tailer
+
+
+class EventTailer:
+    """Follows events.txt by byte offset and inode / 바이트 오프셋과 inode로 events.txt 추적"""
+
+    def __init__(self, path: str, store):
+        """
+        Initialize tailer / tailer 초기화
+
+        Args:
+            path: events.txt path / events.txt 경로
+            store: Store receiving parsed events / 파싱된 이벤트를 받을 저장소
+        """
+        self.path = path
+        self.store = store
+        self.offset = 0
+        self.inode = None
+        self._file = None
+        self._partial = b""
+        self._resume = store.load_position()
+        self._lock = threading.Lock()
+
+    def poll(self) -> int:
+        """
+        Ingest lines appended since the last poll / 마지막 조회 이후 추가된 라인 처리
+
+        A replaced file (new inode) is drained to its end before switching,
+        and a file that shrank below the cursor is re-read from the start.
+
+        Returns:
+            int: Number of new events / 새 이벤트 수
+        """
+        with self._lock:
+            added = 0
+            if self._file is None and not self._open():
+                return 0
+
+            try:
+                st = os.fstat(self._file.fileno())
+                if st.st_size < self.offset:
+                    # Truncated in place
+                    self._reset_cursor()
+                added += self._read_available()
+
+                try:
+                    path_inode = os.stat(self.path).st_ino
+                except FileNotFoundError:
+                    path_inode = None
+                if path_inode is not None and path_inode != self.inode:
+                    # Rotated: old file is fully drained, follow the new one
+                    self._close()
+                    if self._open():
+                        added += self._read_available()
+            except OSError as e:
+                print(f"[ERROR] Event tailer failed on {self.path}: {e}")
+                self._close()
+
+            return added
+
+    def _open(self) -> bool:
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            print(f"[ERROR] Failed to open events file {self.path}: {e}")
+            return False
+        st = os.fstat(self._file.fileno())
+        self.inode = st.st_ino
+        self._reset_cursor()
+
+        # Resume from the position saved by a persistent store / 영구 저장소에 저장된 위치부터 재개
+        resume, self._resume = self._resume, None
+        if resume and resume["inode"] == self.inode and resume["offset"] <= st.st_size:
+            self.offset = resume["offset"]
+            self._file.seek(self.offset)
+        return True
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+
+    def _reset_cursor(self):
+        self.offset = 0
+        self._partial = b""
+        self._file.seek(0)
+
+    def _read_available(self) -> int:
+        added = 0
+        while True:
+            chunk = self._file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return added
+            line_offset = self.offset - len(self._partial)
+            self.offset += len(chunk)
+            lines = (self._partial + chunk).split(b"\n")
+            self._partial = lines.pop()
+            events, sources = [], []
+            for raw in lines:
+                event = parse_event_line(raw.decode("utf-8", "replace"))
+                if event is not None:
+                    events.append(event)
+                    sources.append((self.inode, line_offset))
+                line_offset += len(raw) + 1
+            if events:
+                self.store.extend(events, {"inode": self.inode, "offset": self.offset - len(self._partial)},
+                                  sources)
+                added += len(events)
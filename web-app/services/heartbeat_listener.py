@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Heartbeat Listener
+하트비트 리스너
+Passively tracks IOC heartbeats and flags overdue IOCs as suspect
+IOC 하트비트를 수동으로 추적하고 지연된 IOC를 의심 상태로 표시
+"""
+
+import math
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from services.alive_client import (HEARTBEAT_MAGIC, HEARTBEAT_PROTOCOL_VERSION, AliveProtocolError,
+                                   decode_heartbeat, load_alived_ports)
+
+
+class _HeartbeatStats:
+    """Per-IOC heartbeat interval statistics / IOC별 하트비트 간격 통계"""
+
+    __slots__ = ("ip", "incarnation", "period", "last_monotonic", "last_wall",
+                 "samples", "mean", "var", "suspect")
+
+    def __init__(self, ip: str, incarnation: int, period: int):
+        self.ip = ip
+        self.incarnation = incarnation
+        self.period = period
+        self.last_monotonic = time.monotonic()
+        self.last_wall = time.time()
+        self.samples = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.suspect = False
+
+
+class HeartbeatListener:
+    """Passive listener on the heartbeat UDP port / 하트비트 UDP 포트 수동 리스너"""
+
+    def __init__(self, port: int, on_change: Callable[[str, bool], None],
+                 host: str = "", suspect_factor: float = 2.5, min_samples: int = 3,
+                 alpha: float = 0.1, check_interval: float = 0.5, magic: int = HEARTBEAT_MAGIC,
+                 protocol_version: int = HEARTBEAT_PROTOCOL_VERSION, forget_after: float = 600.0):
+        """
+        Initialize listener / 리스너 초기화
+
+        Args:
+            port: UDP port receiving heartbeats / 하트비트 수신 UDP 포트
+            on_change: Called with (ioc name, suspect) on each transition / 상태 전이마다 호출되는 콜백
+            host: Bind address / 바인드 주소
+            suspect_factor: Overdue multiple of the expected interval / 예상 간격 대비 지연 배수
+            min_samples: Intervals needed before trusting measured statistics / 측정 통계 사용 전 필요한 간격 수
+            alpha: Smoothing factor for interval mean and variance / 간격 평균 및 분산 평활 계수
+            check_interval: Seconds between overdue checks / 지연 확인 간격 (초)
+            magic: Expected heartbeat magic / 예상 하트비트 매직 번호
+            protocol_version: Expected heartbeat protocol version / 예상 하트비트 프로토콜 버전
+            forget_after: Seconds of silence before an IOC is dropped / IOC 통계를 제거하기까지의 무응답 시간 (초)
+        """
+        self.host = host
+        self.port = port
+        self.on_change = on_change
+        self.suspect_factor = suspect_factor
+        self.min_samples = min_samples
+        self.alpha = alpha
+        self.check_interval = check_interval
+        self.magic = magic
+        self.protocol_version = protocol_version
+        self.forget_after = forget_after
+
+        self._stats: Dict[str, _HeartbeatStats] = {}
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._running = False
+        self.heartbeats_received = 0
+        self.heartbeats_rejected = 0
+
+    @classmethod
+    def from_config(cls, config, on_change: Callable[[str, bool], None]) -> "HeartbeatListener":
+        """Create a listener from application Config / 애플리케이션 설정으로 리스너 생성"""
+        port = config.HEARTBEAT_LISTEN_PORT
+        if not port:
+            port = load_alived_ports(config.ALIVED_CONFIG)["heartbeat_udp_port"]
+        return cls(port, on_change, config.HEARTBEAT_LISTEN_HOST, config.HEARTBEAT_SUSPECT_FACTOR,
+                   magic=config.HEARTBEAT_MAGIC, protocol_version=config.HEARTBEAT_PROTOCOL_VERSION,
+                   forget_after=config.HEARTBEAT_FORGET_AFTER)
+
+    def start(self) -> bool:
+        """
+        Bind the heartbeat socket and start listening / 하트비트 소켓 바인드 및 수신 시작
+
+        Returns:
+            bool: True if the socket could be bound / 소켓 바인드 성공 여부
+        """
+        if self._running:
+            return True
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self.host, self.port))
+            sock.settimeout(1.0)
+        except OSError as e:
+            print(f"[ERROR] Heartbeat listener could not bind UDP port {self.port}: {e}")
+            return False
+
+        self._sock = sock
+        self.port = sock.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._receive_loop, daemon=True).start()
+        threading.Thread(target=self._check_loop, daemon=True).start()
+        print(f"[INFO] Heartbeat listener started on UDP {self.port}")
+        return True
+
+    def stop(self):
+        """Stop listening / 수신 중지"""
+        self._running = False
+
+    def expected_interval(self, stats: _HeartbeatStats) -> float:
+        """Expected seconds between heartbeats / 하트비트 간 예상 간격 (초)"""
+        if stats.samples >= self.min_samples:
+            return stats.mean
+        return float(stats.period or 5)
+
+    def overdue_after(self, stats: _HeartbeatStats) -> float:
+        """Silence in seconds after which an IOC is suspect / IOC가 의심 상태가 되는 무응답 시간 (초)"""
+        std = math.sqrt(stats.var) if stats.samples >= self.min_samples else 0.0
+        return self.expected_interval(stats) * self.suspect_factor + 3 * std
+
+    def record(self, heartbeat: Dict, ip: str):
+        """
+        Record one heartbeat / 하트비트 하나 기록
+
+        Args:
+            heartbeat: Decoded heartbeat / 디코딩된 하트비트
+            ip: Sender address / 송신자 주소
+        """
+        name = heartbeat["name"]
+        now = time.monotonic()
+        recovered = False
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None or stats.incarnation != heartbeat["incarnation"]:
+                # First heartbeat or IOC restart: start fresh statistics
+                recovered = stats is not None and stats.suspect
+                self._stats[name] = _HeartbeatStats(ip, heartbeat["incarnation"], heartbeat["period"])
+            else:
+                interval = now - stats.last_monotonic
+                if stats.samples == 0:
+                    stats.mean = interval
+                else:
+                    delta = interval - stats.mean
+                    stats.mean += self.alpha * delta
+                    stats.var = (1 - self.alpha) * (stats.var + self.alpha * delta * delta)
+                stats.samples += 1
+                stats.last_monotonic = now
+                stats.last_wall = time.time()
+                stats.ip = ip
+                stats.period = heartbeat["period"]
+                recovered = stats.suspect
+                stats.suspect = False
+            self.heartbeats_received += 1
+
+        if recovered:
+            self._notify(name, False)
+
+    def suspects(self) -> Dict[str, float]:
+        """
+        Get currently suspect IOCs / 현재 의심 상태 IOC 조회
+
+        Returns:
+            Dict[str, float]: IOC name → seconds since last heartbeat / IOC 이름 → 마지막 하트비트 이후 경과 시간
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {name: now - stats.last_monotonic
+                    for name, stats in self._stats.items() if stats.suspect}
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Get heartbeat statistics for all IOCs / 모든 IOC의 하트비트 통계 조회
+
+        Returns:
+            Dict[str, Dict]: IOC name → statistics / IOC 이름 → 통계
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    "ip_address": stats.ip,
+                    "last_heartbeat": datetime.fromtimestamp(stats.last_wall).isoformat(),
+                    "age": round(now - stats.last_monotonic, 3),
+                    "samples": stats.samples,
+                    "interval_mean": round(self.expected_interval(stats), 3),
+                    "interval_std": round(math.sqrt(stats.var), 3),
+                    "overdue_after": round(self.overdue_after(stats), 3),
+                    "suspect": stats.suspect
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def forgotten_after(self, stats: _HeartbeatStats) -> float:
+        """Silence in seconds after which an IOC's statistics are dropped / IOC 통계가 제거되는 무응답 시간 (초)"""
+        return max(self.forget_after, 10 * self.expected_interval(stats))
+
+    def forget(self, ioc_name: str):
+        """Drop statistics for a removed IOC / 삭제된 IOC의 통계 제거"""
+        with self._lock:
+            self._stats.pop(ioc_name, None)
+
+    def _notify(self, ioc_name: str, suspect: bool):
+        try:
+            self.on_change(ioc_name, suspect)
+        except Exception as e:
+            print(f"[ERROR] Heartbeat state handling failed for {ioc_name}: {e}")
+
+    def _receive_loop(self):
+        try:
+            while self._running:
+                try:
+                    data, (ip, _) = self._sock.recvfrom(2048)
+                except socket.timeout:
+                    continue
+                except OSError as e:
+                    print(f"[ERROR] Heartbeat receive failed: {e}")
+                    time.sleep(1)
+                    continue
+                try:
+                    heartbeat = decode_heartbeat(data, self.magic, self.protocol_version)
+                except AliveProtocolError as e:
+                    self.heartbeats_rejected += 1
+                    if self.heartbeats_rejected == 1:
+                        print(f"[WARNING] Rejecting heartbeat from {ip}: {e}")
+                    continue
+                self.record(heartbeat, ip)
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    def _check_loop(self):
+        while self._running:
+            time.sleep(self.check_interval)
+            now = time.monotonic()
+            newly_suspect = []
+            with self._lock:
+                for name, stats in list(self._stats.items()):
+                    silence = now - stats.last_monotonic
+                    if silence > self.forgotten_after(stats):
+                        # Senders that stopped for good (renamed or retired IOCs) are dropped without a transition
+                        del self._stats[name]
+                    elif not stats.suspect and silence > self.overdue_after(stats):
+                        stats.suspect = True
+                        newly_suspect.append(name)
+            for name in newly_suspect:
+                self._notify(name, True)
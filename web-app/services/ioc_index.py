@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+IOC Index
+IOC 인덱스
+Secondary indexes over one published IOC snapshot
+발행된 IOC 스냅샷 하나에 대한 보조 인덱스
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Fields with a value → IOC names hash index / 값 → IOC 이름 해시 인덱스를 가지는 필드
+INDEXED_FIELDS = ("status", "GROUP", "LOCATION", "ip_address", "ENGINEER", "ARCH", "EPICS_BASE")
+
+# URL-friendly names for indexed fields / 인덱스 필드의 URL용 이름
+FIELD_ALIASES = {
+    "status": "status",
+    "group": "GROUP",
+    "location": "LOCATION",
+    "ip": "ip_address",
+    "ip_address": "ip_address",
+    "host": "ip_address",
+    "engineer": "ENGINEER",
+    "arch": "ARCH",
+    "epics_base": "EPICS_BASE",
+}
+
+
+def resolve_field(name: str) -> str:
+    """
+    Map a field name or alias to an indexed field / 필드 이름 또는 별칭을 인덱스 필드로 변환
+
+    Raises:
+        ValueError: Not an indexed field / 인덱스 필드가 아님
+    """
+    field = FIELD_ALIASES.get(name.lower(), name)
+    if field not in INDEXED_FIELDS:
+        raise ValueError(f"'{name}' is not indexed, expected one of {', '.join(sorted(FIELD_ALIASES))}")
+    return field
+
+
+# Fields with a precomputed sort order / 미리 정렬 순서를 계산해 두는 필드
+SORTABLE_FIELDS = ("name", "status", "ip_address", "GROUP", "LOCATION", "ENGINEER",
+                   "incarnation", "last_seen", "uptime")
+
+
+
+def resolve_sort_field(name: str) -> str:
+    """
+    Map a sort name or field alias to a sortable field / 정렬 이름 또는 필드 별칭을 정렬 필드로 변환
+
+    Accepts the same lowercase aliases as the filters ("group", "location", "host", ...).
+
+    Raises:
+        ValueError: Not a sortable field / 정렬 필드가 아님
+    """
+    field = FIELD_ALIASES.get(name.lower(), name)
+    if field not in SORTABLE_FIELDS:
+        accepted = sorted({alias for alias, target in FIELD_ALIASES.items() if target in SORTABLE_FIELDS}
+                          | {"name", "incarnation", "last_seen", "uptime"})
+        raise ValueError(f"cannot sort by '{name}', expected one of {', '.join(accepted)}")
+    return field
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class IOCIndex:
+    """Read-only indexes built once per snapshot / 스냅샷마다 한 번 생성되는 읽기 전용 인덱스
+
+    Built from the records of the "data" view (IOC info plus "masked") when
+    a snapshot is published and replaced as a whole, so queries never lock.
+    """
+
+    def __init__(self, records: List[Dict]):
+        """
+        Build indexes / 인덱스 생성
+
+        Args:
+            records: IOC records / IOC 레코드들
+        """
+        self.records: Dict[str, Dict] = {record["name"]: record for record in records}
+        self.by_field: Dict[str, Dict[str, List[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._lower_names = {name: name.lower() for name in self.records}
+
+        for name, record in self.records.items():
+            for field, index in self.by_field.items():
+                index.setdefault(str(record.get(field, "N/A")), []).append(name)
+        self.counts: Dict[str, Dict[str, int]] = {
+            field: {value: len(names) for value, names in index.items()}
+            for field, index in self.by_field.items()
+        }
+
+        self.orders: Dict[str, List[str]] = {}
+        self.ranks: Dict[str, Dict[str, int]] = {}
+        for field in SORTABLE_FIELDS:
+            order = sorted(self.records, key=lambda name: (str(self.records[name].get(field, "N/A")), name))
+            self.orders[field] = order
+            self.ranks[field] = {name: rank for rank, name in enumerate(order)}
+
+    def values(self, field: str) -> List[str]:
+        """Known values of an indexed field, "N/A" excluded / 인덱스 필드의 값 목록 ("N/A" 제외)"""
+        return sorted(value for value in self.by_field[field] if value and value != "N/A")
+
+    def names(self, field: str, value: str) -> List[str]:
+        """IOC names with one field value / 필드 값이 일치하는 IOC 이름들"""
+        return self.by_field[field].get(value, [])
+
+    def lookup(self, field: str, values: Iterable[str]) -> set:
+        """
+        IOC names whose field has any of the values / 필드 값이 주어진 값 중 하나인 IOC 이름들
+
+        Args:
+            field: Indexed field / 인덱스된 필드
+            values: Accepted values / 허용 값들
+        """
+        index = self.by_field[field]
+        names = set()
+        for value in values:
+            names.update(index.get(value, ()))
+        return names
+
+    def query(self, filters: Optional[Dict[str, Tuple[str, ...]]] = None, q: Optional[str] = None,
+              sort: str = "name", descending: bool = False,
+              page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """
+        Filter, sort and page IOC records / IOC 레코드 필터, 정렬, 페이지 처리
+
+        Args:
+            filters: Indexed field → accepted values / 인덱스 필드 → 허용 값들
+            q: Case-insensitive IOC name substring / 대소문자 구분 없는 IOC 이름 부분 문자열
+            sort: Sortable field or alias / 정렬 필드 또는 별칭
+            descending: Reverse order / 역순 정렬
+            page: 1-based page number / 1부터 시작하는 페이지 번호
+            page_size: Records per page / 페이지당 레코드 수
+
+        Returns:
+            Dict: total, page, page_size, pages, data
+
+        Raises:
+            ValueError: Unknown filter or sort field / 알 수 없는 필터 또는 정렬 필드
+        """
+        sort = resolve_sort_field(sort)
+        page = max(page, 1)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+        matches = []
+        for field, values in (filters or {}).items():
+            if field not in self.by_field:
+                raise ValueError(f"cannot filter by '{field}'")
+            matches.append(self.lookup(field, values))
+        # Intersect starting from the most selective filter so the working set only shrinks
+        matches.sort(key=len)
+        candidates = None
+        for names in matches:
+            candidates = names if candidates is None else candidates & names
+            if not candidates:
+                break
+        if q:
+            needle = q.lower()
+            pool = self.records if candidates is None else candidates
+            candidates = {name for name in pool if needle in self._lower_names[name]}
+
+        if candidates is None:
+            ordered = self.orders[sort]
+        else:
+            ordered = sorted(candidates, key=self.ranks[sort].__getitem__)
+        if descending:
+            ordered = ordered[::-1]
+
+        total = len(ordered)
+        start = (page - 1) * page_size
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total + page_size - 1) // page_size,
+            "data": [self.records[name] for name in ordered[start:start + page_size]]
+        }
@@ -14,6 +14,8 @@ from typing import List, Dict, Any, Set
 from datetime import datetime
 
 from utils.helpers import safe_str, format_uptime, parse_hex_value, get_timestamp
+from services.ca_manager import CAError, get_ca_manager
+from services.log_writer import get_log_writer
 
 class IOCMonitor:
     """IOC monitoring service / IOC 모니터링 서비스"""
@@ -33,6 +35,7 @@ class IOCMonitor:
         # Ensure directories exist
         os.makedirs(self.config.LOG_DIR, exist_ok=True)
         os.makedirs(self.config.CACHE_DIR, exist_ok=True)
+        self.log_writer = get_log_writer(self.config.LOG_DIR)
     
     def check_running(self, name: str) -> bool:
         """
@@ -316,15 +319,14 @@ class IOCMonitor:
                 
                 # Log state transitions
                 timestamp = get_timestamp()
-                with open(self.get_daily_log_path(), "a") as log:
-                    if up_to_down:
-                        masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in up_to_down]
-                        joined = ", ".join(masked)
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] State transition detected (up → down), targets: {joined}\n")
-                    if down_to_up:
-                        masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in down_to_up]
-                        joined = ", ".join(masked)
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] State transition detected (down → up), targets: {joined}\n")
+                if up_to_down:
+                    masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in up_to_down]
+                    joined = ", ".join(masked)
+                    self.log_writer.write(f"[{timestamp}] IOCMonitor : [LOG] State transition detected (up → down), targets: {joined}\n")
+                if down_to_up:
+                    masked = [f"{n}{' [masked]' if n in self.masked_iocs else ''}" for n in down_to_up]
+                    joined = ", ".join(masked)
+                    self.log_writer.write(f"[{timestamp}] IOCMonitor : [LOG] State transition detected (down → up), targets: {joined}\n")
                 
                 current_faulted_names = set(ioc.get("ioc", "N/A") for ioc in faulted)
                 
@@ -338,11 +340,12 @@ class IOCMonitor:
                     prev_list = _annotate(self.previous_faulted_iocs)
                     curr_list = _annotate(current_faulted_names)
                     
-                    with open(self.get_daily_log_path(), "a") as log:
-                        log.write(f"[{timestamp}] IOCMonitor : [LOG] Faulted IOC List change detected,")
-                        log.write(f"    Unmasked Faulted IOC count: {len(curr_list)} ")
-                        log.write(f"    Previous: {prev_list}")
-                        log.write(f"    Current: {curr_list}\n")
+                    self.log_writer.write(
+                        f"[{timestamp}] IOCMonitor : [LOG] Faulted IOC List change detected,"
+                        f"    Unmasked Faulted IOC count: {len(curr_list)} "
+                        f"    Previous: {prev_list}"
+                        f"    Current: {curr_list}\n"
+                    )
                     
                     self.previous_faulted_iocs = current_faulted_names
                 
@@ -377,22 +380,16 @@ class IOCMonitor:
                     if new_value is not None:
                         # Set the control PV / 제어 PV 설정
                         try:
-                            subprocess.run(
-                                ["caput", pv_address, str(new_value)],
-                                check=True,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE
-                            )
+                            get_ca_manager().put(pv_address, str(new_value))
                             print(f"[SET] {control_pv_name} ({pv_address}) ← {new_value}")
                             
                             # Log the change / 변경 사항 로그
                             timestamp = get_timestamp()
                             log_line = f"[{timestamp}] IOCMonitor : [CONTROL] {control_pv_name} set to {new_value}"
-                            with open(self.get_daily_log_path(), "a") as log:
-                                log.write(log_line + "\n")
+                            self.log_writer.write(log_line + "\n")
                                 
-                        except subprocess.CalledProcessError as e:
-                            print(f"[ERROR] {control_pv_name} setting failed: {e.stderr.decode().strip()}")
+                        except CAError as e:
+                            print(f"[ERROR] {control_pv_name} setting failed: {e}")
                 
             except Exception as e:
                 print(f"[ERROR] Control PV update failed: {e}")
@@ -415,7 +412,7 @@ class IOCMonitor:
         # Get monitoring PV values / 모니터링 PV 값들 가져오기
         for pv_name, pv_address in self.config.EPICS_PVS.items():
             try:
-                value = subprocess.check_output(['caget', '-t', pv_address], encoding='utf-8', timeout=5).strip()
+                value = get_ca_manager().get(pv_address, timeout=5)
                 data[pv_name] = value
             except Exception as e:
                 print(f"[WARNING] Failed to read PV {pv_name} ({pv_address}): {e}")
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+IOC Record
+IOC 레코드
+Compact slotted record for one IOC in the IOC table
+IOC 테이블의 IOC 하나를 위한 슬롯 기반 압축 레코드
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+NA = sys.intern("N/A")
+
+# Fields kept in the per-record value list / 레코드별 값 리스트에 저장되는 필드
+_VALUE_FIELDS = ("name", "status", "ip_address", "incarnation", "last_seen", "uptime", "message",
+                 "heartbeat", "ping_time", "overall_status", "raw_info",
+                 "ARCH", "TOP", "EPICS_BASE", "SUPPORT", "ENGINEER", "GROUP", "LOCATION", "DBLIST",
+                 "PURPOSE", "BPC", "user", "group", "host")
+_VALUE_POSITION = {field: position for position, field in enumerate(_VALUE_FIELDS)}
+_NAME, _STATUS, _RAW_INFO, _BPC = (_VALUE_POSITION[field] for field in ("name", "status", "raw_info", "BPC"))
+_DEFAULT_VALUES = tuple(dict(dict.fromkeys(_VALUE_FIELDS, NA), status="UNKNOWN", overall_status="UNKNOWN",
+                                heartbeat=0, ping_time=0).values())
+
+# ENV1-ENV16, kept in a tuple shared by every record that has none set / ENV1-ENV16 (미설정 레코드끼리 공유하는 튜플)
+ENV_FIELDS = tuple(f"ENV{number}" for number in range(1, 17))
+_ENV_POSITION = {field: position for position, field in enumerate(ENV_FIELDS)}
+_DEFAULT_ENV = (NA,) * len(ENV_FIELDS)
+
+# Keys of an IOC record / IOC 레코드 키
+FIELDS = _VALUE_FIELDS + ENV_FIELDS
+
+# Values shared by many IOCs (site vocabulary), interned on assignment / 여러 IOC가 공유하는 값 (할당 시 intern)
+_INTERNED = frozenset(FIELDS) - {"name", "incarnation", "last_seen", "uptime", "message",
+                                 "heartbeat", "ping_time", "raw_info"}
+
+
+class IOCRecord(Mapping):
+    """One IOC's information / IOC 하나의 정보
+
+    Behaves as a mapping with the keys of the former 40-key dict, plus item
+    assignment while the record is being built. Values live in one list,
+    ENV1-ENV16 in a tuple that records without ENV values share, and
+    repeated values such as "N/A", groups and locations are interned.
+    BPC is parsed to a number once, when it is assigned.
+    Records are replaced, not modified, once they are in the IOC table.
+    """
+
+    __slots__ = ("_values", "_env", "_bpc")
+
+    def __init__(self, name: str, raw_info: str = ""):
+        """
+        Create a record with default values / 기본값으로 레코드 생성
+
+        Args:
+            name: IOC name / IOC 이름
+            raw_info: alivectl -i output / alivectl -i 출력
+        """
+        self._values: List[Any] = list(_DEFAULT_VALUES)
+        self._values[_NAME] = name
+        self._values[_RAW_INFO] = raw_info
+        self._env: Tuple[str, ...] = _DEFAULT_ENV
+        self._bpc: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return self._values[_NAME]
+
+    @property
+    def status(self) -> str:
+        return self._values[_STATUS]
+
+    @property
+    def bpc(self) -> Optional[int]:
+        """Numeric BPC, None if missing or not a number / 숫자 BPC (없거나 숫자가 아니면 None)"""
+        return self._bpc
+
+    def __getitem__(self, key: str) -> Any:
+        position = _VALUE_POSITION.get(key)
+        if position is not None:
+            return self._values[position]
+        position = _ENV_POSITION.get(key)
+        if position is None:
+            raise KeyError(key)
+        return self._env[position]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _INTERNED and type(value) is str:
+            value = sys.intern(value)
+        position = _VALUE_POSITION.get(key)
+        if position is not None:
+            self._values[position] = value
+            if position == _BPC:
+                self._bpc = parse_bpc(value)
+            return
+        position = _ENV_POSITION.get(key)
+        if position is None:
+            raise KeyError(key)
+        env = list(self._env)
+        env[position] = value
+        self._env = tuple(env)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _VALUE_POSITION or key in _ENV_POSITION
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IOCRecord):
+            return self._values == other._values and self._env == other._env
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"IOCRecord({self.name!r}, status={self.status!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = _VALUE_POSITION.get(key)
+        if position is not None:
+            return self._values[position]
+        position = _ENV_POSITION.get(key)
+        return default if position is None else self._env[position]
+
+    def copy(self) -> "IOCRecord":
+        """Copy to modify before replacing a record / 레코드 교체 전 수정용 복사"""
+        record = IOCRecord.__new__(IOCRecord)
+        record._values = self._values.copy()
+        record._env = self._env
+        record._bpc = self._bpc
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the API shape / API 형태의 일반 dict"""
+        result = dict(zip(_VALUE_FIELDS, self._values))
+        result.update(zip(ENV_FIELDS, self._env))
+        return result
+
+
+def as_dict(info: Mapping) -> Dict[str, Any]:
+    """
+    New plain dict of an IOC record or error entry / IOC 레코드 또는 오류 항목의 새 일반 dict
+
+    Args:
+        info: IOCRecord, or a dict such as the short error entries / IOCRecord 또는 dict
+    """
+    if type(info) is IOCRecord:
+        return info.to_dict()
+    return dict(info)
+
+
+def parse_bpc(value: Any) -> Optional[int]:
+    """
+    Parse a BPC value (decimal, 0x hex, 0b binary or 0o octal) / BPC 값 파싱 (10진수, 0x, 0b, 0o)
+
+    Returns:
+        Optional[int]: Number, or None if missing or not a number / 숫자 (없거나 숫자가 아니면 None)
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    prefix = text[:2].lower()
+    try:
+        if prefix == "0x":
+            return int(text, 16)
+        if prefix == "0b":
+            return int(text, 2)
+        if prefix == "0o":
+            return int(text, 8)
+        return int(text)
+    except ValueError:
+        return None
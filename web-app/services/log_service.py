@@ -11,6 +11,11 @@ import time
 from typing import List, Dict, Optional
 from datetime import datetime
 import subprocess
+from itertools import islice
+
+from services.event_store import open_event_store
+from services.log_writer import get_log_writer
+from utils.helpers import iter_lines_reverse
 
 class LogService:
     """Log management service / 로그 관리 서비스"""
@@ -23,6 +28,10 @@ class LogService:
         
         # Ensure log directory exists
         os.makedirs(self.config.LOG_DIR, exist_ok=True)
+        self.log_writer = get_log_writer(self.config.LOG_DIR)
+        
+        # Indexed alive events, followed incrementally / 증분 추적되는 인덱스된 alive 이벤트
+        self.event_store, self.event_tailer = open_event_store(self.config, self.config.ALIVE_EVENTS_LOG)
     
     def get_daily_log_path(self) -> str:
         """
@@ -42,8 +51,7 @@ class LogService:
             timestamp: Startup timestamp / 시작 타임스탬프
         """
         try:
-            with open(self.get_daily_log_path(), "a") as log:
-                log.write(f"[{timestamp}] IOCMonitor : [STARTUP] Server started\n")
+            self.log_writer.write(f"[{timestamp}] IOCMonitor : [STARTUP] Server started\n")
         except Exception as e:
             print(f"[ERROR] Startup logging failed: {e}")
     
@@ -57,31 +65,10 @@ class LogService:
         Returns:
             List[Dict]: IOC logs / IOC 로그들
         """
-        logs = []
+        self.event_tailer.poll()
         
-        try:
-            with open(self.config.ALIVE_EVENTS_LOG, "r") as f:
-                for line in f:
-                    if iocname in line:
-                        parts = line.strip().split()
-                        # Log format: [date] [time] [IOCname] [event] [IP] [MSG]
-                        if len(parts) >= 6:
-                            logs.append({
-                                "time": parts[0] + " " + parts[1],  # ex. 2025-05-16 19:04:06
-                                "event": parts[3],                  # ex. MESSAGE, BOOT, FAIL
-                                "ip": parts[4],                     # ex. 192.168.60.14
-                                "code": parts[5]                    # ex. 0, 1, 10001 (MSG)
-                            })
-                        else:
-                            print(f"[SKIP] Log format error: {line.strip()}")
-                            
-        except FileNotFoundError:
-            print(f"[ERROR] Log file not found: {self.config.ALIVE_EVENTS_LOG}")
-        except Exception as e:
-            print(f"[ERROR] Log file read failed: {e}")
-        
-        # Return in reverse chronological order
-        return logs[::-1]
+        # Reverse chronological order, exact IOC name match
+        return self.event_store.events_for_ioc(iocname)
     
     def get_log_dates(self) -> List[str]:
         """
@@ -101,21 +88,26 @@ class LogService:
             print(f"[ERROR] Log directory read failed: {e}")
             return []
     
-    def get_log_by_date(self, date: str) -> str:
+    def get_log_by_date(self, date: str, tail: Optional[int] = None, offset: int = 0) -> str:
         """
         Get log content by date / 날짜별 로그 내용 조회
         
         Args:
             date: Log date / 로그 날짜
+            tail: Only the latest N lines / 최신 N개 라인만
+            offset: Newest lines to skip / 건너뛸 최신 라인 수
             
         Returns:
-            str: Log content / 로그 내용
+            str: Log content, latest first / 로그 내용 (최신 순)
         """
         try:
             log_path = os.path.join(self.config.LOG_DIR, f"faulted_ioc_{date}.log")
-            with open(log_path, "r") as f:
-                lines = f.readlines()
-            lines = lines[::-1]  # Latest logs first
+            # Latest logs first, read backwards from the end
+            lines = iter_lines_reverse(log_path)
+            if tail is not None:
+                lines = islice(lines, offset, offset + max(tail, 0))
+            elif offset:
+                lines = islice(lines, offset, None)
             return "".join(lines)
         except Exception as e:
             return f"Log file read failed: {e}"
@@ -131,10 +123,7 @@ class LogService:
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = f"[{timestamp}] IOCMonitor : [{level}] {message}\n"
-            
-            with open(self.get_daily_log_path(), "a") as log:
-                log.write(log_entry)
-                
+            self.log_writer.write(log_entry)
         except Exception as e:
             print(f"[ERROR] Log writing failed: {e}")
     
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Daily Log Writer
+일일 로그 작성기
+Queue-backed single writer thread for the faulted_ioc_<date>.log files
+faulted_ioc_<date>.log 파일용 큐 기반 단일 작성 스레드
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+BATCH_SIZE = 256  # lines written per wakeup at most
+
+
+class DailyLogWriter:
+    """Single writer for one daily log directory / 일일 로그 디렉토리 하나의 단일 작성기
+
+    Callers only enqueue; one thread keeps the day's file open, writes
+    queued lines in batches and moves to the next file at midnight. The
+    date is taken when a line is enqueued, so a line always lands in the
+    file of the day it was logged.
+    """
+
+    def __init__(self, log_dir: str, prefix: str = "faulted_ioc_"):
+        """
+        Initialize writer / 작성기 초기화
+
+        Args:
+            log_dir: Log directory / 로그 디렉토리
+            prefix: File name prefix before the date / 날짜 앞의 파일 이름 접두사
+        """
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self._queue: "queue.Queue" = queue.Queue()
+        self._file = None
+        self._file_date: Optional[str] = None
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def path_for(self, date: str) -> str:
+        """Get the log file path for a date / 날짜별 로그 파일 경로"""
+        return os.path.join(self.log_dir, f"{self.prefix}{date}.log")
+
+    def write(self, text: str):
+        """
+        Queue text for the current day's log / 오늘 로그에 기록할 텍스트를 큐에 추가
+
+        Args:
+            text: Complete log text including the trailing newline / 줄바꿈을 포함한 로그 텍스트
+        """
+        self._queue.put((time.strftime("%Y-%m-%d"), text))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until everything queued so far is on disk / 지금까지 큐에 들어간 내용이 기록될 때까지 대기
+
+        Args:
+            timeout: Maximum seconds to wait / 최대 대기 시간 (초)
+
+        Returns:
+            bool: True if flushed in time / 제한 시간 내 완료 여부
+        """
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            waiters = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    continue
+                date, text = item
+                try:
+                    self._open_for(date).write(text)
+                except OSError as e:
+                    print(f"[ERROR] Failed to write daily log: {e}")
+                    self._close()
+
+            if self._file is not None:
+                try:
+                    self._file.flush()
+                except OSError as e:
+                    print(f"[ERROR] Failed to flush daily log: {e}")
+                    self._close()
+            for waiter in waiters:
+                waiter.set()
+
+    def _open_for(self, date: str):
+        if self._file is None or date != self._file_date:
+            # Midnight rollover or reopen after an error / 자정 전환 또는 오류 후 다시 열기
+            self._close()
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._file = open(self.path_for(date), "a")
+            self._file_date = date
+        return self._file
+
+    def _close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+        self._file_date = None
+
+
+_writers: Dict[str, DailyLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(log_dir: str) -> DailyLogWriter:
+    """
+    Get the shared writer for a log directory / 로그 디렉토리의 공유 작성기 조회
+
+    Args:
+        log_dir: Log directory / 로그 디렉토리
+
+    Returns:
+        DailyLogWriter: Writer owning that directory's daily files / 해당 디렉토리의 일일 파일을 담당하는 작성기
+    """
+    key = os.path.abspath(log_dir)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = DailyLogWriter(key)
+        return writer
+
+
+def flush_log_writers(timeout: float = 5.0):
+    """Flush every daily log writer, e.g. on shutdown / 모든 일일 로그 작성기 플러시 (종료 시)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        if not writer.flush(timeout):
+            print(f"[WARNING] Daily log writer for {writer.log_dir} did not flush within {timeout}s")
@@ -8,13 +8,15 @@ PV 관리 및 캐싱 기능
 
 import time
 import subprocess
-import threading
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from services.ca_manager import CAError, CATimeoutError, get_ca_manager
+from services.ioc_record import parse_bpc
+from services.readiness import ReadinessEngine
+
 # EPICS Channel Access 라이브러리 import
 try:
-    import epics
     from epics import PV
     EPICS_AVAILABLE = True
 except ImportError:
@@ -39,16 +41,17 @@ class PVService:
         # Debug logging setting
         self.debug_log = self.config.PV_CONTROL_DEBUG_LOG
         
+        # In-process IOC snapshots, see attach_alive_service() / 프로세스 내 IOC 스냅샷
+        self.alive_service = None
+        
+        # READY evaluation on IOC, BPC and threshold changes / IOC, BPC, 임계값 변경 시 READY 평가
+        self.readiness = ReadinessEngine(self._write_ready, debug_log=self.debug_log)
+        
         # EPICS PV connections
         self.threshold_pv = None
         self.control_pv = None
         self.pv_connections_ready = False
         
-        # Control logic state
-        self.last_control_check = 0
-        self.control_check_interval = 1  # 1초마다 체크
-        self.last_inactive_ioc_check = False
-        
         # Initialize EPICS connections if available
         if EPICS_AVAILABLE:
             self._setup_epics_connections()
@@ -56,17 +59,25 @@ class PVService:
     def _setup_epics_connections(self):
         """Setup EPICS PV connections / EPICS PV 연결 설정"""
         try:
+            # The pooled CA client must not disconnect channels these monitors share
+            ca_manager = get_ca_manager()
+            ca_manager.pin(self.threshold_pv_name)
+            ca_manager.pin(self.control_pv_name)
+            
             # Threshold PV (BPC 임계값)
-            self.threshold_pv = PV(self.threshold_pv_name, auto_monitor=True)
+            self.threshold_pv = PV(self.threshold_pv_name, auto_monitor=True,
+                                   callback=self._on_threshold_change)
             
             # Control PV (제어할 대상)
-            self.control_pv = PV(self.control_pv_name, auto_monitor=True)
+            self.control_pv = PV(self.control_pv_name, auto_monitor=True,
+                                 callback=self._on_control_change)
             
             # 연결 대기
             time.sleep(1)
             
             if self.threshold_pv.connected and self.control_pv.connected:
                 self.pv_connections_ready = True
+                self.readiness.on_threshold(self.get_threshold_value())
                 if self.debug_log:
                     print(f"[PV SERVICE] EPICS PV connections established")
                     print(f"[PV SERVICE] Threshold PV: {self.threshold_pv_name}")
@@ -115,135 +126,51 @@ class PVService:
                 return False
         return False
     
+    def attach_alive_service(self, alive_service):
+        """
+        Read IOC state straight from AliveService snapshots / AliveService 스냅샷에서 IOC 상태 직접 조회
+        
+        Args:
+            alive_service: AliveService of this process / 같은 프로세스의 AliveService
+        """
+        self.alive_service = alive_service
+        alive_service.add_publish_listener(self.readiness.on_publish)
+    
     def check_inactive_iocs(self) -> bool:
         """Check if there are inactive IOCs / 비활성화된 IOC가 있는지 확인"""
-        try:
-            from services.alive_service import AliveService
-            alive_service = AliveService()
-            ioc_details = alive_service.get_ioc_details()
-            
-            inactive_count = sum(1 for info in ioc_details.values() if info.get("status") == "OFFLINE")
-            return inactive_count > 0
-            
-        except Exception as e:
-            print(f"[PV SERVICE] Error checking IOC status: {e}")
+        if self.alive_service is None:
+            print("[PV SERVICE] Alive service not attached")
             return False
+        ioc_details = self.alive_service.get_ioc_details()
+        return any(info.get("status") == "OFFLINE" for info in ioc_details.values())
     
     def parse_bpc_value(self, bpc_str) -> int:
         """Parse BPC value from various formats / 다양한 형식의 BPC 값을 숫자로 변환"""
-        if bpc_str is None:
-            return 0
-        
-        # 문자열로 변환
-        bpc_str = str(bpc_str).strip()
-        
-        try:
-            # 16진수 형식 (0x00, 0x01 등)
-            if bpc_str.startswith('0x') or bpc_str.startswith('0X'):
-                return int(bpc_str, 16)
-            
-            # 2진수 형식 (0b1, 0b0 등)
-            elif bpc_str.startswith('0b') or bpc_str.startswith('0B'):
-                return int(bpc_str, 2)
-            
-            # 8진수 형식 (0o1, 0o0 등)
-            elif bpc_str.startswith('0o') or bpc_str.startswith('0O'):
-                return int(bpc_str, 8)
-            
-            # 일반 10진수
-            else:
-                return int(bpc_str)
-                
-        except (ValueError, TypeError):
-            print(f"[PV SERVICE] Failed to parse BPC value: {bpc_str}, using 0")
+        value = parse_bpc(bpc_str)
+        if value is None:
+            if bpc_str is not None:
+                print(f"[PV SERVICE] Failed to parse BPC value: {bpc_str}, using 0")
             return 0
+        return value
     
     def check_low_bpc_inactive_iocs(self) -> bool:
-        """Check if there are inactive IOCs with BPC < threshold / BPC가 임계값보다 낮은 비활성화된 IOC가 있는지 확인"""
-        try:
-            if self.debug_log:
-                print(f"[PV SERVICE] Starting check_low_bpc_inactive_iocs...")
-            
-            # API에서 IOC 데이터 가져오기
-            import requests
-            
-            try:
-                response = requests.get("http://localhost:5001/api/alive/ioc_details", timeout=5)
-                if response.status_code != 200:
-                    if self.debug_log:
-                        print(f"[PV SERVICE] Failed to get IOC details: {response.status_code}")
-                    return False
-                
-                ioc_details = response.json()
-                if self.debug_log:
-                    print(f"[PV SERVICE] Got {len(ioc_details)} IOCs from API")
-                
-            except Exception as e:
-                if self.debug_log:
-                    print(f"[PV SERVICE] Error getting IOC details from API: {e}")
-                return False
-            
-            # 임계값 가져오기 (기본값: 1)
-            threshold = self.get_threshold_value()
-            if threshold is None:
-                threshold = 1.0
-            
-            if self.debug_log:
-                print(f"[PV SERVICE] Threshold value: {threshold}")
-                print(f"[PV SERVICE] Checking {len(ioc_details)} IOCs for BPC >= {threshold} inactive ones...")
-            
-            # 꺼진 IOC들 중에서 BPC ≤ 임계값인 것 확인
-            for ioc_name, info in ioc_details.items():
-                bpc_raw = info.get("BPC", info.get("bpc", 0))
-                bpc_value = self.parse_bpc_value(bpc_raw)
-                status = info.get("status", "UNKNOWN")
-                
-                if self.debug_log:
-                    print(f"[PV SERVICE] IOC {ioc_name}: BPC={bpc_value}, status={status}")
-                
-                # IOC가 꺼져있고 BPC ≤ 임계값인 경우
-                # overall_status를 직접 사용하여 상태 판단
-                overall_status = info.get("overall_status", "U")
-                last_seen_str = info.get("last_seen", "")
-                
-                # overall_status가 "DO" (Down)이거나 "D" (Disconnected)인 경우 꺼진 것으로 판단
-                is_offline = overall_status in ["DO", "D", "DOWN"]
-                
-                # last_seen이 1분 이상 과거인지 확인 (백업 조건)
-                is_old_last_seen = False
-                if last_seen_str:
-                    try:
-                        from datetime import datetime
-                        last_seen_time = datetime.strptime(last_seen_str, "%Y-%m-%d %H:%M:%S")
-                        current_time = datetime.now()
-                        time_diff = (current_time - last_seen_time).total_seconds()
-                        is_old_last_seen = time_diff > 60  # 1분 = 60초
-                        if self.debug_log:
-                            print(f"[PV SERVICE] IOC {ioc_name}: overall_status={overall_status}, last_seen={last_seen_str}, time_diff={time_diff:.0f}s, is_old={is_old_last_seen}")
-                    except Exception as e:
-                        if self.debug_log:
-                            print(f"[PV SERVICE] Error parsing last_seen for {ioc_name}: {e}")
-                
-                if (is_offline or is_old_last_seen) and bpc_value >= threshold:
-                    if self.debug_log:
-                        print(f"[PV SERVICE] Found inactive IOC with BPC >= {threshold}: {ioc_name} (BPC={bpc_value}, overall_status={overall_status}, old_last_seen={is_old_last_seen})")
-                    return True
-            
-            if self.debug_log:
-                print(f"[PV SERVICE] No inactive IOCs with BPC >= {threshold} found")
-            return False
-            
-        except Exception as e:
-            if self.debug_log:
-                print(f"[PV SERVICE] Error checking low BPC inactive IOCs: {e}")
-                import traceback
-                traceback.print_exc()
-            return False
+        """Check if there are inactive IOCs with BPC >= threshold / BPC가 임계값 이상인 비활성화된 IOC가 있는지 확인
+        
+        Reads the readiness engine's last result without re-evaluating, so
+        callers on request threads do not change what the engine reports.
+        False until the engine has evaluated once.
+        """
+        return self.readiness.ready == 0
     
-    def evaluate_control_logic(self) -> float:
-        """Evaluate control logic and return target value / 제어 로직 평가 및 목표값 반환"""
+    def evaluate_control_logic(self, has_low_bpc_inactive_iocs: Optional[bool] = None) -> float:
+        """Evaluate control logic and return target value / 제어 로직 평가 및 목표값 반환
+        
+        Args:
+            has_low_bpc_inactive_iocs: Result of check_low_bpc_inactive_iocs() if already known / 이미 확인한 결과
+        """
         # BPC ≤ 임계값인 비활성화된 IOC가 있는지 확인
-        has_low_bpc_inactive_iocs = self.check_low_bpc_inactive_iocs()
+        if has_low_bpc_inactive_iocs is None:
+            has_low_bpc_inactive_iocs = self.check_low_bpc_inactive_iocs()
         
         # 제어 로직: BPC ≤ 임계값인 IOC가 꺼져있으면 0 (NOT READY), 아니면 1 (READY)
         if has_low_bpc_inactive_iocs:
@@ -255,43 +182,51 @@ class PVService:
                 print(f"[PV SERVICE] No low BPC inactive IOCs, setting control PV to 1 (READY)")
             return 1
     
-    def apply_control_logic(self):
-        """Apply control logic / 제어 로직 적용"""
+    def start_readiness_engine(self) -> bool:
+        """
+        Start writing READY on IOC and threshold changes / IOC 및 임계값 변경 시 READY 기록 시작
+        
+        Returns:
+            bool: True if the control PVs are connected and the engine runs / 제어 PV 연결 및 엔진 실행 여부
+        """
+        if not self.pv_connections_ready:
+            return False
+        self.readiness.start()
+        return True
+    
+    def _write_ready(self, target_value: int):
+        """Write READY to the control PV if it differs / 제어 PV 값이 다르면 READY 기록"""
         if not self.pv_connections_ready:
             return
         
-        current_time = time.time()
-        
-        # 1초마다 체크
-        if current_time - self.last_control_check >= self.control_check_interval:
-            self.last_control_check = current_time
-            
-            # BPC < 임계값인 비활성화된 IOC가 있는지 확인
-            has_low_bpc_inactive_iocs = self.check_low_bpc_inactive_iocs()
-            
-            # 매번 제어 로직 실행 (더 빠른 반응을 위해)
-            if self.debug_log:
-                print(f"[PV SERVICE] Checking low BPC inactive IOCs: {has_low_bpc_inactive_iocs}")
-            
-            target_value = self.evaluate_control_logic()
-            current_value = self.get_control_value()
-            
-            if current_value != target_value:
-                success = self.set_control_value(target_value)
-                if success:
-                    if self.debug_log:
-                        print(f"[PV SERVICE] Control logic applied: {current_value} → {target_value}")
-                else:
-                    if self.debug_log:
-                        print(f"[PV SERVICE] Failed to apply control logic")
+        current_value = self.get_control_value()
+        if current_value != target_value:
+            success = self.set_control_value(target_value)
+            if success:
+                if self.debug_log:
+                    print(f"[PV SERVICE] Control logic applied: {current_value} → {target_value}")
             else:
                 if self.debug_log:
-                    print(f"[PV SERVICE] Control value unchanged: {current_value}")
-            
-            self.last_inactive_ioc_check = has_low_bpc_inactive_iocs
+                    print(f"[PV SERVICE] Failed to apply control logic")
+        else:
+            if self.debug_log:
+                print(f"[PV SERVICE] Control value unchanged: {current_value}")
+    
+    def _on_threshold_change(self, value=None, **kwargs):
+        """Threshold PV monitor callback / 임계값 PV 모니터 콜백"""
+        self.readiness.on_threshold(value)
+    
+    def _on_control_change(self, value=None, **kwargs):
+        """Control PV monitor callback; restores READY if it was overwritten / 제어 PV 모니터 콜백 (덮어쓰면 READY 복원)"""
+        if self.readiness.ready is not None and value != self.readiness.ready:
+            self.readiness.request_evaluation()
     
     def get_ioc_monitor_ready_status(self) -> Dict:
         """Get IOC Monitor Ready status / IOC Monitor Ready 상태 조회"""
+        # Cached engine state; the engine re-evaluates on its own wake-ups
+        readiness = self.readiness.get_status()
+        last_evaluation = readiness["last_evaluation"]
+        has_low_bpc_inactive_iocs = readiness["ready"] == 0
         status = {
             "enabled": EPICS_AVAILABLE and self.pv_connections_ready,
             "threshold_pv": self.threshold_pv_name,
@@ -300,9 +235,11 @@ class PVService:
             "control_pv": self.control_pv_name,
             "control_value": self.get_control_value(),
             "control_connected": self.control_pv.connected if self.control_pv else False,
-            "last_check": datetime.fromtimestamp(self.last_control_check).strftime("%Y-%m-%d %H:%M:%S") if self.last_control_check > 0 else "Never",
-            "low_bpc_inactive_iocs_found": self.check_low_bpc_inactive_iocs(),
-            "recommended_value": self.evaluate_control_logic()
+            "last_check": datetime.fromtimestamp(last_evaluation).strftime("%Y-%m-%d %H:%M:%S") if last_evaluation else "Never",
+            "low_bpc_inactive_iocs_found": has_low_bpc_inactive_iocs,
+            "recommended_value": (self.evaluate_control_logic(has_low_bpc_inactive_iocs)
+                                  if readiness["ready"] is not None else None),
+            "readiness": readiness
         }
         
         return status
@@ -396,12 +333,11 @@ class PVService:
             str: PV value / PV 값
         """
         try:
-            result = subprocess.check_output(['caget', '-t', pvname], encoding='utf-8', timeout=5)
-            return result.strip()
-        except subprocess.CalledProcessError:
-            return "ERROR"
-        except subprocess.TimeoutExpired:
+            return get_ca_manager().get(pvname, timeout=5)
+        except CATimeoutError:
             return "TIMEOUT"
+        except CAError:
+            return "ERROR"
         except Exception as e:
             return f"ERROR: {str(e)}"
     
@@ -417,10 +353,8 @@ class PVService:
             bool: True if successful, False otherwise / 성공하면 True, 아니면 False
         """
         try:
-            subprocess.run(['caput', pvname, value], check=True, timeout=10)
+            get_ca_manager().put(pvname, value, timeout=10)
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return False
         except Exception:
             return False
     
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Readiness Engine
+준비 상태 엔진
+Keeps the IOC Monitor READY value up to date from IOC and threshold changes
+IOC 및 임계값 변경으로 IOC Monitor READY 값을 최신 상태로 유지
+"""
+
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_THRESHOLD = 1.0
+STALE_AFTER = 60.0  # seconds since the last ping before an IOC counts as inactive
+
+
+def is_inactive(info) -> bool:
+    """Down or SUSPECT IOC / 꺼졌거나 SUSPECT인 IOC"""
+    # overall_status가 "DO" (Down)이거나 "D" (Disconnected)인 경우 꺼진 것으로 판단
+    # 하트비트가 지연된 SUSPECT IOC도 꺼진 것으로 판단 (alived 장애 판정 전 조기 반응)
+    return info.get("overall_status", "U") in ("DO", "D", "DOWN") or info.get("status") == "SUSPECT"
+
+
+class ReadinessEngine:
+    """Change-triggered READY evaluation / 변경 시에만 수행되는 READY 평가
+
+    READY is 0 while any IOC with BPC >= threshold is inactive: down,
+    SUSPECT, or silent for more than STALE_AFTER seconds. Inactive IOCs are
+    counted per BPC value, and the last ping times of the other IOCs are
+    kept in one heap per BPC value, both with a sorted list of the BPC
+    values in use. "Any inactive IOC with BPC >= threshold" is then one
+    comparison and a threshold change needs no recount. The engine only
+    works when IOC snapshots are published, the threshold changes or the
+    next staleness deadline passes. Its thread sleeps otherwise. Heap
+    entries superseded by a newer ping are compacted when they outnumber
+    the live ones, so the heaps stay proportional to the number of IOCs.
+    """
+
+    def __init__(self, write_ready: Callable[[int], None], threshold: Optional[float] = None,
+                 stale_after: float = STALE_AFTER, debug_log: bool = False):
+        """
+        Initialize engine / 엔진 초기화
+
+        Args:
+            write_ready: Called from the engine thread with each evaluated READY value / 평가된 READY 값으로 호출
+            threshold: Initial BPC threshold / 초기 BPC 임계값
+            stale_after: Seconds without ping before an IOC is inactive / IOC가 비활성으로 간주되는 무응답 시간
+            debug_log: Print each evaluation / 평가마다 로그 출력
+        """
+        self.write_ready = write_ready
+        self.stale_after = stale_after
+        self.debug_log = debug_log
+
+        self._threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+        self._bpc: Dict[str, int] = {}
+        self._inactive: Dict[str, int] = {}      # inactive IOC name → BPC
+        self._inactive_counts: Dict[int, int] = {}  # BPC → inactive IOCs
+        self._inactive_bpcs: List[int] = []      # sorted keys of _inactive_counts
+        self._ping: Dict[str, int] = {}          # other IOCs with a ping → ping time
+        self._ping_heaps: Dict[int, List[Tuple[int, str]]] = {}  # BPC → heap of (ping time, name)
+        self._ping_bpcs: List[int] = []          # sorted keys of _ping_heaps
+        self._heap_entries = 0
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = False
+
+        self.ready: Optional[int] = None
+        self.reason = "not evaluated"
+        self.evaluations = 0
+        self.last_evaluation: Optional[float] = None
+
+    def start(self):
+        """Start the engine thread / 엔진 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._wakeup.set()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        """Stop the engine thread / 엔진 스레드 중지"""
+        self._running = False
+        self._wakeup.set()
+
+    def on_publish(self, table, changed: Iterable[str], removed: Iterable[str]):
+        """
+        IOC snapshot listener / IOC 스냅샷 리스너
+
+        Args:
+            table: Published IOCTableSnapshot / 발행된 IOCTableSnapshot
+            changed: Added or changed IOC names / 추가 또는 변경된 IOC 이름
+            removed: Removed IOC names / 삭제된 IOC 이름
+        """
+        changed = list(changed)
+        removed = list(removed)
+        if not changed and not removed:
+            return
+        # Applied right away: the cost is per changed IOC, and nothing piles
+        # up while the engine thread is not running
+        with self._lock:
+            for name in changed:
+                self._apply(name, table.details[name], table.bpc[name])
+            for name in removed:
+                self._apply(name, None, 0)
+        self._wakeup.set()
+
+    def on_threshold(self, value: Optional[float]):
+        """
+        Threshold PV monitor callback / 임계값 PV 모니터 콜백
+
+        Args:
+            value: New threshold, None for the default / 새 임계값 (None이면 기본값)
+        """
+        threshold = DEFAULT_THRESHOLD if value is None else float(value)
+        with self._lock:
+            if threshold == self._threshold:
+                return
+            # Buckets are keyed by BPC, so nothing is recounted
+            self._threshold = threshold
+        self._wakeup.set()
+
+    def request_evaluation(self):
+        """Evaluate and write READY again, e.g. after the control PV was changed / READY 재평가 요청"""
+        self._wakeup.set()
+
+    def _apply(self, name: str, info, bpc: int):
+        previous = self._inactive.pop(name, None)
+        if previous is not None:
+            count = self._inactive_counts[previous] - 1
+            if count:
+                self._inactive_counts[previous] = count
+            else:
+                del self._inactive_counts[previous]
+                self._inactive_bpcs.remove(previous)
+        self._ping.pop(name, None)
+        if info is None:
+            self._bpc.pop(name, None)
+            return
+
+        self._bpc[name] = bpc
+        if is_inactive(info):
+            self._inactive[name] = bpc
+            count = self._inactive_counts.get(bpc, 0)
+            if not count:
+                insort(self._inactive_bpcs, bpc)
+            self._inactive_counts[bpc] = count + 1
+            return
+        ping_time = info.get("ping_time", 0)
+        if ping_time > 0:
+            self._ping[name] = ping_time
+            heap = self._ping_heaps.get(bpc)
+            if heap is None:
+                heap = self._ping_heaps[bpc] = []
+                insort(self._ping_bpcs, bpc)
+            heapq.heappush(heap, (ping_time, name))
+            self._heap_entries += 1
+            if self._heap_entries > 2 * len(self._ping) + 64:
+                # Drop entries superseded by later updates
+                self._rebuild_heaps()
+
+    def _rebuild_heaps(self):
+        self._ping_heaps = {}
+        for name, ping_time in self._ping.items():
+            self._ping_heaps.setdefault(self._bpc[name], []).append((ping_time, name))
+        for heap in self._ping_heaps.values():
+            heapq.heapify(heap)
+        self._ping_bpcs = sorted(self._ping_heaps)
+        self._heap_entries = len(self._ping)
+
+    def _inactive_at_threshold(self) -> int:
+        """Inactive IOCs with BPC >= threshold / BPC >= 임계값인 비활성 IOC 수"""
+        bpcs = self._inactive_bpcs
+        return sum(self._inactive_counts[bpc] for bpc in bpcs[bisect_left(bpcs, self._threshold):])
+
+    def _oldest_ping(self) -> Optional[Tuple[int, str]]:
+        """Oldest ping among active IOCs with BPC >= threshold / BPC >= 임계값인 활성 IOC 중 가장 오래된 ping"""
+        oldest = None
+        bpcs = self._ping_bpcs
+        for bpc in bpcs[bisect_left(bpcs, self._threshold):]:
+            heap = self._ping_heaps[bpc]
+            while heap:
+                ping_time, name = heap[0]
+                if self._ping.get(name) == ping_time and self._bpc[name] == bpc:
+                    break
+                heapq.heappop(heap)
+                self._heap_entries -= 1
+            if not heap:
+                del self._ping_heaps[bpc]
+                bpcs.remove(bpc)
+            elif oldest is None or heap[0] < oldest:
+                oldest = heap[0]
+        return oldest
+
+    def evaluate(self, now: Optional[float] = None) -> Tuple[int, Optional[float]]:
+        """
+        Compute READY / READY 계산
+
+        Returns:
+            Tuple: (READY value, time of the next staleness deadline or None) / (READY 값, 다음 기한)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            deadline = None
+            if self._inactive_bpcs and self._inactive_bpcs[-1] >= self._threshold:
+                ready, reason = 0, f"{self._inactive_at_threshold()} inactive IOC(s) with BPC >= {self._threshold}"
+            else:
+                oldest = self._oldest_ping()
+                if oldest is not None and now - oldest[0] > self.stale_after:
+                    ready, reason = 0, f"{oldest[1]} (BPC={self._bpc[oldest[1]]}) last seen {now - oldest[0]:.0f}s ago"
+                else:
+                    ready, reason = 1, f"no inactive IOCs with BPC >= {self._threshold}"
+                    if oldest is not None:
+                        deadline = oldest[0] + self.stale_after
+
+            self.ready = ready
+            self.reason = reason
+            self.evaluations += 1
+            self.last_evaluation = now
+        return ready, deadline
+
+    def _run(self):
+        while self._running:
+            self._wakeup.clear()
+            try:
+                ready, deadline = self.evaluate()
+                if self.debug_log:
+                    print(f"[PV SERVICE] READY={ready}: {self.reason}")
+                self.write_ready(ready)
+            except Exception as e:
+                print(f"[ERROR] Readiness evaluation failed: {e}")
+                deadline = time.time() + 1.0
+
+            # Sleep until something changes or the oldest ping goes stale
+            timeout = None if deadline is None else max(deadline - time.time(), 0.0) + 0.01
+            self._wakeup.wait(timeout)
+
+    def get_status(self) -> Dict:
+        """Engine state for the status API / 상태 API용 엔진 상태"""
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "reason": self.reason,
+                "threshold": self._threshold,
+                "inactive_iocs_at_threshold": self._inactive_at_threshold(),
+                "evaluations": self.evaluations,
+                "last_evaluation": self.last_evaluation
+            }
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Status Rollups
+상태 집계
+Per-group, per-location and per-host IOC status counts kept up to date from state transitions
+상태 전이로 갱신되는 그룹별, 위치별, 호스트별 IOC 상태 집계
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+# Rollup dimension → IOC record field / 집계 차원 → IOC 레코드 필드
+DIMENSIONS = {
+    "group": "GROUP",
+    "location": "LOCATION",
+    "host": "ip_address",
+}
+
+COUNTERS = ("total", "online", "offline", "suspect", "error", "masked")
+
+
+def status_bucket(status: Optional[str]) -> str:
+    """Map an IOC status to its rollup counter / IOC 상태를 집계 카운터로 변환"""
+    if status == "ONLINE":
+        return "online"
+    if status == "OFFLINE":
+        return "offline"
+    if status == "SUSPECT":
+        return "suspect"
+    return "error"
+
+
+class StatusRollups:
+    """Incrementally maintained status counts / 증분 갱신되는 상태 집계
+
+    Each IOC contributes to one bucket per dimension. An update only moves
+    that IOC's contribution when its status, mask or grouping changed, so
+    the cost is proportional to the number of transitions, not IOCs.
+    """
+
+    def __init__(self):
+        """Initialize empty rollups / 빈 집계 초기화"""
+        self._keys: Dict[str, Tuple] = {}  # IOC name → (bucket, masked, dimension values...)
+        self._global = dict.fromkeys(COUNTERS, 0)
+        self._rollups: Dict[str, Dict[str, Dict[str, int]]] = {dimension: {} for dimension in DIMENSIONS}
+        self._lock = threading.Lock()
+
+    def update(self, ioc_name: str, info: Dict, masked: bool):
+        """
+        Apply an IOC's current state / IOC의 현재 상태 반영
+
+        Args:
+            ioc_name: IOC name / IOC 이름
+            info: IOC record / IOC 레코드
+            masked: Whether the IOC is masked / 마스크 여부
+        """
+        key = (status_bucket(info.get("status")), masked) + tuple(
+            str(info.get(field, "N/A")) for field in DIMENSIONS.values())
+        with self._lock:
+            old = self._keys.get(ioc_name)
+            if old == key:
+                return
+            if old is not None:
+                self._apply(old, -1)
+            self._keys[ioc_name] = key
+            self._apply(key, 1)
+
+    def remove(self, ioc_name: str):
+        """Drop a removed IOC / 삭제된 IOC 제거"""
+        with self._lock:
+            old = self._keys.pop(ioc_name, None)
+            if old is not None:
+                self._apply(old, -1)
+
+    def _apply(self, key: Tuple, delta: int):
+        bucket, masked = key[0], key[1]
+        targets = [self._global]
+        for dimension, value in zip(DIMENSIONS, key[2:]):
+            counts = self._rollups[dimension].get(value)
+            if counts is None:
+                counts = self._rollups[dimension][value] = dict.fromkeys(COUNTERS, 0)
+            targets.append(counts)
+        for counts in targets:
+            counts["total"] += delta
+            counts[bucket] += delta
+            if masked:
+                counts["masked"] += delta
+        # Forget buckets that became empty
+        for dimension, value in zip(DIMENSIONS, key[2:]):
+            if self._rollups[dimension][value]["total"] == 0:
+                del self._rollups[dimension][value]
+
+    def totals(self) -> Dict[str, int]:
+        """Get global counts / 전체 집계 조회"""
+        with self._lock:
+            return dict(self._global)
+
+    def snapshot(self) -> Dict:
+        """
+        Get all rollups / 모든 집계 조회
+
+        Returns:
+            Dict: {"global": counts, "group": {value: counts}, "location": {...}, "host": {...}}
+        """
+        with self._lock:
+            result = {"global": dict(self._global)}
+            for dimension, rollup in self._rollups.items():
+                result[dimension] = {value: dict(counts) for value, counts in rollup.items()}
+            return result
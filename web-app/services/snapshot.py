@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Snapshot Publisher
+스냅샷 발행기
+Versioned, pre-encoded JSON views of the IOC table
+버전이 있는 사전 인코딩 JSON IOC 테이블 뷰
+"""
+
+import hashlib
+import json
+import queue
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from services.ioc_record import as_dict
+
+
+# Named field sets for ?fields= / ?fields=용 이름 있는 필드 집합
+PROJECTIONS = {
+    # Columns of the dashboard IOC table / 대시보드 IOC 테이블 컬럼
+    "dashboard": ("name", "status", "overall_status", "ip_address", "ENGINEER", "LOCATION", "PURPOSE",
+                  "BPC", "incarnation", "last_seen", "uptime", "message", "masked"),
+}
+
+
+def parse_field_list(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated field list, expanding named projections / 쉼표로 구분된 필드 목록 파싱 (이름 있는 집합 확장)
+
+    Args:
+        value: e.g. "name,status,ip_address" or "dashboard" / 필드 목록
+
+    Returns:
+        Optional[Tuple[str, ...]]: Field names or None if not given / 필드 이름들 또는 None
+    """
+    if value is None:
+        return None
+    fields = []
+    for field in value.split(","):
+        field = field.strip()
+        if field:
+            fields.extend(PROJECTIONS.get(field, (field,)))
+    return tuple(dict.fromkeys(fields))
+
+
+def project(record: Dict, fields: Optional[Tuple[str, ...]] = None,
+            exclude: Optional[Tuple[str, ...]] = None) -> Dict:
+    """
+    Keep only the requested fields of a record / 레코드에서 요청한 필드만 남기기
+
+    Args:
+        record: IOC record / IOC 레코드
+        fields: Fields to keep, all if None / 남길 필드 (None이면 전체)
+        exclude: Fields to drop / 제외할 필드
+
+    Returns:
+        Dict: Projected record / 투영된 레코드
+    """
+    if fields is not None:
+        projected = {field: record[field] for field in fields if field in record}
+    else:
+        projected = as_dict(record)
+    for field in exclude or ():
+        projected.pop(field, None)
+    return projected
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    Encode a value the way the API serializes JSON / API와 같은 방식으로 JSON 인코딩
+
+    Args:
+        value: JSON-compatible value / JSON 호환 값
+
+    Returns:
+        bytes: Compact UTF-8 JSON / 압축된 UTF-8 JSON
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    # IOCRecord → its dict shape, anything else → str() as before
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+class EncodedSnapshot:
+    """One pre-encoded response body / 사전 인코딩된 응답 본문 하나"""
+
+    __slots__ = ("name", "version", "body", "etag")
+
+    def __init__(self, name: str, version: int, body: bytes):
+        self.name = name
+        self.version = version
+        self.body = body
+        # Content hash, so an unchanged view keeps its ETag across versions
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class IOCTableSnapshot:
+    """Immutable IOC table at one version / 한 버전의 불변 IOC 테이블
+
+    Swapped as a whole on publish, so readers take no lock and make no
+    copy. The records themselves are shared and must not be modified.
+    """
+
+    __slots__ = ("version", "details", "masked", "index", "bpc")
+
+    def __init__(self, version: int, details: Dict[str, Dict], masked: FrozenSet[str], index: Any,
+                 bpc: Dict[str, int]):
+        """
+        Args:
+            version: Snapshot version / 스냅샷 버전
+            details: IOC name → info, owned by the snapshot from now on / IOC 이름 → 정보
+            masked: Masked IOC names / 마스크된 IOC 이름
+            index: IOCIndex over the same records / 같은 레코드에 대한 IOCIndex
+            bpc: IOC name → numeric BPC / IOC 이름 → 숫자 BPC
+        """
+        self.version = version
+        self.details: Mapping[str, Dict] = MappingProxyType(details)
+        self.masked = masked
+        self.index = index
+        self.bpc: Mapping[str, int] = MappingProxyType(bpc)
+
+
+class SnapshotPublisher:
+    """Builds and swaps the set of encoded views / 인코딩된 뷰 집합을 만들고 교체
+
+    Views are encoded once per publish; readers get the current
+    EncodedSnapshot objects without locking or copying.
+    """
+
+    def __init__(self):
+        """Initialize publisher / 발행기 초기화"""
+        self.version = 0
+        self._snapshots: Dict[str, EncodedSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, views: Dict[str, Any]) -> int:
+        """
+        Encode views and make them current / 뷰를 인코딩하여 현재 스냅샷으로 교체
+
+        Args:
+            views: View name → JSON-compatible value / 뷰 이름 → JSON 호환 값
+
+        Returns:
+            int: New snapshot version / 새 스냅샷 버전
+        """
+        with self._lock:
+            version = self.version + 1
+            previous = self._snapshots
+            snapshots = {}
+            for name, value in views.items():
+                body = encode_json(value)
+                old = previous.get(name)
+                if old is not None and old.body == body:
+                    snapshots[name] = old
+                else:
+                    snapshots[name] = EncodedSnapshot(name, version, body)
+            self._snapshots = snapshots
+            self.version = version
+            return version
+
+    def get(self, name: str) -> Optional[EncodedSnapshot]:
+        """Get the current encoded view / 현재 인코딩된 뷰 조회"""
+        return self._snapshots.get(name)
+
+
+def diff_details(old: Dict[str, Dict], new: Dict[str, Dict]) -> Tuple[Dict[str, Dict], List[str]]:
+    """
+    Compare two IOC tables / 두 IOC 테이블 비교
+
+    Args:
+        old: Previous IOC name → info / 이전 IOC 이름 → 정보
+        new: Current IOC name → info / 현재 IOC 이름 → 정보
+
+    Returns:
+        Tuple: (added or changed IOCs, removed IOC names) / (추가 또는 변경된 IOC, 삭제된 IOC 이름)
+    """
+    changed = {}
+    for name, info in new.items():
+        previous = old.get(name)
+        if previous is not info and previous != info:
+            changed[name] = info
+    removed = [name for name in old if name not in new]
+    return changed, removed
+
+
+def format_sse(event: str, data: bytes, event_id: Optional[int] = None) -> bytes:
+    """
+    Format one Server-Sent Events message / Server-Sent Events 메시지 하나 구성
+
+    Args:
+        event: Event name / 이벤트 이름
+        data: Single-line payload, e.g. encode_json() output / 한 줄 페이로드
+        event_id: Optional id field / 선택적 id 필드
+
+    Returns:
+        bytes: Encoded message / 인코딩된 메시지
+    """
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: ".encode("utf-8") + data + b"\n\n"
+
+
+class StreamClient:
+    """One connected stream client / 연결된 스트림 클라이언트 하나"""
+
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self, max_pending: int):
+        self.queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self.dropped = False
+
+
+class StreamBroadcaster:
+    """Fans encoded messages out to stream clients / 인코딩된 메시지를 스트림 클라이언트에 전달
+
+    Each client has a bounded queue. A client that falls that far behind is
+    dropped rather than slowing the publisher; it reconnects and starts over
+    from a full snapshot. Every client holds a server worker thread for as
+    long as it stays connected, so the number of clients is capped.
+    """
+
+    def __init__(self, max_pending: int = 64, max_clients: int = 8):
+        """
+        Initialize broadcaster / 브로드캐스터 초기화
+
+        Args:
+            max_pending: Messages queued per client before it is dropped / 클라이언트가 끊기기 전 대기 가능한 메시지 수
+            max_clients: Concurrent clients accepted / 동시에 허용하는 클라이언트 수
+        """
+        self.max_pending = max_pending
+        self.max_clients = max_clients
+        self._clients: Set[StreamClient] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> Optional[StreamClient]:
+        """Register a client; None when max_clients are connected / 클라이언트 등록 (최대 수 도달 시 None)"""
+        client = StreamClient(self.max_pending)
+        with self._lock:
+            if len(self._clients) >= self.max_clients:
+                return None
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: StreamClient):
+        """Remove a client / 클라이언트 제거"""
+        with self._lock:
+            self._clients.discard(client)
+
+    def client_count(self) -> int:
+        """Number of connected clients / 연결된 클라이언트 수"""
+        return len(self._clients)
+
+    def broadcast(self, message: bytes):
+        """Queue a message for every client / 모든 클라이언트에 메시지 전달"""
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.queue.put_nowait(message)
+            except queue.Full:
+                client.dropped = True
+                self.unsubscribe(client)
@@ -6,9 +6,13 @@ Common utility functions used throughout the application
 애플리케이션 전체에서 사용되는 공통 유틸리티 함수들
 """
 
+import os
 import time
 import pandas as pd
-from typing import Any, Optional
+from itertools import islice
+from typing import Any, Iterator, List, Optional
+
+FILE_BLOCK_SIZE = 64 * 1024  # bytes per block for streaming and reverse reads
 
 def safe_str(val: Any) -> str:
     """
@@ -189,4 +193,84 @@ def is_valid_ip(ip: str) -> bool:
         return False
     
     parts = ip.split('.')
-    return all(0 <= int(part) <= 255 for part in parts) 
\ No newline at end of file
+    return all(0 <= int(part) <= 255 for part in parts) 
+
+def iter_file_blocks(path: str, size: Optional[int] = None,
+                     block_size: int = FILE_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file in fixed-size blocks / 파일을 고정 크기 블록 단위로 읽기
+    
+    Args:
+        path: File path / 파일 경로
+        size: Stop after this many bytes, e.g. the size seen when a response started / 읽을 최대 바이트 수
+        block_size: Bytes per block / 블록 크기
+        
+    Yields:
+        bytes: File blocks / 파일 블록
+    """
+    remaining = size
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            block = f.read(block_size if remaining is None else min(block_size, remaining))
+            if not block:
+                return
+            if remaining is not None:
+                remaining -= len(block)
+            yield block
+
+def iter_lines_reverse(path: str, block_size: int = FILE_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Iterate over a text file's lines from last to first / 텍스트 파일의 라인을 마지막부터 역순으로 순회
+    
+    Reads fixed-size blocks backwards from the end, so the latest lines are
+    available without loading the whole file.
+    
+    Args:
+        path: File path / 파일 경로
+        block_size: Bytes per block / 블록 크기
+        
+    Yields:
+        str: Lines including the trailing newline, newest first / 줄바꿈을 포함한 라인 (최신 순)
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        if pos == 0:
+            return
+        head = b""
+        at_end = True
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + head).split(b"\n")
+            # The first piece may continue in the previous block / 첫 조각은 이전 블록에 이어질 수 있음
+            head = lines.pop(0)
+            if at_end and lines:
+                last = lines.pop()
+                if last:
+                    # No newline at end of file / 파일 끝에 줄바꿈 없음
+                    yield last.decode("utf-8", "replace")
+                at_end = False
+            for line in reversed(lines):
+                yield line.decode("utf-8", "replace") + "\n"
+        if at_end:
+            # Single line without a newline / 줄바꿈이 없는 한 줄
+            yield head.decode("utf-8", "replace")
+        else:
+            yield head.decode("utf-8", "replace") + "\n"
+
+def read_last_lines(path: str, count: int, offset: int = 0) -> List[str]:
+    """
+    Read the last lines of a text file / 텍스트 파일의 마지막 라인들 읽기
+    
+    Args:
+        path: File path / 파일 경로
+        count: Number of lines / 라인 수
+        offset: Newest lines to skip first, for paging backwards / 먼저 건너뛸 최신 라인 수 (이전 페이지 조회용)
+        
+    Returns:
+        List[str]: Lines in file order / 파일 순서의 라인들
+    """
+    lines = list(islice(iter_lines_reverse(path), offset, offset + max(count, 0)))
+    lines.reverse()
+    return lines